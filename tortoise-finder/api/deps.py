@@ -1,11 +1,32 @@
 # Dependencies for the API
-from fastapi import Depends
-from redis import Redis
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from redis import ConnectionPool, Redis
+from redis.asyncio import ConnectionPool as AsyncConnectionPool, Redis as AsyncRedis
 from rq import Queue
 import os
 
-def get_redis() -> Redis:
-    return Redis.from_url(os.environ["REDIS_URL"])
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_POOL", "50"))
 
-def get_queue(redis: Redis = Depends(get_redis)) -> Queue:
-    return Queue(os.environ.get("RQ_QUEUE", "tortoise"), connection=redis)
+# Sync pool for RQ (which is sync-only), built once per process
+_POOL = ConnectionPool.from_url(os.environ["REDIS_URL"], max_connections=REDIS_MAX_CONNECTIONS)
+_QUEUE = Queue(os.environ.get("RQ_QUEUE", "tortoise"), connection=Redis(connection_pool=_POOL))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Async pool for our own Redis calls; it must be bound to the running loop
+    app.state.redis_pool = AsyncConnectionPool.from_url(os.environ["REDIS_URL"], max_connections=REDIS_MAX_CONNECTIONS)
+    try:
+        yield
+    finally:
+        await app.state.redis_pool.disconnect()
+        _POOL.disconnect()
+
+async def get_redis(request: Request) -> AsyncRedis:
+    return AsyncRedis(connection_pool=request.app.state.redis_pool)
+
+def get_sync_redis() -> Redis:
+    return Redis(connection_pool=_POOL)
+
+def get_queue() -> Queue:
+    return _QUEUE
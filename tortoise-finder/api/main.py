@@ -1,58 +1,207 @@
 import os
 import json
-from fastapi import FastAPI, Query, Depends
+import time
+import hashlib
+import asyncio
+from fastapi import FastAPI, Query, Depends, Header, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from rq import Queue
+from rq.job import Job
 from api.schemas import *
-from api.deps import get_redis, get_queue
+from api.deps import lifespan, get_redis, get_sync_redis, get_queue
 from storage.paths import results_key, geojson_key
-from storage.io import get_url
-from pipeline.run import run_inference_job
-from pipeline.export import export_results
-from pipeline.utils import read_results_table
+from storage.io import client, put_bytes
+from minio.error import S3Error
+from pipeline.run import run_inference_job, progress_channel, progress_key, tiles_stream
+from pipeline.export import export_job, iter_geojson
+from pipeline.utils import get_cached_results
 
-app = FastAPI(title="tortoise-finder API")
+ARTIFACT_BUCKET = os.getenv("ARTIFACT_BUCKET")
+
+app = FastAPI(title="tortoise-finder API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 @app.post("/run", response_model=RunResponse)
-def run(req: RunRequest, queue: Queue = Depends(get_queue)):
-    job = queue.enqueue(run_inference_job, req.dataset_uri, req.model_version, req.threshold)
+async def run(req: RunRequest, queue: Queue = Depends(get_queue)):
+    job = await asyncio.to_thread(queue.enqueue, run_inference_job, req.dataset_uri, req.model_version, req.threshold)
     return RunResponse(job_id=job.id, run_id=job.id)
 
-@app.get("/status/{job_id}", response_model=StatusResponse)
-def status(job_id: str, redis: Redis = Depends(get_redis)):
-    from rq.job import Job
-    job = Job.fetch(job_id, connection=redis)
+TERMINAL_STATES = {"finished", "failed", "stopped", "canceled"}
+STATUS_STREAM_IDLE_S = 15.0
+
+# A progress hash older than this may belong to a worker that died mid-run
+PROGRESS_STALE_S = 2 * STATUS_STREAM_IDLE_S
+
+async def _job_status(job_id: str, redis: AsyncRedis, sync_redis: Redis) -> StatusResponse:
+    # Fast path: the worker's progress hash, a few bytes in one HMGET
+    pct, eta, state, ts, result_url = await redis.hmget(progress_key(job_id), "pct", "eta", "state", "ts", "result_url")
+    if state is not None and state.decode() not in TERMINAL_STATES and time.time() - float(ts) < PROGRESS_STALE_S:
+        return StatusResponse(state=state.decode(), progress_pct=float(pct), eta_s=int(eta) if eta else None,
+                              result_url=result_url.decode() if result_url else None)
+    # Queued, finished, or gone quiet: ask RQ for the authoritative job record
+    if not await redis.exists(Job.key_for(job_id)):
+        raise HTTPException(status_code=404, detail=f"job {job_id} not found")
+    job = await asyncio.to_thread(Job.fetch, job_id, connection=sync_redis)
     meta = job.meta or {}
     state = job.get_status()
-    return StatusResponse(state=state, progress_pct=meta.get("progress", 0), eta_s=meta.get("eta"))
+    return StatusResponse(state=state, progress_pct=meta.get("progress", 0), eta_s=meta.get("eta"),
+                          result_url=meta.get("result_url"))
+
+@app.get("/status/{job_id}", response_model=StatusResponse)
+async def status(job_id: str, redis: AsyncRedis = Depends(get_redis), sync_redis: Redis = Depends(get_sync_redis)):
+    return await _job_status(job_id, redis, sync_redis)
+
+@app.post("/status/batch", response_model=List[JobStatus])
+async def status_batch(ids: List[str], sync_redis: Redis = Depends(get_sync_redis)):
+    """Statuses for several jobs in one pipelined round trip; unknown ids come back as not_found."""
+    jobs = await asyncio.to_thread(Job.fetch_many, ids, connection=sync_redis)
+    out = []
+    for job_id, job in zip(ids, jobs):
+        if job is None:
+            out.append(JobStatus(job_id=job_id, state="not_found", progress_pct=0))
+            continue
+        meta = job.meta or {}
+        # The status was loaded with the job hash; don't refresh it per job
+        out.append(JobStatus(job_id=job_id, state=job.get_status(refresh=False),
+                             progress_pct=meta.get("progress", 0), eta_s=meta.get("eta"),
+                             result_url=meta.get("result_url")))
+    return out
+
+@app.get("/status/{job_id}/stream")
+async def status_stream(job_id: str, redis: AsyncRedis = Depends(get_redis), sync_redis: Redis = Depends(get_sync_redis)):
+    """Server-sent events carrying the worker's progress updates until the job ends."""
+    # Resolve the first snapshot up front so an unknown job is a plain 404
+    first = await _job_status(job_id, redis, sync_redis)
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(progress_channel(job_id))
+
+    async def events():
+        try:
+            # The snapshot covers updates published before we subscribed
+            yield f"data: {first.model_dump_json()}\n\n"
+            if first.state in TERMINAL_STATES:
+                return
+            while True:
+                msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=STATUS_STREAM_IDLE_S)
+                if msg is None:
+                    # Quiet channel: re-check in case the worker died without publishing
+                    snapshot = await _job_status(job_id, redis, sync_redis)
+                    yield f"data: {snapshot.model_dump_json()}\n\n"
+                    if snapshot.state in TERMINAL_STATES:
+                        return
+                    continue
+                data = msg["data"].decode()
+                yield f"data: {data}\n\n"
+                if json.loads(data).get("state") in TERMINAL_STATES:
+                    return
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+EVENTS_BLOCK_MS = 30_000
+
+@app.get("/events/{run_id}")
+async def run_events(run_id: str, last_event_id: str | None = Header(None), redis: AsyncRedis = Depends(get_redis),
+                     sync_redis: Redis = Depends(get_sync_redis)):
+    """
+    Server-sent events for a run: `tile` events for each positive as it is
+    scored and `progress` events, replayed from the start (or from the
+    Last-Event-ID a reconnecting client sends) and then tailed live.
+    """
+    await _job_status(run_id, redis, sync_redis)  # 404 for unknown runs
+    key = tiles_stream(run_id)
+
+    async def events():
+        last_id = last_event_id or "0-0"
+        while True:
+            resp = await redis.xread({key: last_id}, count=500, block=EVENTS_BLOCK_MS)
+            if not resp:
+                # Nothing for a while: stop if the worker is gone, else keep the connection warm
+                snapshot = await _job_status(run_id, redis, sync_redis)
+                if snapshot.state in TERMINAL_STATES:
+                    yield f"event: progress\ndata: {snapshot.model_dump_json()}\n\n"
+                    return
+                yield ": keepalive\n\n"
+                continue
+            for entry_id, fields in resp[0][1]:
+                last_id = entry_id.decode()
+                event, data = fields[b"event"].decode(), fields[b"data"].decode()
+                yield f"id: {last_id}\nevent: {event}\ndata: {data}\n\n"
+                if event == "progress" and json.loads(data)["state"] in TERMINAL_STATES:
+                    return
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+POSITIVE_COLUMNS = ("tile_id", "image_url", "thumb_url", "lat", "lon", "score")
+
+def _positives_page(run_id: str, threshold: float, page: int, page_size: int) -> dict:
+    # Project to the page columns at the parquet layer; the score filter stays
+    # in memory so one cached table serves every threshold the slider visits
+    df = get_cached_results(run_id, POSITIVE_COLUMNS)
+    mask = df.score.values >= threshold
+    total = int(mask.sum())
+    # Only the rows up to the end of the requested page need ordering
+    start = (page-1)*page_size
+    top = df[mask].nlargest(start + page_size, "score").iloc[start:]
+    recs = top[list(POSITIVE_COLUMNS)].to_dict(orient="records")
+    # One batch validation for the page, then hand the plain dicts to orjson
+    # instead of serializing model instances back out through pydantic
+    POSITIVE_LIST_ADAPTER.validate_python(recs)
+    return {"items": recs, "total": total}
+
+POSITIVES_CACHE_CONTROL = "public, max-age=300"
+
+def _positives_response(run_id: str, threshold: float, page: int, page_size: int, if_none_match: str | None) -> Response:
+    # Results are immutable once written, so a page is fully determined by its
+    # query plus the table's row count; repeat requests can be answered with 304
+    rows = len(get_cached_results(run_id, POSITIVE_COLUMNS))
+    digest = hashlib.blake2b(f"{run_id}:{threshold}:{page}:{page_size}:{rows}".encode(), digest_size=16).hexdigest()
+    headers = {"ETag": f'"{digest}"', "Cache-Control": POSITIVES_CACHE_CONTROL}
+    if if_none_match == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(_positives_page(run_id, threshold, page, page_size), headers=headers)
 
 @app.get("/positives", response_model=Page)
-def positives(run_id: str, threshold: float = 0.8, page: int = 1, page_size: int = 40):
-    df = read_results_table(run_id)
-    df = df[df.score >= threshold]
-    total = len(df)
-    df = df.sort_values("score", ascending=False).iloc[(page-1)*page_size: page*page_size]
-    items = []
-    for _, r in df.iterrows():
-        items.append(PositiveItem(
-            tile_id=r.tile_id, image_url=r.image_url, thumb_url=r.thumb_url,
-            lat=float(r.lat), lon=float(r.lon), score=float(r.score)
-        ))
-    return Page(items=items, total=total)
+async def positives(request: Request, run_id: str, threshold: float = 0.8, page: int = 1, page_size: int = 40):
+    # Parquet read + pandas work is CPU/IO bound; keep it off the event loop
+    return await asyncio.to_thread(_positives_response, run_id, threshold, page, page_size,
+                                   request.headers.get("if-none-match"))
 
 @app.post("/confirm")
-def confirm(req: ConfirmRequest):
-    # MVP: write confirmations into a sidecar JSON
-    from storage.io import put_bytes
+async def confirm(request: Request):
+    # MVP: write confirmations into a sidecar JSON. The body is validated
+    # straight from bytes and then stored as-is, with no dump/dumps round trip.
+    data = await request.body()
+    try:
+        req = ConfirmRequest.model_validate_json(data)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
     key = f"runs/{req.run_id}/confirmations.json"
-    data = json.dumps(req.model_dump(), indent=2).encode()
-    from os import getenv
-    put_bytes(getenv("ARTIFACT_BUCKET"), key, data, "application/json")
+    await asyncio.to_thread(put_bytes, ARTIFACT_BUCKET, key, data, "application/json")
     return {"ok": True}
 
 @app.get("/export")
-def export(run_id: str, fmt: str = "geojson"):
-    key = export_results(run_id, fmt)
-    from os import getenv
-    url = get_url(getenv("ARTIFACT_BUCKET"), key)
-    return {"url": url}
+async def export(run_id: str, fmt: str = "geojson", queue: Queue = Depends(get_queue)):
+    # Large exports take seconds; build them on a worker and let the caller
+    # follow /status/{job_id} until result_url shows up
+    job = await asyncio.to_thread(queue.enqueue, export_job, run_id, fmt)
+    return {"job_id": job.id}
+
+@app.get("/export/stream")
+def export_stream(run_id: str):
+    """GeoJSON download streamed straight from the results parquet, no staged file or presigned URL."""
+    # Headers go out with the first chunk, so check the run exists while we can still 404
+    try:
+        client().stat_object(ARTIFACT_BUCKET, results_key(run_id))
+    except S3Error:
+        raise HTTPException(status_code=404, detail=f"run {run_id} not found")
+    return StreamingResponse(
+        iter_geojson(run_id),
+        media_type="application/geo+json",
+        headers={"Content-Disposition": f'attachment; filename="{run_id}-positives.geojson"'},
+    )
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import List, Optional
+from typing_extensions import TypedDict
 
 class RunRequest(BaseModel):
     dataset_uri: str
@@ -14,6 +15,10 @@ class StatusResponse(BaseModel):
     state: str
     progress_pct: float
     eta_s: int | None = None
+    result_url: str | None = None  # set by export jobs once the file is ready
+
+class JobStatus(StatusResponse):
+    job_id: str
 
 class PositiveItem(BaseModel):
     tile_id: str
@@ -23,13 +28,24 @@ class PositiveItem(BaseModel):
     lon: float
     score: float
 
+# Built once: validates a whole page of row dicts in a single pydantic-core call
+POSITIVE_LIST_ADAPTER = TypeAdapter(List[PositiveItem])
+
 class Page(BaseModel):
     items: List[PositiveItem]
     total: int
 
+# /confirm stores the request body verbatim, so it must already be exactly
+# this shape: no coercion ("yes" -> True) and no unknown keys
+class Selection(TypedDict):
+    __pydantic_config__ = ConfigDict(strict=True, extra="forbid")
+    tile_id: str
+    confirmed: bool
+
 class ConfirmRequest(BaseModel):
+    model_config = ConfigDict(strict=True, extra="forbid")
     run_id: str
-    selections: List[dict]  # {tile_id:str, confirmed:bool}
+    selections: List[Selection]
 
 class ExportFormat(str):
     pass  # 'geojson' | 'csv' | 'gpx' | 'kml'
@@ -1,34 +1,133 @@
 import os
+import atexit
 import gradio as gr
-import requests
-import math
+import httpx
+import itertools
+import json
 
 API = os.environ.get("API_URL", "http://api:8000")
+# One pooled client so status/paging calls reuse keep-alive connections
+_HTTP = httpx.Client(base_url=API, timeout=30.0, limits=httpx.Limits(max_keepalive_connections=20))
+atexit.register(_HTTP.close)
 
 def start_run(dataset_uri, threshold):
-    r = requests.post(f"{API}/run", json={"dataset_uri": dataset_uri, "threshold": threshold})
+    r = _HTTP.post("/run", json={"dataset_uri": dataset_uri, "threshold": threshold})
     r.raise_for_status()
     data = r.json()
     return data["run_id"], gr.update(visible=True)
 
 def poll_status(run_id):
-    r = requests.get(f"{API}/status/{run_id}")
+    r = _HTTP.get(f"/status/{run_id}")
     r.raise_for_status()
     s = r.json()
     return f'{s["state"]} — {s["progress_pct"]:.1f}%'
 
-def fetch_page(run_id, threshold, page, page_size):
-    r = requests.get(f"{API}/positives", params={"run_id": run_id, "threshold": threshold, "page": page, "page_size": page_size})
+TERMINAL_STATES = {"finished", "failed", "stopped", "canceled"}
+
+def _status_events(job_id):
+    """Status dicts from /status/{id}/stream as the worker publishes them."""
+    try:
+        with _HTTP.stream("GET", f"/status/{job_id}/stream", timeout=httpx.Timeout(60.0, connect=5.0)) as r:
+            r.raise_for_status()
+            for line in r.iter_lines():
+                if line.startswith("data: "):
+                    yield json.loads(line[len("data: "):])
+    except httpx.HTTPError:
+        # Stream unavailable (e.g. behind a buffering proxy): fall back to one plain poll
+        r = _HTTP.get(f"/status/{job_id}")
+        r.raise_for_status()
+        yield r.json()
+
+def stream_status(run_id):
+    """Relay /status/{id}/stream SSE updates; Gradio pushes each yield to the browser."""
+    for s in _status_events(run_id):
+        yield f'{s["state"]} — {s["progress_pct"]:.1f}%'
+
+_PAGE_REQ = itertools.count(1)
+
+def stream_run(run_id):
+    """
+    Follow /events/{run_id}: progress ticks update the status box and tile
+    events grow the gallery, all over one connection.
+    """
+    status_text, items = "queued", []
+    try:
+        with _HTTP.stream("GET", f"/events/{run_id}", timeout=httpx.Timeout(60.0, connect=5.0)) as r:
+            r.raise_for_status()
+            event = None
+            for line in r.iter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: "):
+                    d = json.loads(line[len("data: "):])
+                    if event == "tile":
+                        items.append((d["thumb_url"], f'{d["tile_id"]} | {d["score"]:.3f} | {d["lat"]:.5f},{d["lon"]:.5f}'))
+                    else:
+                        # Tiles arrive in bursts just ahead of each tick, so render per tick
+                        status_text = f'{d["state"]} — {d["progress_pct"]:.1f}%'
+                        yield status_text, items
+    except httpx.HTTPError:
+        # No event stream: fall back to status only and leave paging to Refresh
+        for status_text in stream_status(run_id):
+            yield status_text, gr.update()
+
+def fetch_page(run_id, threshold, page, page_size, req_state):
+    # Slider releases and refresh clicks can overlap; tag each request and
+    # drop any response that a newer one from this session has superseded
+    req_id = req_state["latest"] = next(_PAGE_REQ)
+    r = _HTTP.get("/positives", params={"run_id": run_id, "threshold": threshold, "page": page, "page_size": page_size})
     r.raise_for_status()
+    if req_state["latest"] != req_id:
+        return gr.update(), gr.update()
     d = r.json()
     gallery = [(it["thumb_url"], f'{it["tile_id"]} | {it["score"]:.3f} | {it["lat"]:.5f},{it["lon"]:.5f}') for it in d["items"]]
-    pages = max(1, math.ceil(d["total"] / page_size))
+    pages = max(1, (d["total"] + page_size - 1) // page_size)
     return gallery, f"Total: {d['total']} | Page {page}/{pages}"
 
 def export_file(run_id, fmt):
-    r = requests.get(f"{API}/export", params={"run_id": run_id, "fmt": fmt})
+    # The export runs as a worker job; wait on its status stream for the URL
+    r = _HTTP.get("/export", params={"run_id": run_id, "fmt": fmt})
+    r.raise_for_status()
+    yield "Exporting…"
+    s = {"state": "queued"}
+    for s in _status_events(r.json()["job_id"]):
+        if s["state"] in TERMINAL_STATES:
+            break
+    yield s.get("result_url") or f"Export {s['state']}"
+
+def select_tile(evt: gr.SelectData):
+    # Captions are "tile_id | score | lat,lon" (see fetch_page)
+    return evt.value["caption"].split(" | ")[0]
+
+def _confirm(run_id, tile_id, confirmed):
+    if not (run_id and tile_id):
+        gr.Warning("Select a tile first")
+        return
+    r = _HTTP.post("/confirm", json={"run_id": run_id, "selections": [{"tile_id": tile_id, "confirmed": confirmed}]})
     r.raise_for_status()
-    return r.json()["url"]
+    gr.Info(f'{tile_id} {"confirmed" if confirmed else "rejected"}')
+
+def confirm_image(run_id, tile_id):
+    _confirm(run_id, tile_id, True)
+
+def reject_image(run_id, tile_id):
+    _confirm(run_id, tile_id, False)
+
+# Arrow keys step through the gallery thumbnails (ignored while typing in inputs)
+GALLERY_NAV_JS = """
+() => {
+    document.addEventListener('keydown', (event) => {
+        if (event.key !== 'ArrowRight' && event.key !== 'ArrowLeft') return;
+        if (event.target.closest('input, textarea')) return;
+        const thumbs = [...document.querySelectorAll('#positives-gallery .thumbnail-item')];
+        if (!thumbs.length) return;
+        const current = thumbs.findIndex((t) => t.classList.contains('selected'));
+        const step = event.key === 'ArrowRight' ? 1 : -1;
+        const next = current < 0 ? 0 : (current + step + thumbs.length) % thumbs.length;
+        thumbs[next].click();
+    });
+}
+"""
 
 with gr.Blocks(title="Tortoise Finder") as demo:
     gr.Markdown("## Tortoise Finder — MVP")
@@ -38,14 +137,13 @@ with gr.Blocks(title="Tortoise Finder") as demo:
         run_btn = gr.Button("Start Run")
     run_id = gr.Textbox(label="Run ID", interactive=False)
     status = gr.Textbox(label="Status", interactive=False)
-    status_timer = gr.Timer(1.5, active=False)
     review_panel = gr.Column(visible=False)
     with review_panel:
         with gr.Row():
             page = gr.Number(value=1, precision=0, label="Page")
             page_size = gr.Dropdown(choices=[20, 40, 80], value=40, label="Page size")
             refresh = gr.Button("Refresh")
-        gallery = gr.Gallery(label="Positives", columns=6, height=600, full_screen=True)
+        gallery = gr.Gallery(label="Positives", columns=6, height=600, full_screen=True, elem_id="positives-gallery")
         tally = gr.Markdown()
         with gr.Row():
             fmt = gr.Dropdown(choices=["geojson", "csv", "gpx", "kml"], value="geojson", label="Export format")
@@ -53,31 +151,24 @@ with gr.Blocks(title="Tortoise Finder") as demo:
             url = gr.Textbox(label="Download URL")
 
     # Ensure Detection Results are only shown in the Detection tab
-    run_btn.click(start_run, [dataset_uri, thr], [run_id, review_panel])
-    status_timer.tick(lambda rid: poll_status(rid), [run_id], [status])
-    run_btn.click(lambda: gr.update(active=True), None, status_timer)
-    refresh.click(fetch_page, [run_id, thr, page, page_size], [gallery, tally])
-    thr.release(fetch_page, [run_id, thr, page, page_size], [gallery, tally])
+    run_btn.click(start_run, [dataset_uri, thr], [run_id, review_panel]).then(stream_run, [run_id], [status, gallery])
+    page_req = gr.State({"latest": 0})
+    refresh.click(fetch_page, [run_id, thr, page, page_size, page_req], [gallery, tally])
+    # While a fetch is running, only the last of the queued releases is kept
+    thr.release(fetch_page, [run_id, thr, page, page_size, page_req], [gallery, tally],
+                trigger_mode="always_last", show_progress="minimal")
     export_btn.click(export_file, [run_id, fmt], [url])
 
-    # Add event listeners for confirm and reject buttons
+    # Track the tile picked in the gallery, then confirm/reject it
+    selected_tile = gr.State(None)
     confirm_btn = gr.Button("Confirm")
     reject_btn = gr.Button("Reject")
-    confirm_btn.click(lambda img_id: confirm_image(img_id), [gallery.selected], None)
-    reject_btn.click(lambda img_id: reject_image(img_id), [gallery.selected], None)
-
-    # JavaScript for rapid navigation and full-screen view
-    <script>
-        document.addEventListener('keydown', function(event) {
-            if (event.key === 'ArrowRight') {
-                // Navigate to next image
-                gallery.next();
-            } else if (event.key === 'ArrowLeft') {
-                // Navigate to previous image
-                gallery.prev();
-            }
-        });
-    </script>
+    gallery.select(select_tile, None, [selected_tile])
+    confirm_btn.click(confirm_image, [run_id, selected_tile], None)
+    reject_btn.click(reject_image, [run_id, selected_tile], None)
+
+    # Keyboard navigation, attached once per page load rather than per gallery render
+    demo.load(None, None, None, js=GALLERY_NAV_JS)
 
 if __name__ == "__main__":
     demo.launch(server_name="0.0.0.0", server_port=7860)
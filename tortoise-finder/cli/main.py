@@ -1,38 +1,62 @@
 import typer
-import requests
+import httpx
+import atexit
 import os
+import sys
 import json
+import time
+
+TERMINAL_STATES = {"finished", "failed", "stopped", "canceled"}
 
 app = typer.Typer()
 API = os.environ.get("API_URL", "http://localhost:8000")
+_HTTP = httpx.Client(base_url=API, timeout=30.0)
+atexit.register(_HTTP.close)
+
+def _print_body(r: httpx.Response):
+    # Pipes get the API's JSON bytes untouched; only a terminal gets the
+    # decode + indent round trip
+    if sys.stdout.isatty():
+        print(json.dumps(r.json(), indent=2))
+    else:
+        sys.stdout.write(r.text + "\n")
 
 @app.command()
 def run(dataset: str, threshold: float = 0.8):
     """Start a new inference run with the specified dataset."""
-    r = requests.post(f"{API}/run", json={"dataset_uri": dataset, "threshold": threshold})
+    r = _HTTP.post("/run", json={"dataset_uri": dataset, "threshold": threshold})
     r.raise_for_status()
-    print(json.dumps(r.json(), indent=2))
+    _print_body(r)
 
 @app.command()
 def status(job_id: str):
     """Check the status of a running job."""
-    r = requests.get(f"{API}/status/{job_id}")
+    r = _HTTP.get(f"/status/{job_id}")
     r.raise_for_status()
-    print(json.dumps(r.json(), indent=2))
+    _print_body(r)
 
 @app.command()
 def export(run_id: str, fmt: str = "geojson"):
     """Export results from a completed run."""
-    r = requests.get(f"{API}/export", params={"run_id": run_id, "fmt": fmt})
+    r = _HTTP.get("/export", params={"run_id": run_id, "fmt": fmt})
     r.raise_for_status()
-    print(json.dumps(r.json(), indent=2))
+    job_id = r.json()["job_id"]
+    # The export is built by a worker; poll until it leaves a result_url
+    while True:
+        r = _HTTP.get(f"/status/{job_id}")
+        r.raise_for_status()
+        s = r.json()
+        if s["state"] in TERMINAL_STATES:
+            break
+        time.sleep(1.0)
+    print(json.dumps({"job_id": job_id, **s}, indent=2))
 
 @app.command()
 def positives(run_id: str, threshold: float = 0.8, page: int = 1, page_size: int = 40):
     """List positive detections from a run."""
-    r = requests.get(f"{API}/positives", params={"run_id": run_id, "threshold": threshold, "page": page, "page_size": page_size})
+    r = _HTTP.get("/positives", params={"run_id": run_id, "threshold": threshold, "page": page, "page_size": page_size})
     r.raise_for_status()
-    print(json.dumps(r.json(), indent=2))
+    _print_body(r)
 
 if __name__ == "__main__":
     app()
@@ -5,24 +5,109 @@ No dependencies except Python standard library.
 """
 
 import http.server
-import socketserver
+import socket
+import base64
+import bisect
+import io
 import json
 import random
 import urllib.parse
 import os
-import glob
+import re
+import errno
+import gzip
+import hashlib
+import mmap
 import shutil
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 # Try to import PIL for EXIF processing, fallback gracefully
 try:
     from PIL import Image
-    from PIL.ExifTags import TAGS, GPSTAGS
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
     print("Warning: PIL/Pillow not available. EXIF GPS extraction disabled.")
 
+# Optional NumPy/Numba: vectorized DMS -> decimal conversion for whole directories
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional AOT-compiled DMS converter (build with tools/build_dms_aot.py)
+try:
+    from _dms_aot import dms_to_decimal as _dms_to_decimal_aot
+    DMS_AOT_AVAILABLE = True
+except ImportError:
+    DMS_AOT_AVAILABLE = False
+
+# Optional xxhash: fast 64-bit hash for the deterministic mock values
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional orjson: C JSON encoder for the API responses (numpy values included)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional brotli: smaller JSON bodies for browsers that accept br (gzip otherwise)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Optional Rust EXIF reader: parses a whole directory's worth of files in
+# parallel in one call. Falls back to the per-file path when missing.
+try:
+    import fast_exif_rs_py
+    FAST_EXIF_AVAILABLE = True
+except ImportError:
+    FAST_EXIF_AVAILABLE = False
+
+def dumps_json(obj):
+    """Encode a response body to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def loads_json(body):
+    """Decode a UTF-8 JSON request body, straight from bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+# Smaller bodies go out as-is; compressing them saves less than the header costs
+COMPRESS_MIN_BYTES = 1024
+
+def compress_body(body, accept_encoding):
+    """Return (body, content_encoding) using the best encoding the client accepts."""
+    if len(body) >= COMPRESS_MIN_BYTES:
+        if BROTLI_AVAILABLE and 'br' in accept_encoding:
+            return brotli.compress(body, quality=5), 'br'
+        if 'gzip' in accept_encoding:
+            # Level 1 keeps compression cheap next to the JSON encoding itself;
+            # repetitive JSON keys already shrink most of the way there
+            return gzip.compress(body, compresslevel=1), 'gzip'
+    return body, None
+
 # Dataset configuration
 BASE_DATA_PATH = os.environ.get(
     "DATA_ROOT",
@@ -36,8 +121,7 @@ NEGATIVE_PATH = os.path.join(BASE_DATA_PATH, "negative")
 
 def fallback_coordinates(filename):
     """Provide deterministic fallback coordinates when EXIF is missing."""
-    parts = filename.split('-')
-    camera_id = parts[0] if parts else "UNKNOWN"
+    camera_id = _FN_RE.match(filename).group(1)
 
     # Seed with full filename to avoid stacking; keep camera-based centroid
     rnd = random.Random(filename)
@@ -59,76 +143,423 @@ def fallback_coordinates(filename):
     lon = base_lon + rnd.uniform(-jitter, jitter)
     return lat, lon
 
-def get_local_images(dataset_path, limit=50):
-    """Get list of local training images with metadata."""
-    if not os.path.exists(dataset_path):
-        return []
-    
-    image_files = glob.glob(os.path.join(dataset_path, "*.jpg"))[:limit]
-    image_files += glob.glob(os.path.join(dataset_path, "*.jpeg"))[:limit]
-    image_files += glob.glob(os.path.join(dataset_path, "*.png"))[:limit]
-    results = []
-    
-    for i, image_path in enumerate(image_files):
-        filename = os.path.basename(image_path)
-        # Extract info from filename: B002T-20200709-165419_jpg.rf...
-        parts = filename.split('-')
-        camera_id = parts[0] if len(parts) > 0 else "Unknown"
-        date_str = parts[1] if len(parts) > 1 else "20200101"
-        time_str = parts[2].split('_')[0] if len(parts) > 2 else "000000"
-        
-        # Get GPS from EXIF if available
-        lat, lon = extract_gps_from_image(image_path)
-        
-        # If no GPS in EXIF, use mock coordinates based on camera ID
-        if lat is None or lon is None:
-            if camera_id == "B002T":
-                lat = -0.4 + random.uniform(-0.1, 0.1)
-                lon = -90.3 + random.uniform(-0.1, 0.1)
-            elif camera_id == "B004T":
-                lat = -0.6 + random.uniform(-0.1, 0.1)
-                lon = -90.5 + random.uniform(-0.1, 0.1)
-            else:
-                lat = -0.5 + random.uniform(-0.2, 0.2)
-                lon = -90.4 + random.uniform(-0.2, 0.2)
-        
-        results.append({
-            "tile_id": filename.replace('.jpg', ''),
-            "score": random.uniform(0.6, 0.95),  # Mock confidence score
+# camera-date-time prefix, e.g. B002T-20200709-165419_jpg.rf...; always matches,
+# with the date/time groups None when the name has fewer dash-separated parts
+_FN_RE = re.compile(r'([^-]*)(?:-([^-]*)(?:-([^-_]*))?)?')
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+IMAGE_CONTENT_TYPES = {'.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.png': 'image/png'}
+
+# dataset_path -> (directory st_mtime_ns, columns, {limit: view}). Adding,
+# confirming or rejecting an image bumps the directory mtime, which
+# invalidates the entry and every view of it.
+_DIR_CACHE = {}
+# Held while a directory is (re)scanned, so concurrent requests wait for one scan
+_DIR_CACHE_LOCK = threading.Lock()
+
+# Raw GPS readers return (lat_dms, lat_ref, lon_dms, lon_ref), NO_GPS when the
+# file has EXIF but no usable GPS block, or None when they can't parse the file
+NO_GPS = ()
+
+def _dms_from_exif_dict(exif):
+    """Raw GPS from one fast_exif_rs_py result."""
+    if not exif or 'GPSLatitude' not in exif or 'GPSLongitude' not in exif:
+        return NO_GPS
+    return (exif['GPSLatitude'], exif.get('GPSLatitudeRef', 'N'),
+            exif['GPSLongitude'], exif.get('GPSLongitudeRef', 'W'))
+
+def _dms_batch(d, m, s, neg):
+    out = d + m * (1 / 60) + s * (1 / 3600)
+    return np.where(neg, -out, out)
+
+if NUMBA_AVAILABLE:
+    _dms_batch = numba.njit(cache=True, fastmath=True)(_dms_batch)
+
+def gps_to_decimal_batch(raws):
+    """(lat, lon) for each raw GPS reading, converting all of them in one array pass."""
+    found = [i for i, raw in enumerate(raws) if raw]
+    out = [(None, None)] * len(raws)
+    if not found:
+        return out
+    if NUMPY_AVAILABLE:
+        try:
+            # Rows alternate lat, lon for each image
+            dms = np.array([raws[i][k] for i in found for k in (0, 2)], dtype=np.float64).reshape(-1, 3)
+            neg = np.array([raws[i][k] in ('S', 'W') for i in found for k in (1, 3)])
+            dec = _dms_batch(dms[:, 0], dms[:, 1], dms[:, 2], neg).tolist()
+            for j, i in enumerate(found):
+                out[i] = (dec[2 * j], dec[2 * j + 1])
+            return out
+        except (TypeError, ValueError):
+            pass  # a malformed tag somewhere: convert one by one instead
+    for i in found:
+        lat_dms, lat_ref, lon_dms, lon_ref = raws[i]
+        out[i] = (convert_gps_to_decimal(lat_dms, lat_ref), convert_gps_to_decimal(lon_dms, lon_ref))
+    return out
+
+# Per-file EXIF reads are open()/page-fault bound, so threads overlap them well.
+# One pool for the process: concurrent requests share it instead of each
+# spawning its own, which caps how hard the disk is hit at once.
+EXIF_POOL = ThreadPoolExecutor(max_workers=min(32, 2 * (os.cpu_count() or 4)), thread_name_prefix='exif')
+
+def extract_gps_batch(image_paths):
+    """GPS for many images at once, in input order."""
+    raws = None
+    if FAST_EXIF_AVAILABLE:
+        try:
+            raws = [_dms_from_exif_dict(exif) for exif in fast_exif_rs_py.read_exif_files_parallel(image_paths)]
+        except Exception as e:
+            print(f"Batch EXIF read failed, falling back to per-file: {e}")
+    if raws is None:
+        if not image_paths:
+            return []
+        raws = list(EXIF_POOL.map(_read_gps_dms, image_paths))
+    return gps_to_decimal_batch(raws)
+
+# Confirmed image path -> (mtime_ns, lat, lon), fallback coordinates included
+_GPS_CACHE = {}
+_GPS_CACHE_LOCK = threading.Lock()
+
+def confirmed_gps():
+    """(filename, lat, lon) for every confirmed image, with fallback coordinates filled in.
+
+    Positions are cached per file version, so a repeat call only stats the
+    directory and parses the images that are new or were rewritten.
+    """
+    try:
+        with os.scandir(CONFIRMED_PATH) as it:
+            entries = sorted((e for e in it if e.is_file() and e.name.lower().endswith(IMAGE_EXTENSIONS)),
+                             key=lambda e: e.path)
+            versions = [e.stat().st_mtime_ns for e in entries]
+    except FileNotFoundError:
+        entries, versions = [], []
+    # One updater at a time: a concurrent prune could drop entries this call returns
+    with _GPS_CACHE_LOCK:
+        stale = [(e, mtime) for e, mtime in zip(entries, versions)
+                 if _GPS_CACHE.get(e.path, (None,))[0] != mtime]
+        for (e, mtime), (lat, lon) in zip(stale, extract_gps_batch([e.path for e, _ in stale])):
+            if lat is None or lon is None:
+                lat, lon = fallback_coordinates(e.name)
+            _GPS_CACHE[e.path] = (mtime, lat, lon)
+        if len(_GPS_CACHE) > len(entries):
+            # Drop images that have since been moved out of the folder
+            live = {e.path for e in entries}
+            for path in [p for p in _GPS_CACHE if p not in live]:
+                del _GPS_CACHE[path]
+        return [(e.name,) + _GPS_CACHE[e.path][1:] for e in entries]
+
+# /gps_data.bin layout, little-endian: u32 count, then count x (f32 lat, f32 lon,
+# u32 name offset, u32 name length), then the UTF-8 filenames back to back
+GPS_HEADER = struct.Struct('<I')
+GPS_RECORD = struct.Struct('<ffII')
+
+def pack_gps(records):
+    """Pack (filename, lat, lon) records into the /gps_data.bin layout."""
+    out = bytearray(GPS_HEADER.size + GPS_RECORD.size * len(records))
+    GPS_HEADER.pack_into(out, 0, len(records))
+    names = []
+    offset = 0
+    for i, (fn, lat, lon) in enumerate(records):
+        name = fn.encode('utf-8')
+        GPS_RECORD.pack_into(out, GPS_HEADER.size + GPS_RECORD.size * i, lat, lon, offset, len(name))
+        names.append(name)
+        offset += len(name)
+    out += b''.join(names)
+    return bytes(out)
+
+# binary flag -> (confirmed folder mtime, serialized body)
+_GPS_BODY_CACHE = {}
+
+def gps_body(binary=False):
+    """The /gps_data JSON body (or the /gps_data.bin one), rebuilt only when the confirmed folder changes."""
+    try:
+        version = os.stat(CONFIRMED_PATH).st_mtime_ns
+    except FileNotFoundError:
+        version = None
+    cached = _GPS_BODY_CACHE.get(binary)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    records = confirmed_gps()
+    if binary:
+        body = pack_gps(records)
+    else:
+        body = dumps_json({'points': [{
             "lat": lat,
             "lon": lon,
-            "thumb_url": f"/local_image/{filename}",
-            "image_url": f"/local_image/{filename}",
-            "camera_id": camera_id,
-            "date": date_str,
-            "time": time_str
-        })
+            "tile_id": os.path.splitext(fn)[0],
+            "image_url": f"/local_image/{urllib.parse.quote(fn)}"
+        } for fn, lat, lon in records]})
+    _GPS_BODY_CACHE[binary] = (version, body)
+    return body
+
+# Mock position (lat, lon, jitter) per camera for images without EXIF GPS
+MOCK_CAMERA_CENTROIDS = {
+    "B002T": (-0.4, -90.3, 0.1),
+    "B004T": (-0.6, -90.5, 0.1),
+}
+MOCK_DEFAULT_CENTROID = (-0.5, -90.4, 0.2)
+
+def _name_hash(name):
+    """Stable 64-bit hash of a filename (xxh3 when available, else blake2b)."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(name)
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), 'little')
+
+def _mock_draws(filenames, camera_ids):
+    """Mock scores and fallback lat/lon for a batch of images.
+
+    Values are derived from each filename's hash rather than an RNG, so the
+    same directory always produces the same responses (and ETags).
+    """
+    n = len(filenames)
+    centroids = [MOCK_CAMERA_CENTROIDS.get(cid, MOCK_DEFAULT_CENTROID) for cid in camera_ids]
+    hashes = [_name_hash(filename) for filename in filenames]
+    if NUMPY_AVAILABLE and n:
+        h = np.array(hashes, dtype=np.uint64)
+        c = np.array(centroids, dtype=np.float64)
+        # Three 16-bit lanes of the hash -> uniform values in [0, 1]
+        u = np.stack([(h >> np.uint64(k)) & np.uint64(0xffff) for k in (0, 16, 32)], axis=1) / 0xffff
+        # Scores stay an array: they feed score_index's argsort directly
+        return (0.6 + 0.35 * u[:, 2],
+                (c[:, 0] + (2 * u[:, 0] - 1) * c[:, 2]).tolist(),
+                (c[:, 1] + (2 * u[:, 1] - 1) * c[:, 2]).tolist())
+    scores, lats, lons = [], [], []
+    for h, (lat, lon, j) in zip(hashes, centroids):
+        lats.append(lat + (2 * (h & 0xffff) / 0xffff - 1) * j)
+        lons.append(lon + (2 * ((h >> 16) & 0xffff) / 0xffff - 1) * j)
+        scores.append(0.6 + 0.35 * ((h >> 32) & 0xffff) / 0xffff)
+    return scores, lats, lons
+
+IMAGE_FIELDS = ("tile_id", "score", "lat", "lon", "thumb_url", "image_url", "camera_id", "date", "time")
+
+def _image_columns(image_paths, gps):
+    """Build a directory's metadata (filename parts, GPS, mock score) column by column.
+
+    Returns a dict of parallel columns keyed by IMAGE_FIELDS; "score" is a
+    NumPy array when NumPy is available so threshold/sort work stays vectorized.
+    Rows are only turned into dicts for the slice a response actually returns.
+    """
+    filenames = [os.path.basename(path) for path in image_paths]
+    # Extract info from filename: B002T-20200709-165419_jpg.rf...
+    parts = [_FN_RE.match(filename).groups() for filename in filenames]
+    scores, mock_lats, mock_lons = _mock_draws(filenames, [camera_id for camera_id, _, _ in parts])
+    # GPS from EXIF if available, else mock coordinates based on camera ID
+    lats = [lat if lat is not None and lon is not None else mock_lat
+            for (lat, lon), mock_lat in zip(gps, mock_lats)]
+    lons = [lon if lat is not None and lon is not None else mock_lon
+            for (lat, lon), mock_lon in zip(gps, mock_lons)]
+    urls = [f"/local_image/{filename}" for filename in filenames]
+    return {
+        "tile_id": [filename.replace('.jpg', '') for filename in filenames],
+        "score": np.asarray(scores, dtype=np.float64) if NUMPY_AVAILABLE else scores,  # Mock confidence score
+        "lat": lats,
+        "lon": lons,
+        "thumb_url": [f"{url}?thumb=1" for url in urls],
+        "image_url": urls,
+        "camera_id": [camera_id for camera_id, _, _ in parts],
+        "date": [date_str if date_str is not None else "20200101" for _, date_str, _ in parts],
+        "time": [time_str if time_str is not None else "000000" for _, _, time_str in parts],
+    }
+
+def image_rows(columns, indices, fields=IMAGE_FIELDS):
+    """Materialize the given rows of an _image_columns index as dicts."""
+    cols = [(field, columns[field]) for field in fields]
+    return [{field: col[i] for field, col in cols} for i in indices]
+
+def score_index(scores):
+    """Sort a score column once: (row order highest first, negated scores in that order).
+
+    Ties keep directory order. The negated scores ascend, so the rows at or
+    above any threshold are a prefix found by bisection (see ranked_page).
+    """
+    if NUMPY_AVAILABLE and isinstance(scores, np.ndarray):
+        order = np.argsort(-scores, kind="stable")
+        return order, -scores[order]
+    order = sorted(range(len(scores)), key=lambda i: -scores[i])
+    return order, [-scores[i] for i in order]
+
+def ranked_page(index, threshold, start, stop):
+    """Row indices [start, stop) of the scores >= threshold, highest first, and their total.
+
+    A bisect on the pre-sorted index: nothing is filtered, sorted or counted
+    per request, and only the page's indices are materialized.
+    """
+    order, neg_scores = index
+    if NUMPY_AVAILABLE and isinstance(neg_scores, np.ndarray):
+        total = int(np.searchsorted(neg_scores, -threshold, side="right"))
+        return order[start:min(stop, total)].tolist(), total
+    total = bisect.bisect_right(neg_scores, -threshold)
+    return order[start:min(stop, total)], total
+
+def list_images(dataset_path):
+    """Sorted image paths in a directory: one scandir pass, case-insensitive extensions."""
+    with os.scandir(dataset_path) as entries:
+        return sorted(e.path for e in entries
+                      if e.is_file() and e.name.lower().endswith(IMAGE_EXTENSIONS))
+
+def get_image_columns(dataset_path, limit=None):
+    """Columnar metadata for a directory's images (see _image_columns).
+
+    The directory is scanned and its images parsed once; later calls are served
+    from _DIR_CACHE until the directory changes. Columns are shared between
+    calls, so callers must not mutate them.
+    """
+    view = _dir_view(dataset_path, limit)
+    return view['columns'] if view else {field: [] for field in IMAGE_FIELDS}
+
+def get_ranked_columns(dataset_path, limit=None):
+    """get_image_columns plus its score_index, which is built once per directory version."""
+    view = _dir_view(dataset_path, limit)
+    if view is None:
+        return {field: [] for field in IMAGE_FIELDS}, score_index([])
+    if view['index'] is None:
+        view['index'] = score_index(view['columns']['score'])
+    return view['columns'], view['index']
+
+def _dir_view(dataset_path, limit):
+    # Cached {'columns', 'index'} for the first `limit` images, or None if the
+    # directory is missing
+    try:
+        dir_mtime = os.stat(dataset_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
     
-    return results
+    cached = _DIR_CACHE.get(dataset_path)
+    if cached is None or cached[0] != dir_mtime:
+        with _DIR_CACHE_LOCK:
+            cached = _DIR_CACHE.get(dataset_path)
+            if cached is None or cached[0] != dir_mtime:
+                image_files = list_images(dataset_path)
+                cached = (dir_mtime, _image_columns(image_files, extract_gps_batch(image_files)), {})
+                _DIR_CACHE[dataset_path] = cached
+    
+    _, columns, views = cached
+    view = views.get(limit)
+    if view is None:
+        if limit is not None:
+            columns = {field: col[:limit] for field, col in columns.items()}
+        view = views[limit] = {'columns': columns, 'index': None}
+    return view
 
-def extract_gps_from_image(image_path):
-    """Extract GPS coordinates from image EXIF data."""
+def get_local_images(dataset_path, limit=50):
+    """Get list of local training images with metadata."""
+    columns = get_image_columns(dataset_path, limit)
+    return image_rows(columns, range(len(columns["tile_id"])))
+
+EXIF_GPS_IFD_TAG = 0x8825
+JPEG_HEADER_BYTES = 65536  # APP1 is capped at 64KB and sits right after SOI
+
+def _gps_from_tiff(tiff):
+    """Raw GPS from the TIFF structure inside an EXIF APP1 segment."""
+    if tiff[:2] == b'II':
+        endian = '<'
+    elif tiff[:2] == b'MM':
+        endian = '>'
+    else:
+        return None
+    if struct.unpack_from(endian + 'H', tiff, 2)[0] != 42:
+        return None
+
+    def entries(ifd_offset):
+        count = struct.unpack_from(endian + 'H', tiff, ifd_offset)[0]
+        for i in range(count):
+            # tag, type, count, value-or-offset
+            yield struct.unpack_from(endian + 'HHII', tiff, ifd_offset + 2 + 12 * i) + (ifd_offset + 2 + 12 * i,)
+
+    gps_offset = next((value for tag, _, _, value, _ in entries(struct.unpack_from(endian + 'I', tiff, 4)[0])
+                       if tag == EXIF_GPS_IFD_TAG), None)
+    if gps_offset is None:
+        return NO_GPS
+
+    gps = {}
+    for tag, typ, count, value, entry_offset in entries(gps_offset):
+        if tag in (1, 3) and typ == 2:  # LatitudeRef / LongitudeRef: short ASCII stored inline
+            gps[tag] = chr(tiff[entry_offset + 8])
+        elif tag in (2, 4) and typ == 5 and count == 3:  # Latitude / Longitude: 3 RATIONALs
+            nums = struct.unpack_from(endian + '6I', tiff, value)
+            if not all(nums[1::2]):
+                return NO_GPS
+            gps[tag] = tuple(n / d for n, d in zip(nums[0::2], nums[1::2]))
+    if 2 not in gps or 4 not in gps:
+        return NO_GPS
+    return gps[2], gps.get(1, 'N'), gps[4], gps.get(3, 'W')
+
+def _read_gps_app1(image_path):
+    """Raw GPS straight from a JPEG's EXIF APP1 segment, without decoding the image.
+
+    Returns None when the file can't be handled here (not a JPEG, truncated,
+    unusual layout) so the caller can fall back to Pillow.
+    """
+    try:
+        with open(image_path, 'rb') as f:
+            # Map instead of read(): only the pages the marker walk touches
+            # are faulted in, and nothing but the APP1 segment gets copied
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            end = min(len(mm), JPEG_HEADER_BYTES)
+            if mm[:2] != b'\xff\xd8':
+                return None
+            pos = 2
+            while pos + 4 <= end and mm[pos] == 0xFF:
+                marker = mm[pos + 1]
+                length = struct.unpack_from('>H', mm, pos + 2)[0]
+                if marker == 0xE1 and mm[pos + 4:pos + 10] == b'Exif\x00\x00':
+                    if pos + 2 + length > len(mm):
+                        return None
+                    return _gps_from_tiff(mm[pos + 10:pos + 2 + length])
+                if marker == 0xDA:  # start of scan: no EXIF before the image data
+                    return NO_GPS
+                pos += 2 + length
+            return None
+        finally:
+            mm.close()
+    except (OSError, ValueError, struct.error, IndexError):
+        # ValueError: empty files can't be mapped
+        return None
+
+def _read_gps_dms_pil(image_path):
+    """Raw GPS via Pillow, for files the APP1 reader can't handle."""
     if not PIL_AVAILABLE:
-        return None, None
+        return NO_GPS
         
     try:
         with Image.open(image_path) as img:
             exif = img._getexif()
-            if exif is not None:
-                for tag, value in exif.items():
-                    if TAGS.get(tag) == 'GPSInfo':
-                        gps_data = {}
-                        for gps_tag, gps_value in value.items():
-                            gps_data[GPSTAGS.get(gps_tag, gps_tag)] = gps_value
-                        
-                        if 'GPSLatitude' in gps_data and 'GPSLongitude' in gps_data:
-                            lat = convert_gps_to_decimal(gps_data['GPSLatitude'], gps_data.get('GPSLatitudeRef', 'N'))
-                            lon = convert_gps_to_decimal(gps_data['GPSLongitude'], gps_data.get('GPSLongitudeRef', 'W'))
-                            return lat, lon
+            gps_ifd = exif.get(EXIF_GPS_IFD_TAG) if exif is not None else None
+            if gps_ifd:
+                # Standard GPS tag ids: 1/2 latitude ref/value, 3/4 longitude ref/value
+                lat, lon = gps_ifd.get(2), gps_ifd.get(4)
+                if lat is not None and lon is not None:
+                    return (lat, gps_ifd.get(1, 'N'), lon, gps_ifd.get(3, 'W'))
     except Exception as e:
         print(f"Error extracting GPS from {image_path}: {e}")
     
-    return None, None
+    return NO_GPS
+
+@lru_cache(maxsize=4096)
+def _gps_dms_cached(image_path, mtime_ns, size):
+    # mtime/size are only part of the key: an overwritten file gets a fresh entry
+    raw = _read_gps_app1(image_path)
+    return raw if raw is not None else _read_gps_dms_pil(image_path)
+
+def _read_gps_dms(image_path):
+    """Raw GPS for one image, parsed at most once per file version."""
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return NO_GPS
+    return _gps_dms_cached(image_path, st.st_mtime_ns, st.st_size)
+
+def extract_gps_from_image(image_path):
+    """Extract GPS coordinates from image EXIF data."""
+    raw = _read_gps_dms(image_path)
+    if not raw:
+        return None, None
+    lat_dms, lat_ref, lon_dms, lon_ref = raw
+    return convert_gps_to_decimal(lat_dms, lat_ref), convert_gps_to_decimal(lon_dms, lon_ref)
 
 def convert_gps_to_decimal(gps_coords, ref):
     """Convert GPS coordinates from DMS to decimal format."""
@@ -137,6 +568,9 @@ def convert_gps_to_decimal(gps_coords, ref):
         minutes = float(gps_coords[1])
         seconds = float(gps_coords[2])
         
+        if DMS_AOT_AVAILABLE:
+            return _dms_to_decimal_aot(degrees, minutes, seconds, ref in ('S', 'W'))
+        
         decimal = degrees + (minutes / 60.0) + (seconds / 3600.0)
         
         if ref in ['S', 'W']:
@@ -146,14 +580,108 @@ def convert_gps_to_decimal(gps_coords, ref):
     except:
         return None
 
+THUMB_SIZE = (256, 256)
+THUMB_DIR = '.thumbs'
+# Widths /local_image/?w= may ask for; others round up to the next one, so
+# the cache holds at most this many files per image
+THUMB_WIDTHS = (128, 256, 512)
+
+def thumb_width(requested):
+    """The THUMB_WIDTHS entry to serve for a requested width."""
+    return next((w for w in THUMB_WIDTHS if w >= requested), THUMB_WIDTHS[-1])
+
+def _thumb_path(image_path, width=THUMB_SIZE[0]):
+    """Cached thumbnail location: a hidden .thumbs/ next to the source image."""
+    folder, name = os.path.split(image_path)
+    if width == THUMB_SIZE[0]:
+        return os.path.join(folder, THUMB_DIR, name + '.jpg')
+    return os.path.join(folder, THUMB_DIR, str(width), name + '.jpg')
+
+def ensure_thumbnail(image_path, width=THUMB_SIZE[0]):
+    """Path of a JPEG thumbnail at most `width` px on a side, creating it on first use.
+
+    Returns None when Pillow is unavailable or the image can't be decoded; the
+    caller then serves the original.
+    """
+    if not PIL_AVAILABLE:
+        return None
+    thumb = _thumb_path(image_path, width)
+    try:
+        if os.stat(thumb).st_mtime_ns >= os.stat(image_path).st_mtime_ns:
+            return thumb
+    except FileNotFoundError:
+        pass
+    try:
+        os.makedirs(os.path.dirname(thumb), exist_ok=True)
+        # Write under a unique name then rename, so concurrent requests for
+        # the same image never see a half-written file
+        tmp = f"{thumb}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with Image.open(image_path) as im:
+            # JPEGs decode straight at a reduced DCT scale (still >= 2x the
+            # target, so the resample below has detail to work with)
+            im.draft('RGB', (2 * width, 2 * width))
+            im.thumbnail((width, width))
+            im.convert('RGB').save(tmp, 'JPEG', quality=75, optimize=True, progressive=True)
+        os.replace(tmp, thumb)
+        return thumb
+    except Exception as e:
+        print(f"Error creating thumbnail for {image_path}: {e}")
+        return None
+
+LQIP_SIZE = (16, 16)
+
+@lru_cache(maxsize=4096)
+def _lqip_cached(image_path, mtime_ns, size):
+    # mtime/size are only part of the key: an overwritten file gets a fresh entry
+    with Image.open(image_path) as im:
+        im.draft('RGB', (LQIP_SIZE[0] * 8, LQIP_SIZE[1] * 8))  # JPEG: decode at 1/8 scale
+        im = im.convert('RGB')
+        im.thumbnail(LQIP_SIZE)
+        buf = io.BytesIO()
+        im.save(buf, 'JPEG', quality=40, optimize=True)  # optimized Huffman tables halve it
+    return 'data:image/jpeg;base64,' + base64.b64encode(buf.getvalue()).decode('ascii')
+
+def lqip_data_url(image_path):
+    """Inline 16px JPEG placeholder (a data: URL) for an image, or None."""
+    if not PIL_AVAILABLE:
+        return None
+    try:
+        st = os.stat(image_path)
+        return _lqip_cached(image_path, st.st_mtime_ns, st.st_size)
+    except Exception:
+        return None
+
+def add_lqip(items, folder):
+    """Attach an `lqip` placeholder to each local-image row of a response page."""
+    for item in items:
+        url = item.get('image_url') or ''
+        local = url.startswith('/local_image/')
+        item['lqip'] = lqip_data_url(os.path.join(folder, url.rsplit('/', 1)[-1])) if local else None
+    return items
+
 def confirm_image(filename):
-    """Copy image from positive to confirmed folder."""
+    """Copy image from positive to confirmed folder.
+
+    The copy is a hardlink where possible, so no bytes are duplicated; both
+    names share one inode, so an in-place edit of either shows in the other.
+    """
     try:
         source = os.path.join(POSITIVE_PATH, filename)
         destination = os.path.join(CONFIRMED_PATH, filename)
         
         if os.path.exists(source):
-            shutil.copy2(source, destination)
+            if os.path.exists(destination) and os.path.samefile(source, destination):
+                return True  # already linked; rename() between links of one inode is a no-op
+            # Link under a temp name and rename over, so re-confirming replaces
+            # an existing copy the way copy2 did
+            tmp = f"{destination}.{threading.get_ident()}.tmp"
+            try:
+                os.link(source, tmp)
+                os.replace(tmp, destination)
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+                shutil.copy2(source, destination)  # no hardlinks across mounts / on this filesystem
             return True
         return False
     except Exception as e:
@@ -167,14 +695,27 @@ def reject_image(filename):
         destination = os.path.join(NEGATIVE_PATH, filename)
         
         if os.path.exists(source):
-            shutil.move(source, destination)
+            # Sibling folders under one root: a rename is a single inode update
+            try:
+                os.rename(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(source, destination)  # DATA_ROOT folders on different mounts
             return True
         return False
     except Exception as e:
         print(f"Error rejecting image {filename}: {e}")
         return False
 
-# Mock data (fallback)
+REVIEW_ACTIONS = {'confirm': confirm_image, 'reject': reject_image}
+
+# Validation-tab decisions (tile_id -> 'verified' | 'rejected'); the demo keeps them in memory
+VALIDATIONS = {}
+VALIDATIONS_LOCK = threading.Lock()
+
+# Mock data (fallback). Built once per process; callers treat it as read-only.
+@lru_cache(maxsize=1)
 def generate_results():
     return [
         {
@@ -186,6 +727,60 @@ def generate_results():
         } for i in range(30)
     ]
 
+@lru_cache(maxsize=1)
+def mock_columns():
+    """generate_results() in the columnar layout the /positives handler ranks."""
+    results = generate_results()
+    columns = {field: [r[field] for r in results] for field in ("tile_id", "score", "lat", "lon", "thumb_url")}
+    columns["image_url"] = columns["thumb_url"]
+    if NUMPY_AVAILABLE:
+        # Same layout as _image_columns, so score_index ranks it with argsort too
+        columns["score"] = np.array(columns["score"], dtype=np.float64)
+    return columns
+
+@lru_cache(maxsize=1)
+def mock_ranked_columns():
+    """mock_columns() and its score_index."""
+    columns = mock_columns()
+    return columns, score_index(columns["score"])
+
+def positives_page(threshold, page, page_size, cursor=None):
+    """
+    One page of positives ranked by score, as served by /positives and /events.
+
+    `cursor` (the `next_cursor` of the previous page) takes precedence over
+    `page`; `next_cursor` is None on the last page.
+    """
+    start_idx = int(cursor) if cursor else (page - 1) * page_size
+    try:
+        version = os.stat(POSITIVE_PATH).st_mtime_ns
+    except FileNotFoundError:
+        version = None
+    return _positives_page(version, threshold, start_idx, page_size)
+
+@lru_cache(maxsize=256)
+def _positives_page(version, threshold, start_idx, page_size):
+    # `version` (the folder's mtime) is only part of the key: reviewing an
+    # image moves it out of the folder, so the next request misses. Pages are
+    # shared between callers and must not be mutated.
+    # Use images from positive folder for detection results
+    columns, index = get_ranked_columns(POSITIVE_PATH, limit=100)
+    if not columns['tile_id']:
+        columns, index = mock_ranked_columns()
+    
+    # Threshold, order and page all come from the pre-sorted score index
+    end_idx = start_idx + page_size
+    rows, total = ranked_page(index, threshold, start_idx, end_idx)
+    
+    # Only the page's rows become dicts
+    items = image_rows(columns, rows, ('tile_id', 'image_url', 'thumb_url', 'lat', 'lon', 'score'))
+    add_lqip(items, POSITIVE_PATH)
+    return {
+        'items': items,
+        'total': total,
+        'next_cursor': str(end_idx) if end_idx < total else None
+    }
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
@@ -195,6 +790,8 @@ HTML_TEMPLATE = """
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet">
     <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
+    <link rel="stylesheet" href="https://unpkg.com/leaflet.markercluster@1.5.3/dist/MarkerCluster.css" />
+    <link rel="stylesheet" href="https://unpkg.com/leaflet.markercluster@1.5.3/dist/MarkerCluster.Default.css" />
     <style>
         :root {
             --primary: #059669;
@@ -508,6 +1105,12 @@ HTML_TEMPLATE = """
             box-shadow: var(--shadow-sm);
         }
         
+        /* Off-screen cards skip layout and paint; the box keeps its last rendered size */
+        .result-card, .validation-item {
+            content-visibility: auto;
+            contain-intrinsic-size: auto 260px;
+        }
+        
         .result-card:hover {
             transform: translateY(-2px);
             box-shadow: var(--shadow-lg);
@@ -873,6 +1476,14 @@ HTML_TEMPLATE = """
             min-height: 520px;
         }
 
+        /* Verified-location marker: one shared CSS dot instead of PNG icon + shadow */
+        .tortoise-dot {
+            background: #e55;
+            border-radius: 50%;
+            border: 2px solid #fff;
+            box-shadow: 0 0 2px #000;
+        }
+
         .map-preview {
             flex: 0 1 360px;
             max-width: 420px;
@@ -1291,6 +1902,12 @@ HTML_TEMPLATE = """
                         <span>Date Range:</span>
                         <span id="date-range">No data</span>
                     </div>
+                    <div class="stat-item">
+                        <button class="btn btn-secondary" onclick="loadGpsData()">
+                            <i class="fas fa-sync-alt"></i>
+                            Refresh
+                        </button>
+                    </div>
                     <div class="stat-item">
                         <button class="btn btn-primary" onclick="downloadGPSData()" style="background: #10b981; border: none;">
                             <i class="fas fa-download"></i>
@@ -1359,20 +1976,26 @@ HTML_TEMPLATE = """
     </div>
 
     <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+    <script src="https://unpkg.com/leaflet.markercluster@1.5.3/dist/leaflet.markercluster.js"></script>
+    <!-- IndexedDB tile cache; without it the layers below behave as plain tile layers -->
+    <script src="https://unpkg.com/pouchdb@7.3.1/dist/pouchdb.min.js"></script>
+    <script src="https://unpkg.com/leaflet.tilelayer.pouchdbcached@1.0.0/L.TileLayer.PouchDBCached.js"></script>
     <script>
         let currentRunId = 'local';
-        let statusTimer = null;
+        const detachedPanels = new Map();  // tab name -> { node, placeholder }, see setPanelAttached
+        let statusStream = null;
         let validationData = new Map(); // Store validation results
         let map = null;
-        let verifiedMarkers = [];
+        let markerGroup = null;  // clusters the verified-location markers
+        let dotIcon = null;      // shared by every marker; built with the map
         let currentGpsPoints = [];
 
-        const previewContainer = document.getElementById('map-preview');
-        const previewPlaceholder = document.getElementById('map-preview-placeholder');
-        const previewContent = document.getElementById('map-preview-content');
-        const previewImage = document.getElementById('map-preview-image');
-        const previewMeta = document.getElementById('map-preview-meta');
-        const previewLink = document.getElementById('map-preview-link');
+        const previewContainer = byId('map-preview');
+        const previewPlaceholder = byId('map-preview-placeholder');
+        const previewContent = byId('map-preview-content');
+        const previewImage = byId('map-preview-image');
+        const previewMeta = byId('map-preview-meta');
+        const previewLink = byId('map-preview-link');
 
         function resetPreview() {
             if (!previewContainer) return;
@@ -1430,7 +2053,7 @@ HTML_TEMPLATE = """
 
             if (previewMeta) {
                 const metaParts = [];
-                const info = parseTileMeta(point.tile_id);
+                const info = point.meta || parseTileMeta(point.tile_id);
                 if (info.camera) {
                     metaParts.push(`<span><strong>Camera:</strong> ${info.camera}</span>`);
                 }
@@ -1448,20 +2071,61 @@ HTML_TEMPLATE = """
             }
         }
 
+        // Char-code digit scans: CAMERA-YYYYMMDD-HHMMSS names need no RegExp
+        function isDigits(str, start, len) {
+            if (start + len > str.length) return false;
+            for (let i = start; i < start + len; i++) {
+                const c = str.charCodeAt(i);
+                if (c < 48 || c > 57) return false;
+            }
+            return true;
+        }
+        
+        // Start of the first run of `len` digits in `str`, or -1
+        function firstDigitRun(str, len) {
+            let run = 0;
+            for (let i = 0; i < str.length; i++) {
+                const c = str.charCodeAt(i);
+                run = c >= 48 && c <= 57 ? run + 1 : 0;
+                if (run === len) return i - len + 1;
+            }
+            return -1;
+        }
+        
+        // Memo of parsed filenames, bounded as an LRU (Maps iterate in insertion order)
+        const META_CACHE_SIZE = 5000;
+        const metaCache = new Map();
+        
         function parseTileMeta(tileId) {
             if (!tileId) return {};
+            const hit = metaCache.get(tileId);
+            if (hit) {
+                metaCache.delete(tileId);
+                metaCache.set(tileId, hit);
+                return hit;
+            }
+            const info = computeTileMeta(tileId);
+            metaCache.set(tileId, info);
+            if (metaCache.size > META_CACHE_SIZE) {
+                metaCache.delete(metaCache.keys().next().value);
+            }
+            return info;
+        }
+        
+        // Pure (no closure state): also shipped to the GPS worker as source
+        function computeTileMeta(tileId) {
             const parts = tileId.split('-');
             const info = {};
             if (parts.length) {
                 info.camera = parts[0];
             }
-            if (parts.length > 1 && /^\d{8}$/.test(parts[1])) {
+            if (parts.length > 1 && parts[1].length === 8 && isDigits(parts[1], 0, 8)) {
                 info.date = `${parts[1].slice(0, 4)}-${parts[1].slice(4, 6)}-${parts[1].slice(6, 8)}`;
             }
             if (parts.length > 2) {
-                const timeMatch = parts[2].match(/(\d{6})/);
-                if (timeMatch) {
-                    const t = timeMatch[1];
+                const i = firstDigitRun(parts[2], 6);
+                if (i !== -1) {
+                    const t = parts[2].slice(i, i + 6);
                     info.time = `${t.slice(0, 2)}:${t.slice(2, 4)}:${t.slice(4, 6)}`;
                 }
             }
@@ -1474,11 +2138,12 @@ HTML_TEMPLATE = """
             }
 
             const marker = L.marker([point.lat, point.lon], {
-                title: point.tile_id || 'Confirmed detection'
+                title: point.tile_id || 'Confirmed detection',
+                icon: dotIcon
             });
 
             const tooltipLabel = point.tile_id ? point.tile_id.split('.')[0] : 'Confirmed detection';
-            marker.bindTooltip(tooltipLabel, { direction: 'top', offset: [0, -10] });
+            marker.bindTooltip(tooltipLabel, { direction: 'top', offset: [0, -6] });
 
             const popupHtml = `
                 <div style="text-align: left; max-width: 220px;">
@@ -1488,13 +2153,39 @@ HTML_TEMPLATE = """
                 </div>`;
             marker.bindPopup(popupHtml);
             marker.on('click', () => showPreview(point));
-            marker.addTo(map);
-            verifiedMarkers.push(marker);
+            // Parse the filename once; the stats pass and the preview reuse it
+            point.meta = marker._meta = point.meta || parseTileMeta(point.tile_id);
             return marker;
         }
         
         // Make switchTab available globally with proper layout handling
         /* Single source of truth for tab switching */
+    // Inactive panels are taken out of the document (a comment marks the spot)
+    // so hidden content, the Leaflet map above all, does no layout or timer
+    // work. Their nodes are kept (detachedPanels), and state survives the round trip.
+    function setPanelAttached(name, panel, attached) {
+        const entry = detachedPanels.get(name);
+        if (attached && entry) {
+            entry.placeholder.replaceWith(entry.node);
+            detachedPanels.delete(name);
+        } else if (!attached && !entry) {
+            const placeholder = document.createComment(`panel:${name}`);
+            panel.replaceWith(placeholder);
+            detachedPanels.set(name, { node: panel, placeholder });
+        }
+    }
+
+    // getElementById that also finds elements inside detached panels
+    function byId(id) {
+        const el = document.getElementById(id);
+        if (el) return el;
+        for (const { node } of detachedPanels.values()) {
+            const hit = node.id === id ? node : node.querySelector(`#${id}`);
+            if (hit) return hit;
+        }
+        return null;
+    }
+
     // SIMPLE TAB SYSTEM THAT ACTUALLY WORKS
     function showTab(tabName) {
         console.log('SHOWING TAB:', tabName);
@@ -1503,13 +2194,14 @@ HTML_TEMPLATE = """
         const buttonIds = { detection: 'det-btn', validation: 'val-btn', map: 'map-btn' };
 
         tabOrder.forEach(name => {
-            const panel = document.getElementById(`${name}-tab`);
-            const button = document.getElementById(buttonIds[name]);
+            const panel = byId(`${name}-tab`);
+            const button = byId(buttonIds[name]);
             const isActive = name === tabName;
 
             if (panel) {
                 panel.classList.toggle('active', isActive);
                 panel.toggleAttribute('hidden', !isActive);
+                setPanelAttached(name, panel, isActive);
             }
 
             if (button) {
@@ -1517,20 +2209,25 @@ HTML_TEMPLATE = """
             }
         });
 
-        if (tabName === 'detection') {
-            refreshResults();
-            document.getElementById('review-panel').classList.add('visible');
-        } else if (tabName === 'validation') {
-            loadValidationImagesScoped();
-            document.getElementById('review-panel').classList.remove('visible');
-        } else if (tabName === 'map') {
-            if (!map) initializeMap();
-            loadGpsData();
-            document.getElementById('review-panel').classList.remove('visible');
-            if (map) {
-                setTimeout(() => map.invalidateSize(), 60);
+        byId('review-panel').classList.toggle('visible', tabName === 'detection');
+
+        // Let the newly shown panel paint before any fetch/DOM work. Each panel
+        // loads on first activation only; its Refresh button reloads it after that.
+        const panel = byId(`${tabName}-tab`);
+        requestAnimationFrame(() => requestAnimationFrame(() => {
+            const firstVisit = panel && !panel.dataset.loaded;
+            if (panel) panel.dataset.loaded = '1';
+
+            if (tabName === 'detection') {
+                if (firstVisit) refreshResults();
+            } else if (tabName === 'validation') {
+                if (firstVisit) loadValidationImagesScoped();
+            } else if (tabName === 'map') {
+                if (!map) initializeMap();
+                if (firstVisit) loadGpsData();
+                scheduleInvalidateSize();
             }
-        }
+        }));
 
         console.log('TAB SWITCHED TO:', tabName);
     }
@@ -1538,30 +2235,56 @@ HTML_TEMPLATE = """
     // Make it global
     window.showTab = showTab;
 
+    const validationNodes = new Map();  // tile_id -> .validation-item, reused across reloads
+    const validationTemplate = document.createElement('template');
+    validationTemplate.innerHTML = `
+        <div class="validation-item">
+            <img loading="lazy" decoding="async" fetchpriority="low" width="256" height="160">
+            <div class="validation-actions">
+            <button class="btn btn-verify" data-action="verified"><i class="fas fa-check"></i>Verify</button>
+            <button class="btn btn-reject" data-action="rejected"><i class="fas fa-times"></i>Reject</button>
+            </div>
+        </div>`;
+
+    // Delegated: the buttons carry the validation action they record
+    byId('validation-gallery').addEventListener('click', e => {
+        const button = e.target.closest('[data-action]');
+        const item = button && button.closest('.validation-item');
+        if (item) validateImage(item.dataset.tileId, button.dataset.action);
+    });
+
     /* Always scope queries to the active panel so we don't hit hidden clones/templates */
+    let validationAbort = null;  // the in-flight load, cancelled by the next one
     async function loadValidationImagesScoped() {
+    if (validationAbort) validationAbort.abort();
+    const abort = validationAbort = new AbortController();
     try {
-        const r = await fetch('/validation_images?page=1&page_size=40');
+        const r = await fetch('/validation_images?page=1&page_size=40', { signal: abort.signal });
         const { items = [] } = await r.json();
         console.log(`Validation: received ${items.length} items`);
 
-        const grid = document.querySelector('#validation-tab #validation-gallery');
+        const grid = byId('validation-tab').querySelector('#validation-gallery');
         if (!grid) return console.error('Validation: gallery element not found (scoped)');
 
         if (!items.length) {
+        validationNodes.clear();
         grid.innerHTML = `<div class="empty-state"><i class="fas fa-images"></i><p>No images available for validation.</p></div>`;
         return;
         }
 
-        grid.innerHTML = items.map(item => `
-        <div class="validation-item" data-tile-id="${item.tile_id}">
-            <img src="${item.thumb_url}" alt="${item.tile_id}">
-            <div class="validation-actions">
-            <button class="btn btn-verify" onclick="validateImage('${item.tile_id}','verified')"><i class="fas fa-check"></i>Verify</button>
-            <button class="btn btn-reject"  onclick="validateImage('${item.tile_id}','rejected')"><i class="fas fa-times"></i>Reject</button>
-            </div>
-        </div>
-        `).join('');
+        reconcileKeyed(grid, validationNodes, items, item => item.tile_id,
+        item => {
+            const node = validationTemplate.content.firstElementChild.cloneNode(true);
+            node.dataset.tileId = item.tile_id;
+            const img = node.querySelector('img');
+            setThumb(img, item);
+            img.alt = item.tile_id;
+            return node;
+        },
+        (node, item) => {
+            const img = node.querySelector('img');
+            if (img.getAttribute('src') !== item.thumb_url && !img.dataset.src) setThumb(img, item);
+        });
 
         // Force gallery dimensions to fix 0x0 issue
         grid.style.display = 'grid';
@@ -1575,20 +2298,23 @@ HTML_TEMPLATE = """
         const rect = grid.getBoundingClientRect();
         console.log('Validation: visible gallery rect =', rect);
     } catch (err) {
-        console.error('Load validation error:', err);
+        if (err.name !== 'AbortError') console.error('Load validation error:', err);
     }
     }
         // Update threshold display
-        document.getElementById('threshold').addEventListener('input', function() {
-            document.getElementById('threshold-value').textContent = this.value;
-                refreshResults();
+        // Dragging the slider fetches once it settles, not on every step
+        let thresholdTimer = null;
+        byId('threshold').addEventListener('input', function() {
+            byId('threshold-value').textContent = this.value;
+            clearTimeout(thresholdTimer);
+            thresholdTimer = setTimeout(refreshResults, 250);
         });
         
         function startRun() {
-            const dataset = document.getElementById('dataset').value;
-            const threshold = parseFloat(document.getElementById('threshold').value);
+            const dataset = byId('dataset').value;
+            const threshold = parseFloat(byId('threshold').value);
             
-            const runBtn = document.getElementById('run-btn');
+            const runBtn = byId('run-btn');
             runBtn.disabled = true;
             runBtn.innerHTML = '<span class="loading-spinner"></span> Starting Detection...';
             
@@ -1600,116 +2326,305 @@ HTML_TEMPLATE = """
             .then(r => r.json())
             .then(data => {
                 currentRunId = data.run_id;
-                document.getElementById('run-id').textContent = currentRunId;
-                document.getElementById('run-id-section').style.display = 'block';
-                document.getElementById('review-panel').classList.add('visible');
+                byId('run-id').textContent = currentRunId;
+                byId('run-id-section').style.display = 'block';
+                byId('review-panel').classList.add('visible');
                 
-                // Start status polling
-                startStatusPolling();
-                
-                // Initial results fetch
-                refreshResults();
+                // Status and the first page of results arrive over one event stream
+                startStatusStream();
             })
             .catch(err => {
-                document.getElementById('status').innerHTML = 
+                byId('status').innerHTML = 
                     `<div class="status-card error"><i class="fas fa-exclamation-triangle"></i> Error: ${err.message}</div>`;
                 runBtn.disabled = false;
                 runBtn.innerHTML = '<i class="fas fa-play"></i> Start Detection';
             });
         }
         
-        function startStatusPolling() {
-            if (statusTimer) clearInterval(statusTimer);
+        function startStatusStream() {
+            if (statusStream) statusStream.close();
+            
+            const threshold = parseFloat(byId('threshold').value);
+            const page = parseInt(byId('page').value);
+            const pageSize = parseInt(byId('page-size').value);
+            statusStream = new EventSource(`/events/${currentRunId}?threshold=${threshold}&page=${page}&page_size=${pageSize}`);
             
-            statusTimer = setInterval(() => {
-                if (!currentRunId) return;
+            statusStream.addEventListener('status', e => {
+                const data = JSON.parse(e.data);
+                const icon = data.state === 'completed' ? 'fas fa-check-circle' : 'fas fa-spinner fa-spin';
+                const statusText = `${data.state} — ${data.progress_pct.toFixed(1)}%`;
+                byId('status').innerHTML = 
+                    `<div class="status-card ${data.state === 'completed' ? 'success' : 'running'}">
+                        <i class="${icon}"></i>
+                        ${statusText}
+                    </div>`;
                 
-                fetch(`/status/${currentRunId}`)
-                .then(r => r.json())
-                .then(data => {
-                    const icon = data.state === 'completed' ? 'fas fa-check-circle' : 'fas fa-spinner fa-spin';
-                    const statusText = `${data.state} — ${data.progress_pct.toFixed(1)}%`;
-                    document.getElementById('status').innerHTML = 
-                        `<div class="status-card ${data.state === 'completed' ? 'success' : 'running'}">
-                            <i class="${icon}"></i>
-                            ${statusText}
-                        </div>`;
-                    
-                    if (data.state === 'completed') {
-                        clearInterval(statusTimer);
-                        const runBtn = document.getElementById('run-btn');
-                        runBtn.disabled = false;
-                        runBtn.innerHTML = '<i class="fas fa-play"></i> Start Detection';
-                    }
-                })
-                .catch(err => console.error('Status poll error:', err));
-            }, 1500);
+                if (data.state === 'completed') {
+                    // Don't let EventSource reconnect once the run is done
+                    statusStream.close();
+                    const runBtn = byId('run-btn');
+                    runBtn.disabled = false;
+                    runBtn.innerHTML = '<i class="fas fa-play"></i> Start Detection';
+                }
+            });
+            
+            statusStream.addEventListener('positives', e => {
+                const data = JSON.parse(e.data);
+                displayGallery(data.items);
+                const totalPages = Math.max(1, Math.ceil(data.total / pageSize));
+                byId('tally').textContent = `Total: ${data.total} | Page ${page}/${totalPages}`;
+            });
+            
+            statusStream.onerror = () => console.error('Status stream error');
+        }
+        
+        // Fetched pages keyed by cursor. The cache belongs to one query
+        // signature and is dropped whenever run, threshold or page size change.
+        const pageCache = new Map();
+        let pageCacheSig = '';
+        let positivesAbort = null;  // the in-flight page fetch; a newer refresh cancels it
+        
+        function positivesUrl(threshold, pageSize, cursor) {
+            return `/positives?run_id=${currentRunId || 'local'}&threshold=${threshold}&page_size=${pageSize}&cursor=${cursor}`;
+        }
+        
+        function prefetchPage(threshold, pageSize, cursor) {
+            if (cursor == null || pageCache.has(cursor)) return;
+            const sig = pageCacheSig;
+            fetch(positivesUrl(threshold, pageSize, cursor), { cache: 'default' })
+            .then(r => r.json())
+            .then(data => { if (sig === pageCacheSig) pageCache.set(cursor, data); })
+            .catch(() => {});  // a failed prefetch just means a normal fetch later
         }
         
         function refreshResults() {
-            const threshold = parseFloat(document.getElementById('threshold').value);
-            const page = parseInt(document.getElementById('page').value);
-            const pageSize = parseInt(document.getElementById('page-size').value);
+            const threshold = parseFloat(byId('threshold').value);
+            const page = parseInt(byId('page').value);
+            const pageSize = parseInt(byId('page-size').value);
             
-            fetch(`/positives?run_id=${currentRunId || 'local'}&threshold=${threshold}&page=${page}&page_size=${pageSize}`)
-            .then(r => r.json())
-            .then(data => {
+            const sig = `${currentRunId || 'local'}|${threshold}|${pageSize}`;
+            if (sig !== pageCacheSig) {
+                pageCache.clear();
+                pageCacheSig = sig;
+            }
+            const cursor = String((page - 1) * pageSize);
+            if (positivesAbort) positivesAbort.abort();
+            positivesAbort = new AbortController();
+            
+            const render = data => {
                 displayGallery(data.items);
                 const totalPages = Math.max(1, Math.ceil(data.total / pageSize));
-                document.getElementById('tally').textContent = `Total: ${data.total} | Page ${page}/${totalPages}`;
+                byId('tally').textContent = `Total: ${data.total} | Page ${page}/${totalPages}`;
+                prefetchPage(threshold, pageSize, data.next_cursor);
+            };
+            
+            // A cached page renders at once; the fetch below then refreshes it
+            const cached = pageCache.get(cursor);
+            if (cached) render(cached);
+            
+            fetch(positivesUrl(threshold, pageSize, cursor), { cache: 'default', signal: positivesAbort.signal })
+            .then(r => r.json())
+            .then(data => {
+                if (sig !== pageCacheSig) return;
+                pageCache.set(cursor, data);
+                render(data);
             })
-            .catch(err => console.error('Fetch results error:', err));
+            .catch(err => {
+                if (err.name !== 'AbortError') console.error('Fetch results error:', err);
+            });
         }
 
         // Auto-load from local folders on first paint
         document.addEventListener('DOMContentLoaded', () => {
             // Show review panel by default
-            document.getElementById('review-panel').classList.add('visible');
-            document.getElementById('run-id-section').style.display = 'none';
-            refreshResults();
+            byId('review-panel').classList.add('visible');
+            byId('run-id-section').style.display = 'none';
             
-            // Show detection tab by default
+            // Show detection tab by default (this also loads the first page)
             showTab('detection');
         });
         
-        function displayGallery(items) {
-            const gallery = document.getElementById('gallery');
-            
-            if (items.length === 0) {
-                gallery.innerHTML = `
-                    <div class="empty-state">
-                        <i class="fas fa-search"></i>
-                        <p>No detections found at this threshold level.</p>
-                        <small>Try lowering the confidence threshold to see more results.</small>
-                    </div>
-                `;
+        // Keyed reconciliation: reuse the node already rendered for a key, create
+        // nodes only for new keys, drop stale ones, and move a node only when it
+        // is out of place. An unchanged page causes no DOM mutations at all.
+        function reconcileKeyed(container, nodes, items, keyOf, create, update) {
+            const keys = new Set(items.map(keyOf));
+            for (const [key, node] of nodes) {
+                if (!keys.has(key)) {
+                    node.remove();
+                    nodes.delete(key);
+                }
+            }
+            if (!nodes.size) {
+                // Fresh render: build every node off-document, insert them in one go
+                const frag = document.createDocumentFragment();
+                items.forEach((item, i) => {
+                    const node = create(item, i);
+                    node.dataset.key = keyOf(item);
+                    nodes.set(node.dataset.key, node);
+                    frag.appendChild(node);
+                });
+                container.replaceChildren(frag);
                 return;
             }
-            
-            gallery.innerHTML = items.map(item => {
-                const filename = item.tile_id + '.jpg';
-                return `
-                    <div class="result-card" data-filename="${filename}">
-                    <img src="${item.thumb_url}" alt="${item.tile_id}" loading="lazy" onclick="openFullscreen('${item.image_url}', '${item.tile_id}')" style="cursor: pointer;">
+            // Anything unkeyed (e.g. an empty-state message) goes too
+            Array.from(container.children).forEach(child => {
+                if (!nodes.has(child.dataset.key)) child.remove();
+            });
+            items.forEach((item, i) => {
+                const key = keyOf(item);
+                let node = nodes.get(key);
+                if (node) {
+                    update(node, item, i);
+                } else {
+                    node = create(item, i);
+                    node.dataset.key = key;
+                    nodes.set(key, node);
+                }
+                const current = container.children[i];
+                if (current !== node) container.insertBefore(node, current || null);
+            });
+        }
+        
+        // Thumbnails start as the inline LQIP blur; the real thumbnail is only
+        // requested once the image comes within 400px of the viewport
+        const thumbObserver = new IntersectionObserver((entries, observer) => {
+            for (const entry of entries) {
+                if (!entry.isIntersecting) continue;
+                const img = entry.target;
+                observer.unobserve(img);
+                img.src = img.dataset.src;
+                img.removeAttribute('data-src');
+            }
+        }, {rootMargin: '400px'});
+        
+        function setThumb(img, item) {
+            if (!item.lqip) {
+                img.src = item.thumb_url;
+                return;
+            }
+            img.src = item.lqip;
+            img.dataset.src = item.thumb_url;
+            thumbObserver.observe(img);
+        }
+        
+        function setText(el, text) {
+            if (el.textContent !== text) el.textContent = text;
+        }
+        
+        // Gallery windowing: every item gets a fixed-height stub, and a stub is
+        // only filled with its <img> and buttons once it nears the viewport
+        let galleryItems = new Map();  // idx -> item, for the observer callback
+        let galleryObserver = null;
+        const galleryNodes = new Map();  // tile_id -> card (stub or hydrated)
+        const reviewedCards = new Map();  // filename -> 'confirmed' | 'rejected'
+        
+        // Parsed once; hydrating a card is a clone plus a few property writes
+        const cardTemplate = document.createElement('template');
+        cardTemplate.innerHTML = `
+                    <img loading="lazy" decoding="async" fetchpriority="low" width="256" height="160" data-action="open" style="cursor: pointer;">
                     <div class="result-info">
-                            <div class="tile-id">${item.tile_id}</div>
-                            <div class="score">Confidence: ${(item.score * 100).toFixed(1)}%</div>
-                            <div><i class="fas fa-map-marker-alt"></i> ${item.lat.toFixed(5)}, ${item.lon.toFixed(5)}</div>
+                            <div class="tile-id"></div>
+                            <div class="score"></div>
+                            <div><i class="fas fa-map-marker-alt"></i> <span class="coords"></span></div>
                     </div>
                         <div class="detection-actions">
-                            <button class="btn btn-confirm" onclick="confirmImage('${filename}')">
+                            <button class="btn btn-confirm" data-action="confirm">
                                 <i class="fas fa-check"></i>
                                 Confirm
                             </button>
-                            <button class="btn btn-reject" onclick="rejectImage('${filename}')">
+                            <button class="btn btn-reject" data-action="reject">
                                 <i class="fas fa-times"></i>
                                 Reject
                             </button>
-                </div>
+                </div>`;
+        
+        function reviewBadgeHtml(filename) {
+            return reviewedCards.get(filename) === 'confirmed'
+                ? `<div class="confirmed-badge">CONFIRMED</div>`
+                : `<div class="rejected-badge">REJECTED</div>`;
+        }
+        
+        function fillCard(card, item) {
+            setText(card.querySelector('.tile-id'), item.tile_id);
+            setText(card.querySelector('.score'), `Confidence: ${(item.score * 100).toFixed(1)}%`);
+            setText(card.querySelector('.coords'), `${item.lat.toFixed(5)}, ${item.lon.toFixed(5)}`);
+        }
+        
+        function hydrateCard(card, item) {
+            const filename = card.dataset.filename;
+            card.replaceChildren(cardTemplate.content.cloneNode(true));
+            const img = card.querySelector('img');
+            setThumb(img, item);
+            img.alt = item.tile_id;
+            if (reviewedCards.has(filename)) {
+                card.querySelector('.detection-actions').innerHTML = reviewBadgeHtml(filename);
+            }
+            fillCard(card, item);
+            card.classList.remove('placeholder');
+            card.style.height = '';
+        }
+        
+        function hydrateCards(entries, observer) {
+            for (const entry of entries) {
+                if (!entry.isIntersecting) continue;
+                const card = entry.target;
+                const item = galleryItems.get(Number(card.dataset.idx));
+                observer.unobserve(card);
+                if (item) hydrateCard(card, item);
+            }
+        }
+        
+        function displayGallery(items) {
+            const gallery = byId('gallery');
+            
+            if (galleryObserver) galleryObserver.disconnect();
+            galleryItems = new Map(items.map((item, i) => [i, item]));
+            
+            if (items.length === 0) {
+                galleryNodes.clear();
+                gallery.innerHTML = `
+                    <div class="empty-state">
+                        <i class="fas fa-search"></i>
+                        <p>No detections found at this threshold level.</p>
+                        <small>Try lowering the confidence threshold to see more results.</small>
                     </div>
                 `;
-            }).join('');
-        }
+                return;
+            }
+            
+            reconcileKeyed(gallery, galleryNodes, items, item => item.tile_id,
+                (item, i) => {
+                    const card = document.createElement('div');
+                    card.className = 'result-card placeholder';
+                    card.style.height = '260px';
+                    card.dataset.idx = i;
+                    card.dataset.filename = item.tile_id + '.jpg';
+                    return card;
+                },
+                (card, item, i) => {
+                    if (card.dataset.idx !== String(i)) card.dataset.idx = i;
+                    if (!card.classList.contains('placeholder')) fillCard(card, item);
+                });
+            galleryObserver = new IntersectionObserver(hydrateCards, {rootMargin: '200px'});
+            gallery.querySelectorAll('.result-card.placeholder').forEach(card => galleryObserver.observe(card));
+        }
+        
+        // One delegated click handler for the grid instead of handlers per card
+        byId('gallery').addEventListener('click', e => {
+            const target = e.target.closest('[data-action]');
+            const card = target && target.closest('.result-card');
+            if (!card) return;
+            const filename = card.dataset.filename;
+            if (target.dataset.action === 'open') {
+                const item = galleryItems.get(Number(card.dataset.idx));
+                if (item) openFullscreen(item.image_url, item.tile_id);
+            } else if (target.dataset.action === 'confirm') {
+                confirmImage(filename);
+            } else if (target.dataset.action === 'reject') {
+                rejectImage(filename);
+            }
+        });
         
         function exportResults() {
             if (!currentRunId) {
@@ -1717,12 +2632,12 @@ HTML_TEMPLATE = """
                 return;
             }
             
-            const format = document.getElementById('export-format').value;
+            const format = byId('export-format').value;
             fetch(`/export?run_id=${currentRunId}&fmt=${format}`)
             .then(r => r.json())
             .then(data => {
-                document.getElementById('download-url').textContent = data.url;
-                document.getElementById('download-url-section').style.display = 'block';
+                byId('download-url').textContent = data.url;
+                byId('download-url-section').style.display = 'block';
             })
             .catch(err => console.error('Export error:', err));
         }
@@ -1736,9 +2651,10 @@ HTML_TEMPLATE = """
         
         function validateImage(tileId, action) {
             validationData.set(tileId, action);
+            queueValidation(tileId, action);
             
             // Update the visual state of the item
-            const item = document.querySelector(`[data-tile-id="${tileId}"]`);
+            const item = byId('validation-gallery').querySelector(`[data-tile-id="${tileId}"]`);
             item.className = `validation-item ${action}`;
             
             // Update or add status badge
@@ -1760,70 +2676,113 @@ HTML_TEMPLATE = """
         }
         
         function updateValidationStats() {
-            const total = document.querySelectorAll('.validation-item').length;
+            const total = byId('validation-gallery').querySelectorAll('.validation-item').length;
             const verified = validationData.size ? Array.from(validationData.values()).filter(v => v === 'verified').length : 0;
             const rejected = validationData.size ? Array.from(validationData.values()).filter(v => v === 'rejected').length : 0;
             
-            document.getElementById('validation-tally').textContent = 
+            byId('validation-tally').textContent = 
                 `Total: ${total} | Verified: ${verified} | Rejected: ${rejected}`;
         }
         
         // Map Functions
+        // Tiles persist in IndexedDB for a week when the PouchDB cache plugin loaded
+        const TILE_CACHE_OPTIONS = { useCache: true, crossOrigin: true, cacheMaxAge: 7 * 24 * 3600 * 1000 };
+        const GALAPAGOS_BOUNDS = [[-1.5, -92.1], [0.7, -89.2]];
+        
         function initializeMap() {
             // Initialize map centered on Galápagos Islands with base layer control
             const osm = L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
+                ...TILE_CACHE_OPTIONS,
                 maxZoom: 19,
                 attribution: '© OpenStreetMap contributors'
             });
             const esri = L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}', {
+                ...TILE_CACHE_OPTIONS,
                 maxZoom: 19,
                 attribution: 'Tiles © Esri'
             });
-            map = L.map('map', { layers: [osm] }).setView([-0.5, -90.5], 10);
+            dotIcon = L.divIcon({ className: 'tortoise-dot', iconSize: [12, 12] });
+            // Canvas for vector overlays; the divIcon markers stay plain DOM
+            map = L.map('map', { layers: [osm], preferCanvas: true });
+            // Pre-warm the overview zooms once per browser; deeper zooms are
+            // cached as they are viewed (tile servers frown on bulk seeding)
+            map.once('load', () => {
+                if (typeof osm.seed === 'function' && !localStorage.getItem('tilesSeeded')) {
+                    osm.seed(L.latLngBounds(GALAPAGOS_BOUNDS), 10, 11);
+                    localStorage.setItem('tilesSeeded', '1');
+                }
+            });
+            map.setView([-0.5, -90.5], 10);
             L.control.layers({ 'OSM': osm, 'Satellite': esri }).addTo(map);
+            // Only visible clusters become DOM elements; plain group if the plugin didn't load
+            markerGroup = (L.markerClusterGroup
+                ? L.markerClusterGroup({ chunkedLoading: true, chunkInterval: 100, disableClusteringAtZoom: 16 })
+                : L.featureGroup()).addTo(map);
 
+            // No GPS load here: showTab loads on the tab's first visit
             resetPreview();
-            loadConfirmedLocations();
         }
         
+        // Tab switch and GPS load both want a resize pass; run one per frame at most
+        let mapSizeDirty = false;
+        function scheduleInvalidateSize() {
+            if (mapSizeDirty) return;
+            mapSizeDirty = true;
+            requestAnimationFrame(() => {
+                mapSizeDirty = false;
+                if (map) map.invalidateSize({ pan: false, debounceMoveend: true });
+            });
+        }
+        
+        const MARKER_CHUNK = 200;
+        let gpsLoad = 0;  // bumped per load so an older load's chunks stop
+        let gpsAbort = null;  // cancels an older load's fetch
+
         async function loadGpsData() {
             if (!map) return;
+            const load = ++gpsLoad;
+            if (gpsAbort) gpsAbort.abort();
+            gpsAbort = new AbortController();
 
             resetPreview();
 
             // Clear previous markers
-            if (verifiedMarkers.length) {
-                verifiedMarkers.forEach(marker => marker.remove());
-                verifiedMarkers = [];
-            }
+            markerGroup.clearLayers();
 
             try {
-                const r = await fetch('/gps_data');
-                const { points = [] } = await r.json();
-                const valid = points.filter(p => Number.isFinite(p.lat) && Number.isFinite(p.lon));
+                // Keyed per run so the browser cache can't serve another run's points
+                const r = await fetch(`/gps_data.bin?v=${currentRunId || 'local'}`, { cache: 'default', signal: gpsAbort.signal });
+                if (!r.ok) throw new Error(`HTTP ${r.status}`);
+                const summary = await summarizeGpsAsync(await r.arrayBuffer());
+                const valid = summary.valid;
 
+                if (load !== gpsLoad) return;
                 currentGpsPoints = valid;
 
                 if (valid.length) {
-                    const markers = valid
-                        .map(createMarker)
-                        .filter(Boolean);
-
-                    if (markers.length) {
-                        const group = L.featureGroup(markers);
-                        const bounds = group.getBounds();
-                        if (bounds.isValid()) {
-                            map.fitBounds(bounds.pad(0.2));
-                        }
+                    const bounds = L.latLngBounds(valid.map(p => [p.lat, p.lon]));
+                    if (bounds.isValid()) {
+                        map.fitBounds(bounds.pad(0.2));
                     }
-                    updateMapStats(valid);
+                    // Build markers a chunk per frame so big sets don't block the page
+                    const addChunk = start => {
+                        if (load !== gpsLoad) return;
+                        const end = Math.min(start + MARKER_CHUNK, valid.length);
+                        addMarkers(valid.slice(start, end).map(createMarker).filter(Boolean));
+                        if (end < valid.length) {
+                            requestAnimationFrame(() => addChunk(end));
+                        }
+                    };
+                    renderMapStats(summary);
+                    addChunk(0);
                 } else {
                     updateMapStats([]);
                     map.setView([-0.56, -91.55], 11);
                 }
 
-                setTimeout(() => map.invalidateSize(), 60);
+                scheduleInvalidateSize();
             } catch (err) {
+                if (err.name === 'AbortError') return;  // a newer load owns the map now
                 console.error('Error loading GPS data:', err);
                 updateMapStats([]);
                 map.setView([-0.56, -91.55], 10);
@@ -1831,6 +2790,14 @@ HTML_TEMPLATE = """
             }
         }
         
+        function addMarkers(markers) {
+            if (markerGroup.addLayers) {
+                markerGroup.addLayers(markers);
+            } else {
+                markers.forEach(marker => markerGroup.addLayer(marker));
+            }
+        }
+        
         function loadConfirmedLocations() {
             loadGpsData();
         }
@@ -1842,7 +2809,7 @@ HTML_TEMPLATE = """
             ];
 
             currentGpsPoints = mockLocations;
-            mockLocations.forEach(point => createMarker(point));
+            addMarkers(mockLocations.map(createMarker).filter(Boolean));
             updateMapStats(mockLocations);
         }
 
@@ -1854,133 +2821,258 @@ HTML_TEMPLATE = """
             }
         }
 
-        function updateMapStats(points = currentGpsPoints) {
-            const verifiedEl = document.getElementById('verified-count');
-            const cameraEl = document.getElementById('camera-count');
-            const dateRangeEl = document.getElementById('date-range');
-
-            const total = points.length;
-            if (verifiedEl) verifiedEl.textContent = total;
-
+        // Finite-coordinate filter plus camera/date aggregation in one pass.
+        // Runs in the GPS worker (see getGpsWorker), or inline as a fallback.
+        // Layout from pack_gps: u32 count, count x (f32 lat, f32 lon, u32 offset, u32 length), names
+        function decodeGpsPoints(buf) {
+            const dv = new DataView(buf);
+            const count = dv.getUint32(0, true);
+            const namesStart = 4 + count * 16;
+            const bytes = new Uint8Array(buf, namesStart);
+            const decoder = new TextDecoder();
+            const names = decoder.decode(bytes);
+            // All-ASCII names: byte offsets are string offsets, so one decode serves every record
+            const ascii = names.length === bytes.length;
+            const points = new Array(count);
+            for (let i = 0, o = 4; i < count; i++, o += 16) {
+                const start = dv.getUint32(o + 8, true);
+                const len = dv.getUint32(o + 12, true);
+                const name = ascii ? names.substr(start, len) : decoder.decode(bytes.subarray(start, start + len));
+                const dot = name.lastIndexOf('.');
+                points[i] = {
+                    lat: dv.getFloat32(o, true),
+                    lon: dv.getFloat32(o + 4, true),
+                    tile_id: dot > 0 ? name.slice(0, dot) : name,
+                    image_url: `/local_image/${encodeURIComponent(name)}`
+                };
+            }
+            return points;
+        }
+        
+        function summarizeGps(points) {
+            const valid = points.filter(p => Number.isFinite(p.lat) && Number.isFinite(p.lon));
+            // ISO dates compare correctly as strings
             const cameras = new Set();
-            const dates = [];
-            points.forEach(point => {
-                const info = parseTileMeta(point.tile_id);
+            let dateMin = null;
+            let dateMax = null;
+            valid.forEach(point => {
+                const info = point.meta || (point.meta = parseTileMeta(point.tile_id));
                 if (info.camera) cameras.add(info.camera);
-                if (info.date) dates.push(info.date.replace(/-/g, ''));
+                if (info.date) {
+                    if (dateMin === null || info.date < dateMin) dateMin = info.date;
+                    if (dateMax === null || info.date > dateMax) dateMax = info.date;
+                }
+            });
+            return { valid, cameras: cameras.size, dateMin, dateMax };
+        }
+        
+        // A worker assembled from the functions above, so the source lives in one place
+        let gpsWorker = null;  // false once creating one has failed
+        let gpsWorkerSeq = 0;
+        
+        function getGpsWorker() {
+            if (gpsWorker === null) {
+                try {
+                    const src = [isDigits, firstDigitRun, computeTileMeta, decodeGpsPoints, summarizeGps].join('\\n') +
+                        '\\nconst parseTileMeta = computeTileMeta;' +
+                        '\\nonmessage = e => postMessage({ id: e.data.id, ...summarizeGps(decodeGpsPoints(e.data.buf)) });';
+                    gpsWorker = new Worker(URL.createObjectURL(new Blob([src], { type: 'text/javascript' })));
+                } catch (err) {
+                    console.warn('GPS worker unavailable, summarizing on the main thread:', err);
+                    gpsWorker = false;
+                }
+            }
+            return gpsWorker;
+        }
+        
+        // Takes the raw /gps_data.bin body; the worker decodes it as well as summarizing
+        function summarizeGpsAsync(buf) {
+            const worker = getGpsWorker();
+            if (!worker) return Promise.resolve(summarizeGps(decodeGpsPoints(buf)));
+            const id = ++gpsWorkerSeq;
+            return new Promise(resolve => {
+                const done = e => {
+                    if (e.type === 'message' && e.data.id !== id) return;
+                    worker.removeEventListener('message', done);
+                    worker.removeEventListener('error', done);
+                    resolve(e.type === 'message' ? e.data : summarizeGps(decodeGpsPoints(buf)));
+                };
+                worker.addEventListener('message', done);
+                worker.addEventListener('error', done);
+                // Cloned rather than transferred, so the inline fallback can still read it
+                worker.postMessage({ id, buf });
             });
+        }
+        
+        function updateMapStats(points = currentGpsPoints) {
+            renderMapStats(summarizeGps(points));
+        }
+        
+        function renderMapStats(summary) {
+            const verifiedEl = byId('verified-count');
+            const cameraEl = byId('camera-count');
+            const dateRangeEl = byId('date-range');
+
+            if (verifiedEl) verifiedEl.textContent = summary.valid.length;
 
             if (cameraEl) {
-                cameraEl.textContent = cameras.size || 0;
+                cameraEl.textContent = summary.cameras || 0;
             }
 
             if (dateRangeEl) {
-                if (dates.length) {
-                    const sorted = dates.sort();
-                    const format = (val) => `${val.slice(0,4)}-${val.slice(4,6)}-${val.slice(6,8)}`;
-                    dateRangeEl.textContent = `${format(sorted[0])} - ${format(sorted[sorted.length - 1])}`;
+                if (summary.dateMin !== null) {
+                    dateRangeEl.textContent = `${summary.dateMin} - ${summary.dateMax}`;
                 } else {
                     dateRangeEl.textContent = 'No data';
                 }
             }
         }
         
-        // Detection Confirm/Reject Functions
-        function confirmImage(filename) {
-            fetch('/confirm_image', {
+        // Review decisions are queued and sent together: a burst of clicks
+        // becomes one POST instead of one round trip per image
+        const REVIEW_FLUSH_MS = 300;
+        let pendingReviews = [];      // {filename, action: 'confirm' | 'reject'}
+        let pendingValidations = [];  // {tile_id, action: 'verified' | 'rejected'}
+        let reviewTimer = null;
+        let validationTimer = null;
+        
+        function postJson(url, body) {
+            return fetch(url, {
                 method: 'POST',
                 headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({filename: filename})
-            })
-            .then(r => r.json())
-            .then(data => {
-                if (data.success) {
-                    // Update the card to show confirmed state
-                    const card = document.querySelector(`[data-filename="${filename}"]`);
-                    if (card) {
-                        card.querySelector('.detection-actions').innerHTML = `
-                            <div class="confirmed-badge">CONFIRMED</div>
-                        `;
-                        card.style.borderColor = 'var(--success)';
-                        card.style.boxShadow = '0 0 0 3px rgb(16 185 129 / 0.1)';
-                    }
-                    console.log(`Image ${filename} confirmed and copied to confirmed folder`);
-                    
-                    // Refresh validation tab if it's active
-                    if (document.getElementById('validation-tab').classList.contains('active')) {
-                        loadValidationImagesScoped();
-                    }
-                } else {
-                    alert('Failed to confirm image: ' + data.message);
-                }
-            })
-            .catch(err => {
-                console.error('Confirm error:', err);
-                alert('Error confirming image');
+                body: JSON.stringify(body)
             });
         }
         
+        // Detection Confirm/Reject Functions
+        function confirmImage(filename) {
+            queueReview(filename, 'confirm');
+        }
+        
         function rejectImage(filename) {
-            fetch('/reject_image', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({filename: filename})
-            })
+            queueReview(filename, 'reject');
+        }
+        
+        function queueReview(filename, action) {
+            pendingReviews.push({filename, action});
+            clearTimeout(reviewTimer);
+            reviewTimer = setTimeout(flushReviews, REVIEW_FLUSH_MS);
+        }
+        
+        function flushReviews() {
+            reviewTimer = null;
+            if (!pendingReviews.length) return;
+            const items = pendingReviews;
+            pendingReviews = [];
+            
+            postJson('/confirm_batch', {items})
             .then(r => r.json())
             .then(data => {
-                if (data.success) {
-                    // Update the card to show rejected state
-                    const card = document.querySelector(`[data-filename="${filename}"]`);
-                    if (card) {
-                        card.querySelector('.detection-actions').innerHTML = `
-                            <div class="rejected-badge">REJECTED</div>
-                        `;
-                        card.style.borderColor = 'var(--error)';
-                        card.style.boxShadow = '0 0 0 3px rgb(239 68 68 / 0.1)';
-                        card.style.opacity = '0.6';
+                let confirmed = false;
+                data.results.forEach(res => {
+                    if (!res.success) {
+                        alert(`Failed to ${res.action} image: ${res.message}`);
+                    } else if (res.action === 'confirm') {
+                        markConfirmed(res.filename);
+                        confirmed = true;
+                    } else {
+                        markRejected(res.filename);
+                    }
+                });
+                
+                if (confirmed) {
+                    // Refresh validation tab if it's active; otherwise have the
+                    // validation and map tabs reload on their next visit
+                    if (byId('validation-tab').classList.contains('active')) {
+                        loadValidationImagesScoped();
+                    } else {
+                        delete byId('validation-tab').dataset.loaded;
+                        delete byId('map-tab').dataset.loaded;
                     }
-                    console.log(`Image ${filename} rejected and moved to negative folder`);
-                } else {
-                    alert('Failed to reject image: ' + data.message);
                 }
             })
             .catch(err => {
-                console.error('Reject error:', err);
-                alert('Error rejecting image');
+                console.error('Review error:', err);
+                alert('Error saving review decisions');
             });
         }
         
+        function markConfirmed(filename) {
+            // Update the card to show confirmed state
+            reviewedCards.set(filename, 'confirmed');
+            const card = byId('gallery').querySelector(`[data-filename="${filename}"]`);
+            if (card) {
+                const actions = card.querySelector('.detection-actions');
+                if (actions) actions.innerHTML = reviewBadgeHtml(filename);
+                card.style.borderColor = 'var(--success)';
+                card.style.boxShadow = '0 0 0 3px rgb(16 185 129 / 0.1)';
+            }
+            console.log(`Image ${filename} confirmed and copied to confirmed folder`);
+        }
+        
+        function markRejected(filename) {
+            // Update the card to show rejected state
+            reviewedCards.set(filename, 'rejected');
+            const card = byId('gallery').querySelector(`[data-filename="${filename}"]`);
+            if (card) {
+                const actions = card.querySelector('.detection-actions');
+                if (actions) actions.innerHTML = reviewBadgeHtml(filename);
+                card.style.borderColor = 'var(--error)';
+                card.style.boxShadow = '0 0 0 3px rgb(239 68 68 / 0.1)';
+                card.style.opacity = '0.6';
+            }
+            pageCache.clear();  // later pages shift up by one
+            console.log(`Image ${filename} rejected and moved to negative folder`);
+        }
+        
+        function queueValidation(tileId, action) {
+            pendingValidations.push({tile_id: tileId, action});
+            clearTimeout(validationTimer);
+            validationTimer = setTimeout(flushValidations, REVIEW_FLUSH_MS);
+        }
+        
+        function flushValidations() {
+            validationTimer = null;
+            if (!pendingValidations.length) return;
+            const items = pendingValidations;
+            pendingValidations = [];
+            postJson('/validate_batch', {items})
+            .catch(err => console.error('Validation sync error:', err));
+        }
+        
+        // Anything still queued when the page goes away is sent as a beacon
+        window.addEventListener('beforeunload', () => {
+            const beacon = (url, items) => items.length &&
+                navigator.sendBeacon(url, new Blob([JSON.stringify({items})], {type: 'application/json'}));
+            beacon('/confirm_batch', pendingReviews);
+            beacon('/validate_batch', pendingValidations);
+        });
+        
         // Full-screen Image Functions
         let currentImageData = [];
         let currentImageIndex = 0;
         
         function openFullscreen(imageUrl, tileId) {
-            // Get all current images for navigation
-            const gallery = document.getElementById('gallery');
-            const cards = gallery.querySelectorAll('.result-card');
-            currentImageData = Array.from(cards).map(card => {
-                const img = card.querySelector('img');
-                const tileIdEl = card.querySelector('.tile-id');
-                return {
-                    imageUrl: img.src,
-                    tileId: tileIdEl.textContent,
-                    filename: card.dataset.filename
-                };
-            });
+            // Navigate over the whole page, not just the cards mounted so far
+            currentImageData = Array.from(galleryItems.values()).map(item => ({
+                imageUrl: item.image_url,
+                tileId: item.tile_id,
+                filename: item.tile_id + '.jpg'
+            }));
             
             // Find current image index
             currentImageIndex = currentImageData.findIndex(item => item.tileId === tileId);
             if (currentImageIndex === -1) currentImageIndex = 0;
             
             showFullscreenImage();
-            document.getElementById('fullscreen-modal').style.display = 'block';
+            byId('fullscreen-modal').style.display = 'block';
             
             // Add keyboard navigation
             document.addEventListener('keydown', handleKeyboardNavigation);
         }
         
         function closeFullscreen() {
-            document.getElementById('fullscreen-modal').style.display = 'none';
+            byId('fullscreen-modal').style.display = 'none';
             document.removeEventListener('keydown', handleKeyboardNavigation);
         }
         
@@ -1988,8 +3080,8 @@ HTML_TEMPLATE = """
             const currentImage = currentImageData[currentImageIndex];
             if (!currentImage) return;
             
-            document.getElementById('fullscreen-image').src = currentImage.imageUrl;
-            document.getElementById('fullscreen-title').textContent = currentImage.tileId;
+            byId('fullscreen-image').src = currentImage.imageUrl;
+            byId('fullscreen-title').textContent = currentImage.tileId;
             
             // Update navigation buttons
             document.querySelector('.nav-prev').disabled = currentImageIndex === 0;
@@ -2058,12 +3150,12 @@ HTML_TEMPLATE = """
         }
         
         // Event listeners
-        document.getElementById('page').addEventListener('change', refreshResults);
-        document.getElementById('page-size').addEventListener('change', refreshResults);
-        document.getElementById('validation-filter').addEventListener('change', loadValidationImagesScoped);
+        byId('page').addEventListener('change', refreshResults);
+        byId('page-size').addEventListener('change', refreshResults);
+        byId('validation-filter').addEventListener('change', loadValidationImagesScoped);
 
         function downloadGPSData() {
-            fetch('/gps_data')
+            fetch(`/gps_data?v=${currentRunId || 'local'}`, { cache: 'default' })
                 .then(response => response.json())
                 .then(data => {
                     const gpxData = convertToGPX(data.points);
@@ -2100,13 +3192,184 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Standalone pages, linked from the main UI
+VALIDATION_HTML = """<!DOCTYPE html><html><head><meta charset='utf-8'><meta name='viewport' content='width=device-width, initial-scale=1'>
+            <title>Tortoise Finder – Validation</title>
+            <link rel='stylesheet' href='https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/css/all.min.css'>
+            <style>
+                body{font-family: -apple-system, BlinkMacSystemFont, 'Inter', Segoe UI, Roboto, Helvetica, Arial, sans-serif; margin: 0; padding: 24px; background:#f6f7fb;}
+                .page{max-width:1200px; margin:0 auto;}
+                h1{margin:0 0 16px 0; color:#0f766e}
+                .gallery{display:grid; grid-template-columns:repeat(auto-fill,minmax(220px,1fr)); gap:12px; width:100%; min-height:320px}
+                .card{background:#fff; border:1px solid #e5e7eb; border-radius:12px; overflow:hidden}
+                .card img{width:100%; height:200px; object-fit:cover; display:block}
+                .actions{display:flex; gap:8px; padding:10px; justify-content:center}
+                .btn{border:none; color:#fff; padding:8px 12px; border-radius:8px; cursor:pointer}
+                .verify{background:#10b981}
+                .reject{background:#ef4444}
+            </style></head><body>
+            <div class='page'>
+                <h1>Validation_</h1>
+                <div id='validation-gallery' class='gallery'></div>
+            </div>
+            <script>
+                async function load(){
+                    try{
+                        const r = await fetch('/validation_images?page=1&page_size=100');
+                        const {items=[]} = await r.json();
+                        const g = document.getElementById('validation-gallery');
+                        if(!items.length){ g.innerHTML = '<div>No images available.</div>'; return; }
+                        g.innerHTML = items.map(it=>`<div class="card" data-tile-id="${it.tile_id}"><img src="${it.thumb_url}" alt="${it.tile_id}"><div class="actions"><button class="btn verify" data-action="verify">Verify</button><button class="btn reject" data-action="reject">Reject</button></div></div>`).join('');
+                    }catch(e){ console.error('validation load error', e); }
+                }
+                // One delegated listener for every card's buttons
+                document.getElementById('validation-gallery').addEventListener('click', e => {
+                    const btn = e.target.closest('button[data-action]');
+                    if (btn) console.log(btn.dataset.action, btn.closest('.card').dataset.tileId);
+                });
+                load();
+            </script>
+            </body></html>"""
+
+MAP_HTML = """<!DOCTYPE html><html><head><meta charset='utf-8'><meta name='viewport' content='width=device-width, initial-scale=1'>
+            <title>Tortoise Finder – GPS Map</title>
+            <link rel='stylesheet' href='https://unpkg.com/leaflet@1.9.4/dist/leaflet.css'>
+            <style>
+                html,body{height:100%; margin:0}
+                #map{height:600px; min-height:400px; width:100%}
+                .page{max-width:1200px; margin:0 auto; padding:24px}
+                h1{margin:0 0 16px 0; color:#0f766e; font-family: -apple-system, BlinkMacSystemFont, 'Inter', Segoe UI, Roboto, Helvetica, Arial, sans-serif}
+            </style></head><body>
+            <div class='page'>
+                <h1>GPS Map</h1>
+                <div id='map'></div>
+            </div>
+            <script src='https://unpkg.com/leaflet@1.9.4/dist/leaflet.js'></script>
+            <script>
+                let map;
+                async function init(){
+                    map = L.map('map').setView([-0.6, -90.4], 9);
+                    L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', { attribution: '© OpenStreetMap contributors' }).addTo(map);
+                    try{
+                        const r = await fetch('/gps_data');
+                        const {points=[]} = await r.json();
+                        const valid = points.filter(p => Number.isFinite(p.lat) && Number.isFinite(p.lon));
+                        if(valid.length){
+                            const markers = valid.map(p => L.marker([p.lat, p.lon]));
+                            const fg = L.featureGroup(markers).addTo(map);
+                            map.fitBounds(fg.getBounds().pad(0.2));
+                        }
+                        setTimeout(()=> map.invalidateSize && map.invalidateSize(), 0);
+                    }catch(e){ console.error('gps load error', e); }
+                }
+                init();
+            </script>
+            </body></html>"""
+
+def static_page(html):
+    """(body, gzipped body, ETag) for an HTML page that never changes while the server runs."""
+    body = html.encode('utf-8')
+    return body, gzip.compress(body, compresslevel=9), f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+# Encode, compress and tag each page once at import
+INDEX_PAGE = static_page(HTML_TEMPLATE)
+VALIDATION_PAGE = static_page(VALIDATION_HTML)
+MAP_PAGE = static_page(MAP_HTML)
+
+DOWNLOAD_TYPES = {
+    '.geojson': 'application/geo+json',
+    '.csv': 'text/csv',
+    '.gpx': 'application/gpx+xml',
+    '.kml': 'application/vnd.google-earth.kml+xml',
+}
+
 class TortoiseHandler(http.server.SimpleHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/' or self.path == '/index.html':
+    def setup(self):
+        super().setup()
+        # Responses are written as a few large chunks; don't let Nagle hold the tail
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _send_file(self, path, content_type, cache_control, attachment=None):
+        """Send a file body with zero-copy sendfile (socket.sendfile falls back to read/send).
+
+        `attachment` names the file for a Content-Disposition download.
+        A matching If-None-Match gets a 304 without the body being read.
+        """
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_response(404)
+            self.end_headers()
+            return
+        with f:
+            st = os.fstat(f.fileno())
+            size = st.st_size
+            etag = f'W/"{size:x}-{st.st_mtime_ns:x}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', cache_control)
+                self.end_headers()
+                return
             self.send_response(200)
-            self.send_header('Content-type', 'text/html')
+            self.send_header('Content-type', content_type)
+            self.send_header('Content-Length', str(size))
+            self.send_header('Cache-Control', cache_control)
+            self.send_header('ETag', etag)
+            if attachment:
+                self.send_header('Content-Disposition', f'attachment; filename="{attachment}"')
             self.end_headers()
-            self.wfile.write(HTML_TEMPLATE.encode())
+            self.connection.sendfile(f, 0, size)
+
+    def _send_json(self, obj, status=200, etag=False):
+        self._send_body(dumps_json(obj), 'application/json', status, etag)
+
+    def _send_body(self, body, content_type, status=200, etag=False):
+        # Weak validator: it names the payload, whichever encoding goes out
+        tag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"' if etag else None
+        if tag and self.headers.get('If-None-Match') == tag:
+            self.send_response(304)
+            self.send_header('ETag', tag)
+            self.end_headers()
+            return
+        body, encoding = compress_body(body, self.headers.get('Accept-Encoding', ''))
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if tag:
+            # Revalidate every time: the folders change as images are reviewed
+            self.send_header('ETag', tag)
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_page(self, page):
+        """Send a static_page() triple, answering 304 on a matching ETag."""
+        body, gz, etag = page
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = gz if use_gzip else body
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', 'public, max-age=3600')
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/' or self.path == '/index.html':
+            self._send_page(INDEX_PAGE)
         elif self.path.startswith('/status/'):
             # GET /status/{run_id}
             run_id = self.path.split('/')[-1]
@@ -2115,12 +3378,35 @@ class TortoiseHandler(http.server.SimpleHTTPRequestHandler):
                 'progress_pct': 100.0,
                 'eta_s': None
             }
+            self._send_json(response)
+        elif self.path.startswith('/events/'):
+            # GET /events/{run_id}?threshold=...&page=...&page_size=...
+            # Server-sent events in place of status polling. Demo runs finish
+            # immediately, so the stream is the page of positives the run
+            # produced, then the terminal status (after which the client closes).
+            parsed = urllib.parse.urlparse(self.path)
+            params = urllib.parse.parse_qs(parsed.query)
+            threshold = float(params.get('threshold', ['0.8'])[0])
+            page = int(params.get('page', ['1'])[0])
+            page_size = int(params.get('page_size', ['40'])[0])
+            
+            status = {'state': 'completed', 'progress_pct': 100.0, 'eta_s': None}
+            positives = positives_page(threshold, page, page_size)
+            body = (b'event: positives\ndata: ' + dumps_json(positives) + b'\n\n'
+                    + b'event: status\ndata: ' + dumps_json(status) + b'\n\n')
+            # The whole stream is known up front, so it can be compressed like any body
+            body, encoding = compress_body(body, self.headers.get('Accept-Encoding', ''))
             self.send_response(200)
-            self.send_header('Content-type', 'application/json')
+            self.send_header('Content-type', 'text/event-stream')
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Vary', 'Accept-Encoding')
             self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(body)
         elif self.path.startswith('/positives'):
-            # GET /positives?run_id=...&threshold=...&page=...&page_size=...
+            # GET /positives?run_id=...&threshold=...&page=...&page_size=...[&cursor=...]
             parsed = urllib.parse.urlparse(self.path)
             params = urllib.parse.parse_qs(parsed.query)
             
@@ -2128,44 +3414,10 @@ class TortoiseHandler(http.server.SimpleHTTPRequestHandler):
             threshold = float(params.get('threshold', ['0.8'])[0])
             page = int(params.get('page', ['1'])[0])
             page_size = int(params.get('page_size', ['40'])[0])
+            cursor = params.get('cursor', [None])[0]
             
-            # Use images from positive folder for detection results
-            positive_images = get_local_images(POSITIVE_PATH, limit=100)
-            if positive_images:
-                all_results = positive_images
-            else:
-                all_results = generate_results()
-            
-            # Filter by threshold
-            filtered = [r for r in all_results if r['score'] >= threshold]
-            filtered.sort(key=lambda x: x['score'], reverse=True)
-            
-            # Paginate
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            page_results = filtered[start_idx:end_idx]
-            
-            # Convert to API format
-            items = []
-            for r in page_results:
-                items.append({
-                    'tile_id': r['tile_id'],
-                    'image_url': r['thumb_url'],
-                    'thumb_url': r['thumb_url'],
-                    'lat': r['lat'],
-                    'lon': r['lon'],
-                    'score': r['score']
-                })
-            
-            response = {
-                'items': items,
-                'total': len(filtered)
-            }
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            response = positives_page(threshold, page, page_size, cursor)
+            self._send_json(response, etag=True)
         elif self.path.startswith('/export'):
             # GET /export?run_id=...&fmt=...
             parsed = urllib.parse.urlparse(self.path)
@@ -2236,13 +3488,16 @@ class TortoiseHandler(http.server.SimpleHTTPRequestHandler):
             # Return download URL (in real system this would be a presigned S3 URL)
             response = {'url': f'http://localhost:8080/download/{filename}'}
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self._send_json(response)
         elif self.path.startswith('/local_image/'):
             # Serve local images from positive or confirmed folders
-            filename = self.path.split('/')[-1]
+            parsed = urllib.parse.urlparse(self.path)
+            filename = os.path.basename(urllib.parse.unquote(parsed.path))
+            query = urllib.parse.parse_qs(parsed.query)
+            # ?thumb=1 is the gallery's 256px card; ?w=N picks another width
+            width = thumb_width(int(query['w'][0])) if query.get('w', [''])[0].isdigit() else None
+            if width is None and query.get('thumb') == ['1']:
+                width = THUMB_SIZE[0]
             image_path = os.path.join(POSITIVE_PATH, filename)
             
             if not os.path.exists(image_path):
@@ -2250,17 +3505,12 @@ class TortoiseHandler(http.server.SimpleHTTPRequestHandler):
                 image_path = os.path.join(CONFIRMED_PATH, filename)
             
             if os.path.exists(image_path):
-                try:
-                    with open(image_path, 'rb') as f:
-                        content = f.read()
-                    self.send_response(200)
-                    self.send_header('Content-type', 'image/jpeg')
-                    self.send_header('Cache-Control', 'max-age=3600')
-                    self.end_headers()
-                    self.wfile.write(content)
-                except Exception as e:
-                    self.send_response(500)
-                    self.end_headers()
+                thumb_path = ensure_thumbnail(image_path, width) if width else None
+                if thumb_path:
+                    self._send_file(thumb_path, 'image/jpeg', 'public, max-age=86400')
+                else:
+                    content_type = IMAGE_CONTENT_TYPES.get(os.path.splitext(filename)[1].lower(), 'application/octet-stream')
+                    self._send_file(image_path, content_type, 'public, max-age=86400')
             else:
                 self.send_response(404)
                 self.end_headers()
@@ -2273,148 +3523,38 @@ class TortoiseHandler(http.server.SimpleHTTPRequestHandler):
             page_size = int(params.get('page_size', ['20'])[0])
             
             # Get images from confirmed folder for validation tab
-            all_images = get_local_images(CONFIRMED_PATH, limit=200)
+            columns = get_image_columns(CONFIRMED_PATH, limit=200)
+            total = len(columns['tile_id'])
             
             # Paginate
             start_idx = (page - 1) * page_size
             end_idx = start_idx + page_size
-            page_images = all_images[start_idx:end_idx]
+            page_images = add_lqip(image_rows(columns, range(start_idx, min(end_idx, total))), CONFIRMED_PATH)
             
             response = {
                 'items': page_images,
-                'total': len(all_images),
+                'total': total,
                 'page': page,
                 'page_size': page_size
             }
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self._send_json(response, etag=True)
         elif self.path == '/validation':
-            html = """<!DOCTYPE html><html><head><meta charset='utf-8'><meta name='viewport' content='width=device-width, initial-scale=1'>
-            <title>Tortoise Finder – Validation</title>
-            <link rel='stylesheet' href='https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/css/all.min.css'>
-            <style>
-                body{font-family: -apple-system, BlinkMacSystemFont, 'Inter', Segoe UI, Roboto, Helvetica, Arial, sans-serif; margin: 0; padding: 24px; background:#f6f7fb;}
-                .page{max-width:1200px; margin:0 auto;}
-                h1{margin:0 0 16px 0; color:#0f766e}
-                .gallery{display:grid; grid-template-columns:repeat(auto-fill,minmax(220px,1fr)); gap:12px; width:100%; min-height:320px}
-                .card{background:#fff; border:1px solid #e5e7eb; border-radius:12px; overflow:hidden}
-                .card img{width:100%; height:200px; object-fit:cover; display:block}
-                .actions{display:flex; gap:8px; padding:10px; justify-content:center}
-                .btn{border:none; color:#fff; padding:8px 12px; border-radius:8px; cursor:pointer}
-                .verify{background:#10b981}
-                .reject{background:#ef4444}
-            </style></head><body>
-            <div class='page'>
-                <h1>Validation_</h1>
-                <div id='validation-gallery' class='gallery'></div>
-            </div>
-            <script>
-                async function load(){
-                    try{
-                        const r = await fetch('/validation_images?page=1&page_size=100');
-                        const {items=[]} = await r.json();
-                        const g = document.getElementById('validation-gallery');
-                        if(!items.length){ g.innerHTML = '<div>No images available.</div>'; return; }
-                        g.innerHTML = items.map(it=>`<div class="card"><img src="${it.thumb_url}" alt="${it.tile_id}"><div class="actions"><button class="btn verify" onclick="console.log('verify', '${it.tile_id}')">Verify</button><button class="btn reject" onclick="console.log('reject', '${it.tile_id}')">Reject</button></div></div>`).join('');
-                    }catch(e){ console.error('validation load error', e); }
-                }
-                load();
-            </script>
-            </body></html>"""
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(html.encode('utf-8'))
+            self._send_page(VALIDATION_PAGE)
         elif self.path == '/map':
-            html = """<!DOCTYPE html><html><head><meta charset='utf-8'><meta name='viewport' content='width=device-width, initial-scale=1'>
-            <title>Tortoise Finder – GPS Map</title>
-            <link rel='stylesheet' href='https://unpkg.com/leaflet@1.9.4/dist/leaflet.css'>
-            <style>
-                html,body{height:100%; margin:0}
-                #map{height:600px; min-height:400px; width:100%}
-                .page{max-width:1200px; margin:0 auto; padding:24px}
-                h1{margin:0 0 16px 0; color:#0f766e; font-family: -apple-system, BlinkMacSystemFont, 'Inter', Segoe UI, Roboto, Helvetica, Arial, sans-serif}
-            </style></head><body>
-            <div class='page'>
-                <h1>GPS Map</h1>
-                <div id='map'></div>
-            </div>
-            <script src='https://unpkg.com/leaflet@1.9.4/dist/leaflet.js'></script>
-            <script>
-                let map;
-                async function init(){
-                    map = L.map('map').setView([-0.6, -90.4], 9);
-                    L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', { attribution: '© OpenStreetMap contributors' }).addTo(map);
-                    try{
-                        const r = await fetch('/gps_data');
-                        const {points=[]} = await r.json();
-                        const valid = points.filter(p => Number.isFinite(p.lat) && Number.isFinite(p.lon));
-                        if(valid.length){
-                            const markers = valid.map(p => L.marker([p.lat, p.lon]));
-                            const fg = L.featureGroup(markers).addTo(map);
-                            map.fitBounds(fg.getBounds().pad(0.2));
-                        }
-                        setTimeout(()=> map.invalidateSize && map.invalidateSize(), 0);
-                    }catch(e){ console.error('gps load error', e); }
-                }
-                init();
-            </script>
-            </body></html>"""
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(html.encode('utf-8'))
-        elif self.path == '/gps_data':
-            # GET /gps_data - return GPS coordinates from confirmed images
-            points = []
-            for fp in glob.glob(os.path.join(CONFIRMED_PATH, "*")):
-                fn = os.path.basename(fp)
-                if not fn.lower().endswith(('.jpg', '.jpeg', '.png')):
-                    continue
-
-                lat, lon = extract_gps_from_image(fp)  # may be None
-                if lat is None or lon is None:
-                    lat, lon = fallback_coordinates(fn)
-
-                safe_name = urllib.parse.quote(fn)
-                points.append({
-                    "lat": lat,
-                    "lon": lon,
-                    "tile_id": os.path.splitext(fn)[0],
-                    "image_url": f"/local_image/{safe_name}"
-                })
-            
-            response = {'points': points}
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self._send_page(MAP_PAGE)
+        elif urllib.parse.urlparse(self.path).path == '/gps_data':
+            # GET /gps_data[?v=run_id] - return GPS coordinates from confirmed images
+            self._send_body(gps_body(), 'application/json', etag=True)
+        elif urllib.parse.urlparse(self.path).path == '/gps_data.bin':
+            # GET /gps_data.bin[?v=run_id] - the same points packed for DataView decoding
+            self._send_body(gps_body(binary=True), 'application/octet-stream', etag=True)
         elif self.path.startswith('/download/'):
             # Serve exported files
             filename = self.path.split('/')[-1]
-            try:
-                with open(filename, 'rb') as f:
-                    content = f.read()
-                self.send_response(200)
-                if filename.endswith('.geojson'):
-                    self.send_header('Content-type', 'application/geo+json')
-                elif filename.endswith('.csv'):
-                    self.send_header('Content-type', 'text/csv')
-                elif filename.endswith('.gpx'):
-                    self.send_header('Content-type', 'application/gpx+xml')
-                elif filename.endswith('.kml'):
-                    self.send_header('Content-type', 'application/vnd.google-earth.kml+xml')
-                else:
-                    self.send_header('Content-type', 'application/octet-stream')
-                self.send_header('Content-Disposition', f'attachment; filename="{filename}"')
-                self.end_headers()
-                self.wfile.write(content)
-            except FileNotFoundError:
-                self.send_response(404)
-                self.end_headers()
+            # Exports are rewritten in place, so always revalidate
+            self._send_file(filename, DOWNLOAD_TYPES.get(os.path.splitext(filename)[1], 'application/octet-stream'),
+                            'no-cache', attachment=filename)
         else:
             super().do_GET()
 
@@ -2423,7 +3563,7 @@ class TortoiseHandler(http.server.SimpleHTTPRequestHandler):
         post_data = self.rfile.read(content_length)
         
         try:
-            data = json.loads(post_data.decode())
+            data = loads_json(post_data)
             
             if self.path == '/start_run':
                 threshold = data.get('threshold', 0.8)
@@ -2443,6 +3583,31 @@ class TortoiseHandler(http.server.SimpleHTTPRequestHandler):
                     'message': f'Image {filename} confirmed' if success else 'Failed to confirm image'
                 }
             
+            elif self.path == '/confirm_batch':
+                # {"items": [{"filename": ..., "action": "confirm" | "reject"}, ...]}, applied in order
+                results = []
+                for item in data.get('items', []):
+                    filename, action = item.get('filename'), item.get('action')
+                    apply = REVIEW_ACTIONS.get(action)
+                    success = bool(filename and apply and apply(filename))
+                    results.append({
+                        'filename': filename,
+                        'action': action,
+                        'success': success,
+                        'message': f'Image {filename} {action}ed' if success else f'Failed to {action} image'
+                    })
+                
+                response = {'results': results}
+            
+            elif self.path == '/validate_batch':
+                # {"items": [{"tile_id": ..., "action": "verified" | "rejected"}, ...]}
+                items = data.get('items', [])
+                with VALIDATIONS_LOCK:
+                    for item in items:
+                        VALIDATIONS[item['tile_id']] = item['action']
+                
+                response = {'success': True, 'count': len(items)}
+            
             elif self.path == '/reject_image':
                 filename = data.get('filename')
                 success = reject_image(filename) if filename else False
@@ -2455,22 +3620,25 @@ class TortoiseHandler(http.server.SimpleHTTPRequestHandler):
             else:
                 raise ValueError("Unknown endpoint")
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self._send_json(response)
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            error_response = {'error': str(e)}
-            self.wfile.write(json.dumps(error_response).encode())
+            self._send_json({'error': str(e)}, status=500)
+
+class DemoHTTPServer(http.server.ThreadingHTTPServer):
+    """Thread per connection, so one slow request doesn't stall the page's other fetches."""
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def server_bind(self):
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
 
 if __name__ == "__main__":
     PORT = int(os.getenv("PORT", "8081"))
 
-    with socketserver.TCPServer(("", PORT), TortoiseHandler) as httpd:
+    with DemoHTTPServer(("", PORT), TortoiseHandler) as httpd:
         print(f"Tortoise Finder Demo Server")
         print(f"Open your browser to: http://localhost:{PORT}")
         print(f"Press Ctrl+C to stop")
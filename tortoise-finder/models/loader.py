@@ -2,11 +2,16 @@
 # This will be expanded when real models are integrated
 
 import os
+import json
+import asyncio
 import tempfile
 from typing import Optional, Dict, Any
 from storage.io import client, get_url
 from storage.paths import model_weights_key, model_config_key, model_metadata_key
 
+# Local copies of downloaded checkpoints, memory-mapped by _download_and_load_weights
+MODEL_CACHE_DIR = os.environ.get("MODEL_CACHE_DIR", os.path.join(tempfile.gettempdir(), "tortoise-models"))
+
 class ModelLoader:
     """Model loading functionality with S3 support."""
     
@@ -32,9 +37,8 @@ class ModelLoader:
             
             # For now, just mark as loaded (placeholder)
             # When real models are integrated, download and load actual weights:
-            # self.model = self._download_and_load_weights(weights_key)
-            # self.config = self._download_config(config_key)
-            # self.metadata = self._download_metadata(metadata_key)
+            # self.model, self.config, self.metadata = asyncio.run(
+            #     self._download_all(weights_key, config_key, metadata_key))
             
             print(f"Loading model version: {self.model_version}")
             self.model = "placeholder_model"
@@ -45,20 +49,60 @@ class ModelLoader:
             return False
     
     def _download_and_load_weights(self, weights_key: str):
-        """Download model weights from S3 and load into memory."""
-        # Placeholder for actual model loading
-        # This would download the .pth file and load it with torch.load()
-        pass
+        """
+        Download model weights from S3 and memory-map them.
+
+        The checkpoint is kept on local disk, so tensor pages are faulted in
+        from the page cache as they are touched and are shared by every worker
+        process on the host that maps the same file.
+        """
+        import torch  # only needed once real models are integrated
+
+        local_path = os.path.join(MODEL_CACHE_DIR, weights_key)
+        if not os.path.exists(local_path):
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            # Download beside the final path and rename, so a concurrent
+            # loader never maps a half-written file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(local_path), suffix=".part")
+            os.close(fd)
+            try:
+                client().fget_object(self.bucket, weights_key, tmp_path)
+                os.replace(tmp_path, local_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        # weights_only: plain tensors, loaded without running arbitrary pickle code
+        return torch.load(local_path, map_location="cpu", mmap=True, weights_only=True)
     
+    async def _download_all(self, weights_key: str, config_key: str, metadata_key: str):
+        """
+        Fetch weights, config and metadata concurrently.
+
+        The three objects are independent, so cold start waits for the largest
+        (the weights) rather than the sum; the small JSON files finish while
+        the checkpoint is still streaming.
+        """
+        return await asyncio.gather(
+            asyncio.to_thread(self._download_and_load_weights, weights_key),
+            asyncio.to_thread(self._download_config, config_key),
+            asyncio.to_thread(self._download_metadata, metadata_key),
+        )
+
+    def _get_json(self, key: str) -> Dict:
+        resp = client().get_object(self.bucket, key)
+        try:
+            return json.loads(resp.read())
+        finally:
+            resp.close()
+            resp.release_conn()
+
     def _download_config(self, config_key: str) -> Dict:
         """Download model configuration from S3."""
-        # Placeholder for config loading
-        return {}
+        return self._get_json(config_key)
     
     def _download_metadata(self, metadata_key: str) -> Dict:
         """Download model metadata from S3."""
-        # Placeholder for metadata loading
-        return {}
+        return self._get_json(metadata_key)
     
     def predict(self, input_data: Any) -> Dict[str, Any]:
         """
@@ -1,11 +1,14 @@
 import os
 import tempfile
-import json
+from typing import Iterator
+import orjson
 import pandas as pd
+import pyarrow.parquet as pq
+from minio.error import S3Error
 # import geopandas as gpd  # Temporarily disabled
 # from shapely.geometry import Point  # Temporarily disabled
-from storage.io import put_file
-from storage.paths import geojson_key
+from storage.io import client, get_url, put_file, s3_filesystem
+from storage.paths import geojson_key, results_key
 
 BUCKET = os.environ["ARTIFACT_BUCKET"]
 
@@ -13,62 +16,110 @@ def _df(run_id: str) -> pd.DataFrame:
     from .utils import read_results_table
     return read_results_table(run_id)
 
+def iter_geojson(run_id: str, batch_size: int = 10_000) -> Iterator[bytes]:
+    """
+    Yield a run's positives as a GeoJSON FeatureCollection, one chunk per
+    parquet record batch, so the whole document is never held in memory.
+    """
+    with s3_filesystem().open_input_file(f"{BUCKET}/{results_key(run_id)}") as src:
+        pf = pq.ParquetFile(src)
+        yield b'{"type":"FeatureCollection","features":['
+        first = True
+        for batch in pf.iter_batches(batch_size=batch_size, columns=["tile_id", "lat", "lon", "score"]):
+            cols = batch.to_pydict()
+            features = [
+                orjson.dumps({
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                    "properties": {"tile_id": tile_id, "score": score},
+                })
+                for tile_id, lat, lon, score in zip(cols["tile_id"], cols["lat"], cols["lon"], cols["score"])
+            ]
+            if not features:
+                continue
+            chunk = b",".join(features)
+            yield chunk if first else b"," + chunk
+            first = False
+        yield b"]}"
+
+EXPORT_FORMATS = ("geojson", "csv", "gpx", "kml")
+
+def _export_key(run_id: str, fmt: str) -> str:
+    return geojson_key(run_id) if fmt == "geojson" else f"runs/{run_id}/positives.{fmt}"
+
+def _fresh_export(run_id: str, key: str) -> bool:
+    # Results are immutable once written, so an export newer than them is current
+    c = client()
+    try:
+        return c.stat_object(BUCKET, key).last_modified >= c.stat_object(BUCKET, results_key(run_id)).last_modified
+    except S3Error:
+        return False
+
 def export_results(run_id: str, fmt: str = "geojson") -> str:
+    """
+    Build a run's export in `fmt` and upload it, returning its object key.
+
+    An export already built from the current results is reused as-is, so
+    asking for the same format again skips the parquet read and rebuild.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError("unsupported format")
+    key = _export_key(run_id, fmt)
+    if _fresh_export(run_id, key):
+        return key
+
     df = _df(run_id)
     
     with tempfile.NamedTemporaryFile(delete=False, suffix=f".{fmt}") as tmp:
         if fmt == "geojson":
-            # Create simple GeoJSON without geopandas
-            geojson = {
-                "type": "FeatureCollection",
-                "features": []
-            }
-            for _, row in df.iterrows():
-                feature = {
+            # Create simple GeoJSON without geopandas: whole columns to Python
+            # lists once, then orjson writes the document straight to bytes
+            features = [
+                {
                     "type": "Feature",
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [float(row.lon), float(row.lat)]
-                    },
-                    "properties": {
-                        "tile_id": row.tile_id,
-                        "score": float(row.score)
-                    }
+                    "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                    "properties": {"tile_id": tile_id, "score": score},
                 }
-                geojson["features"].append(feature)
-            
-            with open(tmp.name, 'w') as f:
-                json.dump(geojson, f, indent=2)
-            key = geojson_key(run_id)
+                for tile_id, lat, lon, score in zip(df.tile_id.tolist(), df.lat.astype(float).tolist(),
+                                                    df.lon.astype(float).tolist(), df.score.astype(float).tolist())
+            ]
+            with open(tmp.name, 'wb') as f:
+                f.write(orjson.dumps({"type": "FeatureCollection", "features": features}, option=orjson.OPT_INDENT_2))
         elif fmt == "csv":
-            df[["lat", "lon", "score", "tile_id"]].to_csv(tmp.name, index=False)
-            key = f"runs/{run_id}/positives.csv"
+            df[["lat", "lon", "score", "tile_id"]].to_csv(tmp.name, index=False, lineterminator="\n", float_format="%.6f")
         elif fmt == "gpx":
-            # Simple GPX export without geopandas
-            gpx_content = '<?xml version="1.0" encoding="UTF-8"?>\n<gpx version="1.1">\n'
-            for _, row in df.iterrows():
-                gpx_content += f'  <wpt lat="{row.lat}" lon="{row.lon}">\n'
-                gpx_content += f'    <name>{row.tile_id}</name>\n'
-                gpx_content += f'    <desc>Score: {row.score}</desc>\n'
-                gpx_content += '  </wpt>\n'
-            gpx_content += '</gpx>'
+            # Simple GPX export without geopandas, written row by row rather
+            # than grown as one string
             with open(tmp.name, 'w') as f:
-                f.write(gpx_content)
-            key = f"runs/{run_id}/positives.gpx"
+                f.write('<?xml version="1.0" encoding="UTF-8"?>\n<gpx version="1.1">\n')
+                f.writelines(
+                    f'  <wpt lat="{row.lat}" lon="{row.lon}">\n'
+                    f'    <name>{row.tile_id}</name>\n'
+                    f'    <desc>Score: {row.score}</desc>\n'
+                    '  </wpt>\n'
+                    for row in df[["tile_id", "lat", "lon", "score"]].itertuples(index=False)
+                )
+                f.write('</gpx>')
         elif fmt == "kml":
             # Simple KML export without geopandas
-            kml_content = '<?xml version="1.0" encoding="UTF-8"?>\n<kml xmlns="http://www.opengis.net/kml/2.2">\n<Document>\n'
-            for _, row in df.iterrows():
-                kml_content += f'  <Placemark>\n'
-                kml_content += f'    <name>{row.tile_id}</name>\n'
-                kml_content += f'    <description>Score: {row.score}</description>\n'
-                kml_content += f'    <Point><coordinates>{row.lon},{row.lat},0</coordinates></Point>\n'
-                kml_content += f'  </Placemark>\n'
-            kml_content += '</Document>\n</kml>'
             with open(tmp.name, 'w') as f:
-                f.write(kml_content)
-            key = f"runs/{run_id}/positives.kml"
-        else:
-            raise ValueError("unsupported format")
+                f.write('<?xml version="1.0" encoding="UTF-8"?>\n<kml xmlns="http://www.opengis.net/kml/2.2">\n<Document>\n')
+                f.writelines(
+                    '  <Placemark>\n'
+                    f'    <name>{row.tile_id}</name>\n'
+                    f'    <description>Score: {row.score}</description>\n'
+                    f'    <Point><coordinates>{row.lon},{row.lat},0</coordinates></Point>\n'
+                    '  </Placemark>\n'
+                    for row in df[["tile_id", "lat", "lon", "score"]].itertuples(index=False)
+                )
+                f.write('</Document>\n</kml>')
         put_file(BUCKET, key, tmp.name)
         return key
+
+def export_job(run_id: str, fmt: str = "geojson") -> str:
+    """RQ entry point: build the export, then leave its presigned URL in job meta."""
+    from .run import _update
+    key = export_results(run_id, fmt)
+    url = get_url(BUCKET, key)
+    _update(100.0, state="finished", result_url=url)
+    return url
@@ -2,27 +2,60 @@
 # When the real model is ready, implement batch inference here
 # Keep the Parquet schema identical: tile_id, score, lat, lon, thumb_url, image_url, model_ver, run_id
 
-def run_inference(tiles, model_version="production"):
+import os
+import numpy as np
+
+def _reseed():
+    global _RNG
+    _RNG = np.random.default_rng()
+
+# One generator per process for the mock scores and AOI placement; forked
+# workers reseed so they don't all draw the parent's stream
+_reseed()
+os.register_at_fork(after_in_child=_reseed)
+
+def _model_scores(model, tiles):
+    # One forward pass for the whole batch. Torch modules run without autograd
+    # on the model's own device; anything else is called as a plain function.
+    try:
+        import torch
+    except ImportError:
+        torch = None
+    if torch is not None and isinstance(model, torch.nn.Module):
+        device = next(model.parameters()).device
+        with torch.inference_mode():
+            out = model(torch.as_tensor(tiles).to(device, non_blocking=True))
+        return out.float().cpu().numpy().reshape(-1)
+    return np.asarray(model(tiles), dtype=np.float32).reshape(-1)
+
+def run_inference(tiles, tile_ids, lat=None, lon=None, model_version="production", model=None):
     """
-    Placeholder for real model inference.
-    
+    Batched model inference over a run's tiles.
+
     Args:
-        tiles: List of tile data (images, metadata)
+        tiles: Batch of tile images, shape (N, ...), as an array or tensor
+        tile_ids: Tile ids, shape (N,)
+        lat: Latitudes, shape (N,); None places the tiles randomly in the MVP AOI
+        lon: Longitudes, shape (N,); as for `lat`
         model_version: Model version to use
-        
+        model: Scoring callable taking the whole batch; None keeps the MVP's random scores
+
     Returns:
-        List of results with scores and metadata
+        Dict of column arrays (tile_id, score, lat, lon, model_ver), one row per tile
     """
-    # This will be replaced with actual model inference
-    # For now, return random scores as in the MVP
-    import random
-    results = []
-    for i, tile in enumerate(tiles):
-        results.append({
-            "tile_id": f"tile-{i:05d}",
-            "score": random.random(),
-            "lat": tile.get("lat", -0.5 + random.random() * 0.5),
-            "lon": tile.get("lon", -90.5 + random.random() * 0.5),
-            "model_ver": model_version
-        })
-    return results
+    n = len(tile_ids)
+    if model is None:
+        # This will be replaced with actual model inference
+        scores = _RNG.random(n, dtype=np.float32)
+    else:
+        scores = _model_scores(model, tiles)
+    # Same AOI as the MVP: lat in [-0.5, 0), lon in [-90.5, -90)
+    lat = -0.5 + _RNG.random(n) * 0.5 if lat is None else np.asarray(lat, dtype=np.float64)
+    lon = -90.5 + _RNG.random(n) * 0.5 if lon is None else np.asarray(lon, dtype=np.float64)
+    return {
+        "tile_id": np.asarray(tile_ids),
+        "score": scores,
+        "lat": lat,
+        "lon": lon,
+        "model_ver": np.full(n, model_version, dtype=object),
+    }
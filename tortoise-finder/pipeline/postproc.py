@@ -1,55 +1,81 @@
-# Placeholder for post-processing functionality
-# When implementing real post-processing, this will handle:
-# - Non-Maximum Suppression (NMS)
-# - Score thresholding
+# Post-processing of model detections
+# Detections are kept as parallel NumPy arrays (see Detections) so thresholding
+# and NMS run as array operations rather than a Python loop per detection.
+# When implementing real post-processing, this will also handle:
 # - Spatial filtering
 # - Confidence calibration
 
+from typing import NamedTuple
+import numpy as np
+
+class Detections(NamedTuple):
+    """Detections as parallel arrays: row i of each field is one detection."""
+    boxes: np.ndarray     # (N, 4) float, x1, y1, x2, y2
+    scores: np.ndarray    # (N,) float
+    tile_ids: np.ndarray  # (N,) object
+
+    def take(self, idx) -> "Detections":
+        """Subset by boolean mask or index array, keeping the fields aligned."""
+        return Detections(self.boxes[idx], self.scores[idx], self.tile_ids[idx])
+
 def apply_nms(detections, iou_threshold=0.5):
     """
-    Placeholder for Non-Maximum Suppression.
-    
+    Greedy Non-Maximum Suppression.
+
     Args:
-        detections: List of detection results
-        iou_threshold: IoU threshold for suppression
-        
+        detections: Detections to suppress
+        iou_threshold: IoU above which a lower-scored box is dropped
+
     Returns:
-        Filtered list of detections
+        Kept detections, highest score first
     """
-    # This will be replaced with actual NMS implementation
-    # For now, return all detections
-    return detections
+    boxes = np.asarray(detections.boxes, dtype=np.float64).reshape(-1, 4)
+    x1, y1, x2, y2 = boxes.T
+    areas = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    order = np.argsort(-np.asarray(detections.scores), kind="stable")
+    keep = []
+    while order.size:
+        i, rest = order[0], order[1:]
+        keep.append(i)
+        # IoU of the best remaining box against all the others at once
+        w = np.clip(np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]), 0, None)
+        h = np.clip(np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]), 0, None)
+        inter = w * h
+        union = areas[i] + areas[rest] - inter
+        iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+        order = rest[iou <= iou_threshold]
+    return detections.take(np.asarray(keep, dtype=np.intp))
 
 def filter_by_threshold(detections, threshold=0.8):
     """
     Filter detections by confidence threshold.
-    
+
     Args:
-        detections: List of detection results
+        detections: Detections to filter
         threshold: Minimum confidence score
-        
+
     Returns:
-        Filtered list of detections
+        Detections scoring at least `threshold`
     """
-    return [d for d in detections if d.get("score", 0) >= threshold]
+    return detections.take(np.asarray(detections.scores) >= threshold)
 
 def postprocess_results(raw_results, threshold=0.8, apply_nms_flag=True):
     """
     Apply post-processing to raw model results.
-    
+
     Args:
-        raw_results: Raw model outputs
+        raw_results: Raw model outputs, as Detections
         threshold: Confidence threshold
         apply_nms_flag: Whether to apply NMS
-        
+
     Returns:
         Post-processed results
     """
     # Filter by threshold
     filtered = filter_by_threshold(raw_results, threshold)
-    
+
     # Apply NMS if requested
     if apply_nms_flag:
         filtered = apply_nms(filtered)
-    
+
     return filtered
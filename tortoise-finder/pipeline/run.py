@@ -1,54 +1,144 @@
 import os
 import uuid
 import time
-import random
 import io
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from PIL import Image, ImageOps
-from storage.io import put_bytes, get_url
+import pyarrow as pa
+import pyarrow.parquet as pq
+from PIL import Image
+from storage.io import put_bytes, put_pyarrow_buffer, get_urls, ensure_bucket_once
 from storage.paths import results_key, thumbs_prefix
 from rq import get_current_job
 
 BUCKET = os.environ["ARTIFACT_BUCKET"]
 
-def _update(progress):
-    job = get_current_job()
+PROGRESS_TTL_S = 24 * 3600
+
+def _reseed():
+    global _RNG
+    _RNG = np.random.default_rng()
+
+# One generator per process for the MVP's synthetic draws. RQ forks a work
+# horse per job, so each child reseeds rather than replaying the parent's stream
+_reseed()
+os.register_at_fork(after_in_child=_reseed)
+
+def progress_channel(job_id: str) -> str:
+    return f"progress:{job_id}"
+
+def progress_key(job_id: str) -> str:
+    # Small hash the API reads instead of the whole pickled job record.
+    # (Pub/sub channels live in their own namespace, so sharing the name is fine.)
+    return f"progress:{job_id}"
+
+def tiles_stream(run_id: str) -> str:
+    return f"tiles:{run_id}"
+
+def _emit_events(tiles, progress, state="started", job=None):
+    # Append newly scored positives plus a progress tick to the run's event
+    # stream in one round trip; /events/{run_id} replays and tails it
+    job = job or get_current_job()
+    if job:
+        key = tiles_stream(job.id)
+        pipe = job.connection.pipeline(transaction=False)
+        for t in tiles:
+            pipe.xadd(key, {"event": "tile", "data": json.dumps(t)})
+        pipe.xadd(key, {"event": "progress", "data": json.dumps({"state": state, "progress_pct": progress})})
+        pipe.expire(key, PROGRESS_TTL_S)
+        pipe.execute()
+
+# Mid-run progress writes are at most this often; state changes always go out
+UPDATE_INTERVAL_S = 1.0
+_last_update = 0.0
+
+def _update(progress, state="started", force=False, job=None, **extra):
+    # `extra` lands in job meta and the published event (e.g. an export's result_url)
+    global _last_update
+    now = time.monotonic()
+    if state == "started" and not force and not extra and now - _last_update < UPDATE_INTERVAL_S:
+        return
+    _last_update = now
+    job = job or get_current_job()
     if job:
         job.meta["progress"] = progress
+        job.meta.update(extra)
         job.save_meta()
+        pipe = job.connection.pipeline(transaction=False)
+        pipe.hset(progress_key(job.id), mapping={"pct": progress, "state": state, "ts": time.time(), **extra})
+        pipe.expire(progress_key(job.id), PROGRESS_TTL_S)
+        pipe.execute()
+        # Push the same update to /status/{job_id}/stream subscribers
+        job.connection.publish(progress_channel(job.id), json.dumps({"state": state, "progress_pct": progress, **extra}))
+
+# Thumbnail uploads are network round trips; overlap this many at once
+UPLOAD_WORKERS = 32
+
+@lru_cache(maxsize=256)
+def _solid_thumb(v: int) -> bytes:
+    # MVP thumbnails are flat grey squares, so there are only 256 distinct ones;
+    # each is encoded once per process and reused for every tile that shares it
+    with io.BytesIO() as buf:
+        # Lossless at the fastest effort: a flat tile compresses to a few dozen
+        # bytes with the exact grey, quicker than the default lossy search
+        Image.new("RGB", (128, 128), (v, v, v)).save(buf, format="WEBP", lossless=True, quality=0, method=0)
+        return buf.getvalue()
+
+def _thumb_key(run_id: str, tile_id: str) -> str:
+    return f"{thumbs_prefix(run_id)}/{tile_id}.webp"
+
+def _render_and_upload(run_id: str, tile_id: str, score: float) -> None:
+    """Render one tile's thumbnail and upload it."""
+    b = _solid_thumb(int(score * 255))
+    put_bytes(BUCKET, _thumb_key(run_id, tile_id), b, "image/webp")
 
 def run_inference_job(dataset_uri: str, model_version: str | None, threshold: float):
     # MVP: synthesize 500 tiles with lat/lon around a fixed AOI
     n = 500
-    rows = []
-    for i in range(n):
-        score = random.random()  # stand-in for real model score
-        lat = -0.5 + random.random() * 0.5
-        lon = -90.5 + random.random() * 0.5
-        # create thumbnail
-        img = ImageOps.colorize(Image.new("L", (128, 128), int(score * 255)), black="black", white="white")
-        buf = io.BytesIO()
-        img.save(buf, format="WEBP")
-        b = buf.getvalue()
-        tile_id = f"tile-{i:05d}"
-        thumb_key = f"{thumbs_prefix(get_current_job().id)}/{tile_id}.webp"
-        put_bytes(BUCKET, thumb_key, b, "image/webp")
-        rows.append({
-            "tile_id": tile_id, "score": score, "lat": lat, "lon": lon,
-            "thumb_url": get_url(BUCKET, thumb_key), "image_url": get_url(BUCKET, thumb_key),
-            "model_ver": model_version, "run_id": get_current_job().id
-        })
-        if i % 25 == 0: 
-            _update(round(i / n * 100, 1))
-    df = pd.DataFrame(rows)
+    # Looked up once; everything below reuses it (None when run outside RQ)
+    job = get_current_job()
+    run_id = job.id if job else "local"
+    # All tiles' metadata in one draw: score (stand-in for real model score), lat, lon
+    r = _RNG.random((n, 3))
+    tile_ids = [f"tile-{i:05d}" for i in range(n)]
+    scores = r[:, 0].tolist()
+    lats = (-0.5 + 0.5 * r[:, 1]).tolist()
+    lons = (-90.5 + 0.5 * r[:, 2]).tolist()
+    # Keys are known up front, so every thumbnail URL is signed in one batch
+    urls = get_urls(BUCKET, [_thumb_key(run_id, t) for t in tile_ids])
+    pending = []  # positives not yet pushed to the event stream
+    # Check the bucket up front, not from 32 upload threads racing to do it
+    ensure_bucket_once(BUCKET)
+    # Render + upload thumbnails concurrently; progress counts finished tiles
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+        futures = {pool.submit(_render_and_upload, run_id, tile_ids[i], scores[i]): i for i in range(n)}
+        for done, fut in enumerate(as_completed(futures)):
+            i = futures[fut]
+            fut.result()
+            if scores[i] >= threshold:
+                pending.append({"tile_id": tile_ids[i], "thumb_url": urls[i], "lat": lats[i], "lon": lons[i],
+                                "score": scores[i]})
+            if done % 25 == 0:
+                _update(round(done / n * 100, 1), job=job)
+                _emit_events(pending, round(done / n * 100, 1), job=job)
+                pending = []
+    df = pd.DataFrame({
+        "tile_id": tile_ids, "score": scores, "lat": lats, "lon": lons,
+        "thumb_url": urls, "image_url": urls,
+        "model_ver": model_version, "run_id": run_id
+    })
     # store results parquet
-    import pyarrow as pa
-    import pyarrow.parquet as pq
     table = pa.Table.from_pandas(df)
-    from tempfile import NamedTemporaryFile
-    with NamedTemporaryFile(suffix=".parquet") as tmp:
-        pq.write_table(table, tmp.name)
-        from storage.io import put_file
-        put_file(BUCKET, results_key(get_current_job().id), tmp.name, "application/octet-stream")
-    _update(100.0)
-    return {"run_id": get_current_job().id, "n": len(df)}
+    # Write into memory and stream that straight to the bucket: no temp file
+    sink = pa.BufferOutputStream()
+    # Zstd is smaller than the default snappy at similar read speed; dictionary
+    # pages collapse the columns that repeat (model_ver, run_id) to a few bytes
+    pq.write_table(table, sink, compression="zstd", compression_level=3, use_dictionary=True,
+                   write_statistics=True)
+    put_pyarrow_buffer(BUCKET, results_key(run_id), sink.getvalue(), "application/octet-stream")
+    _update(100.0, state="finished", job=job)
+    _emit_events(pending, 100.0, state="finished", job=job)
+    return {"run_id": run_id, "n": len(df)}
@@ -4,6 +4,8 @@
 # - Creating tiles with geospatial metadata
 # - Managing tile coordinates and bounds
 
+from PIL import Image
+
 def create_tiles(image_path, tile_size=512, overlap=0.1):
     """
     Placeholder for image tiling.
@@ -30,3 +32,24 @@ def create_tiles(image_path, tile_size=512, overlap=0.1):
             "lon": -90.5 + (i * 0.05)
         })
     return tiles
+
+def load_thumbnail(image_path, size=128):
+    """
+    Decode an image straight to a thumbnail at most `size` px on a side.
+
+    JPEGs use shrink-on-load: draft() has libjpeg-turbo decode at a reduced
+    DCT scale (1/2 to 1/8), so a 1920x1080 frame shrunk to 128px skips most
+    of the IDCT work instead of decoding at full size and then resizing.
+
+    Args:
+        image_path: Path to the source image
+        size: Longest side of the thumbnail in pixels
+
+    Returns:
+        RGB PIL image
+    """
+    with Image.open(image_path) as im:
+        im.draft("RGB", (size, size))
+        im = im.convert("RGB")
+    im.thumbnail((size, size), Image.Resampling.LANCZOS)
+    return im
@@ -1,15 +1,64 @@
 import os
-import tempfile
+from functools import lru_cache
+from typing import Optional, Sequence
 import pandas as pd
-from storage.io import client
+import pyarrow as pa
+import pyarrow.parquet as pq
+from redis import Redis
+from redis.exceptions import RedisError
+from storage.io import s3_filesystem
 from storage.paths import results_key
 
 BUCKET = os.environ["ARTIFACT_BUCKET"]
+RESULTS_CACHE_TTL_S = 3600
 
-def read_results_table(run_id: str) -> pd.DataFrame:
-    c = client()
-    obj = c.get_object(BUCKET, results_key(run_id))
-    with tempfile.NamedTemporaryFile(suffix=".parquet") as tmp:
-        with open(tmp.name, "wb") as f: 
-            f.write(obj.read())
-        return pd.read_parquet(tmp.name)
+def read_results_table(run_id: str, min_score: Optional[float] = None,
+                       columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Read a run's results table, optionally pushing a score filter and a column
+    projection down into the parquet reader (row groups whose statistics can't
+    match are skipped entirely).
+    """
+    filters = [("score", ">=", min_score)] if min_score is not None else None
+    # Read straight from the bucket: no download to a temp file first
+    table = pq.read_table(f"{BUCKET}/{results_key(run_id)}", filesystem=s3_filesystem(),
+                          columns=list(columns) if columns else None, filters=filters)
+    return table.to_pandas()
+
+@lru_cache(maxsize=1)
+def _redis() -> Redis:
+    return Redis.from_url(os.environ["REDIS_URL"])
+
+def _results_cache_key(run_id: str, columns: Optional[tuple] = None) -> str:
+    if columns:
+        return f"results:{run_id}:{','.join(columns)}:arrow"
+    return f"results:{run_id}:arrow"
+
+@lru_cache(maxsize=32)
+def get_cached_results(run_id: str, columns: Optional[tuple] = None) -> pd.DataFrame:
+    """
+    Results table for a run, cached in-process and in Redis (as Arrow IPC) so
+    other API workers skip the object storage read too.
+
+    Results are immutable once a run finishes, so entries are never invalidated.
+    The returned DataFrame is shared between callers and must not be mutated.
+    `columns` (a tuple, so it stays hashable) is pushed down into the read.
+    """
+    key = _results_cache_key(run_id, columns)
+    try:
+        buf = _redis().get(key)
+    except RedisError:
+        buf = None
+    if buf is not None:
+        return pa.ipc.open_stream(buf).read_all().to_pandas()
+
+    df = read_results_table(run_id, columns=columns)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    try:
+        _redis().setex(key, RESULTS_CACHE_TTL_S, sink.getvalue().to_pybytes())
+    except RedisError:
+        pass  # cache is best-effort
+    return df
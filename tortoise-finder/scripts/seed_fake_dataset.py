@@ -5,31 +5,41 @@ This creates sample data in MinIO for the tortoise-finder system.
 """
 
 import os
-import random
-import tempfile
-from PIL import Image, ImageDraw
-from storage.io import put_file, ensure_bucket
+import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+from PIL import Image
+from storage.io import put_bytes, ensure_bucket
 from storage.paths import dataset_prefix
+from tqdm import tqdm
+
+UPLOAD_WORKERS = 32
 
 def create_fake_image(width=512, height=512, seed=None):
     """Create a fake image with some random patterns."""
-    if seed:
-        random.seed(seed)
+    # A generator per image (images are drawn from several threads at once),
+    # and every shape's parameters come from one draw rather than a call each
+    rng = np.random.default_rng(seed)
     
-    # Create a base image with random noise
-    img = Image.new('RGB', (width, height), color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)))
-    draw = ImageDraw.Draw(img)
+    # Create a base image with a random colour
+    arr = np.empty((height, width, 3), dtype=np.uint8)
+    arr[:] = rng.integers(0, 256, size=3, dtype=np.uint8)
     
-    # Add some random shapes
-    for _ in range(random.randint(5, 15)):
-        x1 = random.randint(0, width)
-        y1 = random.randint(0, height)
-        x2 = random.randint(0, width)
-        y2 = random.randint(0, height)
-        color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-        draw.ellipse([x1, y1, x2, y2], fill=color)
+    # Add some random ellipses, each given by two corners of its bounding box
+    n = int(rng.integers(5, 16))
+    xs = np.sort(rng.integers(0, width + 1, size=(n, 2)), axis=1)
+    ys = np.sort(rng.integers(0, height + 1, size=(n, 2)), axis=1)
+    colors = rng.integers(0, 256, size=(n, 3), dtype=np.uint8)
+    for (x1, x2), (y1, y2), color in zip(xs, ys, colors):
+        if x2 == x1 or y2 == y1:
+            continue
+        # Fill the ellipse through a mask over its bounding box only
+        cx, cy, rx, ry = (x1 + x2) / 2, (y1 + y2) / 2, (x2 - x1) / 2, (y2 - y1) / 2
+        gy, gx = np.ogrid[y1:y2, x1:x2]
+        mask = ((gx + 0.5 - cx) / rx) ** 2 + ((gy + 0.5 - cy) / ry) ** 2 <= 1
+        arr[y1:y2, x1:x2][mask] = color
     
-    return img
+    return Image.fromarray(arr, "RGB")
 
 def seed_dataset(dataset_name="demo", num_images=10):
     """Seed a fake dataset with sample images."""
@@ -40,22 +50,22 @@ def seed_dataset(dataset_name="demo", num_images=10):
     
     print(f"Creating fake dataset '{dataset_name}' with {num_images} images...")
     
-    for i in range(num_images):
+    def _seed_one(i):
         # Create fake image
         img = create_fake_image(seed=i)
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
-            img.save(tmp.name, "JPEG")
-            
-            # Upload to MinIO
-            key = f"{dataset_path}/image_{i:04d}.jpg"
-            put_file(bucket, key, tmp.name, "image/jpeg")
-            
-            # Clean up temp file
-            os.unlink(tmp.name)
-            
-        print(f"Uploaded {key}")
+        # Encode in memory and upload to MinIO, no temp file on disk
+        key = f"{dataset_path}/image_{i:04d}.jpg"
+        with io.BytesIO() as buf:
+            img.save(buf, format="JPEG", quality=85, optimize=False)
+            put_bytes(bucket, key, buf.getvalue(), "image/jpeg")
+        return key
+    
+    # Render + upload images concurrently
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+        futures = [pool.submit(_seed_one, i) for i in range(num_images)]
+        for fut in tqdm(as_completed(futures), total=num_images, unit="img"):
+            fut.result()
     
     print(f"Dataset '{dataset_name}' seeded successfully!")
     print(f"Dataset URI: s3://{bucket}/{dataset_path}")
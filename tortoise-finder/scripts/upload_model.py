@@ -8,7 +8,7 @@ import os
 import sys
 import json
 from pathlib import Path
-from storage.io import put_file, ensure_bucket
+from storage.io import put_bytes, put_file, put_large_file, ensure_bucket
 from storage.paths import model_weights_key, model_config_key, model_metadata_key
 
 def upload_model(model_path: str, version: str, config_path: str = None, metadata_path: str = None):
@@ -19,7 +19,7 @@ def upload_model(model_path: str, version: str, config_path: str = None, metadat
     # Upload model weights
     weights_key = model_weights_key(version)
     print(f"Uploading model weights: {model_path} -> {weights_key}")
-    put_file(bucket, weights_key, model_path, "application/octet-stream")
+    put_large_file(bucket, weights_key, model_path, "application/octet-stream")
     
     # Upload config if provided
     if config_path and os.path.exists(config_path):
@@ -37,10 +37,7 @@ def upload_model(model_path: str, version: str, config_path: str = None, metadat
         }
         config_key = model_config_key(version)
         print(f"Creating default config: {config_key}")
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            json.dump(default_config, tmp, indent=2)
-            put_file(bucket, config_key, tmp.name, "application/json")
-            os.unlink(tmp.name)
+        put_bytes(bucket, config_key, json.dumps(default_config, indent=2).encode(), "application/json")
     
     # Upload metadata if provided
     if metadata_path and os.path.exists(metadata_path):
@@ -61,16 +58,12 @@ def upload_model(model_path: str, version: str, config_path: str = None, metadat
         }
         metadata_key = model_metadata_key(version)
         print(f"Creating default metadata: {metadata_key}")
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            json.dump(default_metadata, tmp, indent=2)
-            put_file(bucket, metadata_key, tmp.name, "application/json")
-            os.unlink(tmp.name)
+        put_bytes(bucket, metadata_key, json.dumps(default_metadata, indent=2).encode(), "application/json")
     
     print(f"Model {version} uploaded successfully!")
     print(f"Model URI: s3://{bucket}/{weights_key}")
 
 if __name__ == "__main__":
-    import tempfile
     from datetime import datetime
     
     if len(sys.argv) < 3:
@@ -8,10 +8,40 @@ import os
 import sys
 import json
 import argparse
+import asyncio
 from pathlib import Path
-from storage.io import put_file, ensure_bucket
+import httpx
+from tqdm import tqdm
+from storage.io import put_file, presign_put, ensure_bucket
 from storage.paths import training_image_key, training_annotation_key
 
+# Uploads in flight at once; they share one event loop and connection pool
+MAX_IN_FLIGHT = 64
+
+async def _put_presigned(http, sem, url: str, path: Path, content_type: str):
+    async with sem:
+        data = await asyncio.to_thread(path.read_bytes)
+        r = await http.put(url, content=data, headers={"Content-Type": content_type})
+        r.raise_for_status()
+
+async def _put_all(uploads):
+    """PUT each (presigned_url, path, content_type) concurrently, with a progress bar."""
+    sem = asyncio.Semaphore(MAX_IN_FLIGHT)
+    limits = httpx.Limits(max_connections=MAX_IN_FLIGHT, max_keepalive_connections=MAX_IN_FLIGHT)
+    async with httpx.AsyncClient(limits=limits, timeout=300) as http:
+        tasks = [asyncio.ensure_future(_put_presigned(http, sem, *u)) for u in uploads]
+        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), unit="file"):
+            await task
+
+IMAGE_CONTENT_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
+IMAGE_EXTS = IMAGE_CONTENT_TYPES.keys()
+
+def list_images(image_dir) -> list:
+    """Image files directly in `image_dir`, from one directory scan."""
+    with os.scandir(image_dir) as it:
+        return sorted(Path(e.path) for e in it
+                      if os.path.splitext(e.name)[1].lower() in IMAGE_EXTS and e.is_file())
+
 def upload_training_images(image_dir: str, label: str, annotation_dir: str = None, split: str = "raw"):
     """Upload training images and annotations to S3."""
     bucket = os.environ["ARTIFACT_BUCKET"]
@@ -23,30 +53,32 @@ def upload_training_images(image_dir: str, label: str, annotation_dir: str = Non
         return False
     
     # Upload images
-    image_files = list(image_path.glob("*.jpg")) + list(image_path.glob("*.png")) + list(image_path.glob("*.jpeg"))
+    image_files = list_images(image_path)
     
     print(f"Uploading {len(image_files)} {label} images...")
     
+    # Presign every PUT up front (signing is local once the bucket's region is
+    # known), then send the bytes straight to object storage
+    uploads = []
     for img_file in image_files:
         image_id = img_file.stem
         key = training_image_key(f"{image_id}{img_file.suffix}", split, label)
         
-        # Determine content type
-        content_type = "image/jpeg" if img_file.suffix.lower() in ['.jpg', '.jpeg'] else "image/png"
-        
-        print(f"Uploading: {img_file.name} -> {key}")
-        put_file(bucket, key, str(img_file), content_type)
+        # Determine content type (list_images only returns known suffixes)
+        content_type = IMAGE_CONTENT_TYPES[img_file.suffix.lower()]
+        uploads.append((presign_put(bucket, key), img_file, content_type))
         
         # Upload annotation if provided
         if annotation_dir:
             annotation_path = Path(annotation_dir) / f"{image_id}.json"
             if annotation_path.exists():
                 annotation_key = training_annotation_key(image_id, split, label)
-                print(f"Uploading annotation: {annotation_path.name} -> {annotation_key}")
-                put_file(bucket, annotation_key, str(annotation_path), "application/json")
+                uploads.append((presign_put(bucket, annotation_key), annotation_path, "application/json"))
             else:
                 print(f"Warning: No annotation found for {image_id}")
     
+    asyncio.run(_put_all(uploads))
+    
     print(f"Successfully uploaded {len(image_files)} {label} images!")
     return True
 
@@ -55,7 +87,7 @@ def create_dataset_manifest(image_dir: str, label: str, split: str = "raw"):
     bucket = os.environ["ARTIFACT_BUCKET"]
     
     image_path = Path(image_dir)
-    image_files = list(image_path.glob("*.jpg")) + list(image_path.glob("*.png")) + list(image_path.glob("*.jpeg"))
+    image_files = list_images(image_path)
     
     manifest = {
         "dataset": f"{label}_{split}",
@@ -1,17 +1,59 @@
 import os
 import io
 import uuid
+import hashlib
+import hmac
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
+from functools import lru_cache
+import certifi
+import urllib3
 import pandas as pd
 from minio import Minio
 from typing import BinaryIO
 from .paths import *
 
+# Keep-alive connections per host; sized for threaded uploads (Minio's default is 10)
+S3_POOL_SIZE = int(os.getenv("S3_POOL_SIZE", "64"))
+# Multipart part size for put_file (S3's minimum is 5 MiB)
+S3_PART_SIZE = 8 * 1024 * 1024
+# Region URLs are signed for; MinIO's default. Setting it also spares the client
+# a bucket-location lookup
+S3_REGION = os.getenv("S3_REGION", "us-east-1")
+
+@lru_cache(maxsize=1)
 def client():
+    # One client per process: Minio is thread-safe and keeps a urllib3 pool,
+    # so repeated calls reuse keep-alive connections instead of reconnecting
+    timeout = 300
     return Minio(
         endpoint=os.environ["S3_ENDPOINT"].split("://")[-1],
         access_key=os.environ["S3_ACCESS_KEY"],
         secret_key=os.environ["S3_SECRET_KEY"],
-        secure=os.getenv("S3_SECURE", "false").lower() == "true"
+        secure=os.getenv("S3_SECURE", "false").lower() == "true",
+        region=S3_REGION,
+        # Minio's own defaults, with a pool large enough that concurrent
+        # uploads don't queue for a connection
+        http_client=urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            maxsize=S3_POOL_SIZE,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+        ),
+    )
+
+@lru_cache(maxsize=1)
+def s3_filesystem():
+    # pyarrow's own S3 client, for reading parquet straight from the bucket
+    # (ranged reads, so only the footer and wanted columns are fetched)
+    import pyarrow.fs as pafs
+    secure = os.getenv("S3_SECURE", "false").lower() == "true"
+    return pafs.S3FileSystem(
+        endpoint_override=os.environ["S3_ENDPOINT"].split("://")[-1],
+        access_key=os.environ["S3_ACCESS_KEY"],
+        secret_key=os.environ["S3_SECRET_KEY"],
+        scheme="https" if secure else "http",
     )
 
 def ensure_bucket(bucket: str):
@@ -19,16 +61,97 @@ def ensure_bucket(bucket: str):
     if not c.bucket_exists(bucket): 
         c.make_bucket(bucket)
 
+@lru_cache(maxsize=None)
+def ensure_bucket_once(bucket: str):
+    # Buckets aren't deleted under a running process, so one check each is enough
+    ensure_bucket(bucket)
+
 def put_bytes(bucket: str, key: str, data: bytes, content_type="application/octet-stream"):
     c = client()
-    ensure_bucket(bucket)
+    ensure_bucket_once(bucket)
     c.put_object(bucket, key, io.BytesIO(data), length=len(data), content_type=content_type)
 
-def put_file(bucket: str, key: str, filepath: str, content_type=None):
+def put_pyarrow_buffer(bucket: str, key: str, buf, content_type="application/octet-stream"):
+    # Stream a pyarrow Buffer (e.g. BufferOutputStream.getvalue()) without
+    # copying it into a bytes object first
+    import pyarrow as pa
     c = client()
-    ensure_bucket(bucket)
-    c.fput_object(bucket, key, filepath, content_type=content_type)
+    ensure_bucket_once(bucket)
+    c.put_object(bucket, key, pa.BufferReader(buf), length=buf.size, content_type=content_type)
+
+def put_file(bucket: str, key: str, filepath: str, content_type=None, num_parallel_uploads: int = 8):
+    # Files over one part go up as a multipart upload with parts sent in
+    # parallel; smaller ones are still a single PUT
+    c = client()
+    ensure_bucket_once(bucket)
+    c.fput_object(bucket, key, filepath, content_type=content_type or "application/octet-stream",
+                  part_size=S3_PART_SIZE, num_parallel_uploads=num_parallel_uploads)
+
+@lru_cache(maxsize=1)
+def _boto3_client():
+    # boto3 against the same endpoint, only for its managed multipart transfer
+    import boto3
+    from botocore.config import Config
+    endpoint = os.environ["S3_ENDPOINT"]
+    if "://" not in endpoint:
+        secure = os.getenv("S3_SECURE", "false").lower() == "true"
+        endpoint = f"{'https' if secure else 'http'}://{endpoint}"
+    return boto3.client(
+        "s3",
+        endpoint_url=endpoint,
+        aws_access_key_id=os.environ["S3_ACCESS_KEY"],
+        aws_secret_access_key=os.environ["S3_SECRET_KEY"],
+        config=Config(max_pool_connections=S3_POOL_SIZE, s3={"addressing_style": "path"}),
+    )
+
+def put_large_file(bucket: str, key: str, filepath: str, content_type="application/octet-stream"):
+    # Multi-GB files (model weights): boto3's transfer manager reads parts
+    # straight from the file on 16 threads, overlapping disk reads with sends
+    from boto3.s3.transfer import TransferConfig
+    ensure_bucket_once(bucket)
+    config = TransferConfig(multipart_threshold=S3_PART_SIZE, multipart_chunksize=S3_PART_SIZE,
+                            max_concurrency=16, use_threads=True)
+    _boto3_client().upload_file(filepath, bucket, key, ExtraArgs={"ContentType": content_type}, Config=config)
 
 def get_url(bucket: str, key: str, expires=3600):
     c = client()
-    return c.presigned_get_object(bucket, key, expires)
+    return c.presigned_get_object(bucket, key, timedelta(seconds=expires))
+
+def get_urls(bucket: str, keys, expires=3600) -> list:
+    """
+    Presigned GET URLs for many keys at once, identical to get_url's.
+
+    The SigV4 signing key depends only on the secret, day and region, so it is
+    derived once for the batch; each URL then costs a single HMAC, where
+    presigned_get_object re-derives the key (four more) for every object.
+    """
+    secure = os.getenv("S3_SECURE", "false").lower() == "true"
+    host = os.environ["S3_ENDPOINT"].split("://")[-1]
+    # Default ports are left out of the signed host header, as Minio does
+    for default_port in (":443",) if secure else (":80",):
+        if host.endswith(default_port):
+            host = host[:-len(default_port)]
+    amz_date = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    scope = f"{amz_date[:8]}/{S3_REGION}/s3/aws4_request"
+    signing_key = f"AWS4{os.environ['S3_SECRET_KEY']}".encode()
+    for part in (amz_date[:8], S3_REGION, "s3", "aws4_request"):
+        signing_key = hmac.new(signing_key, part.encode(), hashlib.sha256).digest()
+    query = (
+        "X-Amz-Algorithm=AWS4-HMAC-SHA256"
+        f"&X-Amz-Credential={quote(os.environ['S3_ACCESS_KEY'] + '/' + scope, safe='')}"
+        f"&X-Amz-Date={amz_date}&X-Amz-Expires={int(expires)}&X-Amz-SignedHeaders=host"
+    )
+    base = f"{'https' if secure else 'http'}://{host}"
+    urls = []
+    for key in keys:
+        path = f"/{bucket}/{quote(key, safe='/~')}"
+        canonical = f"GET\n{path}\n{query}\nhost:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+        to_sign = f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n{hashlib.sha256(canonical.encode()).hexdigest()}"
+        signature = hmac.new(signing_key, to_sign.encode(), hashlib.sha256).hexdigest()
+        urls.append(f"{base}{path}?{query}&X-Amz-Signature={signature}")
+    return urls
+
+def presign_put(bucket: str, key: str, expires=3600):
+    # Lets a client upload the object itself, without the bytes passing through us
+    c = client()
+    return c.presigned_put_object(bucket, key, timedelta(seconds=expires))
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 
 def run_prefix(run_id: str) -> str: 
     return f"runs/{run_id}"
@@ -30,9 +31,12 @@ def model_metadata_key(version: str = "production") -> str:
 def training_prefix() -> str:
     return "training"
 
+# Per-split prefixes: a handful of distinct values, rebuilt for every key otherwise
+@lru_cache(maxsize=None)
 def training_images_prefix(split: str = "raw") -> str:
     return f"{training_prefix()}/{split}/images"
 
+@lru_cache(maxsize=None)
 def training_annotations_prefix(split: str = "raw") -> str:
     return f"{training_prefix()}/{split}/annotations"
 
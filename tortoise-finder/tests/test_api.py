@@ -6,9 +6,13 @@ import pytest
 from fastapi.testclient import TestClient
 from api.main import app
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    # Enter the context so the lifespan sets up the Redis pools
+    with TestClient(app) as c:
+        yield c
 
-def test_run_endpoint():
+def test_run_endpoint(client):
     """Test the /run endpoint."""
     response = client.post("/run", json={
         "dataset_uri": "s3://test/dataset",
@@ -19,7 +23,7 @@ def test_run_endpoint():
     assert "job_id" in data
     assert "run_id" in data
 
-def test_status_endpoint():
+def test_status_endpoint(client):
     """Test the /status endpoint."""
     # This would need a real job_id to work properly
     # For now, just test that the endpoint exists
@@ -27,8 +31,57 @@ def test_status_endpoint():
     # Should return 404 or error for non-existent job
     assert response.status_code in [404, 500]
 
-def test_export_endpoint():
+def test_export_endpoint(client):
     """Test the /export endpoint."""
     response = client.get("/export", params={"run_id": "test-run", "fmt": "geojson"})
-    # Should return error for non-existent run
-    assert response.status_code in [404, 500]
+    # The export is queued as a job; failures surface through /status
+    assert response.status_code == 200
+    assert "job_id" in response.json()
+
+def test_positives_page(monkeypatch):
+    """Test /positives filtering, ordering and paging on a fake results table."""
+    import pandas as pd
+    import api.main as api_main
+    df = pd.DataFrame({
+        "tile_id": [f"tile-{i:05d}" for i in range(10)],
+        "image_url": [f"img-{i}" for i in range(10)],
+        "thumb_url": [f"thumb-{i}" for i in range(10)],
+        "lat": [-0.5] * 10,
+        "lon": [-90.5] * 10,
+        "score": [i / 10 for i in range(10)],
+    })
+    monkeypatch.setattr(api_main, "get_cached_results", lambda run_id, columns=None: df)
+    page = api_main._positives_page("run", threshold=0.5, page=2, page_size=2)
+    assert page["total"] == 5
+    assert [it["tile_id"] for it in page["items"]] == ["tile-00007", "tile-00006"]
+
+def test_confirm_rejects_bad_selection(client):
+    """Test /confirm validates selections before anything is stored."""
+    response = client.post("/confirm", json={"run_id": "test-run", "selections": [{"tile_id": "tile-00000"}]})
+    assert response.status_code == 422
+
+@pytest.mark.parametrize("selection", [
+    {"tile_id": "tile-00000", "confirmed": "yes"},
+    {"tile_id": "tile-00000", "confirmed": True, "extra": {"note": "x"}},
+])
+def test_confirm_rejects_coerced_or_extra_keys(client, selection):
+    """Test /confirm only accepts selections it can store verbatim."""
+    response = client.post("/confirm", json={"run_id": "test-run", "selections": [selection]})
+    assert response.status_code == 422
+    response = client.post("/confirm", json={"run_id": "test-run", "selections": [], "extra": 1})
+    assert response.status_code == 422
+
+def test_positives_etag(client, monkeypatch):
+    """Test /positives answers a matching If-None-Match with 304."""
+    import pandas as pd
+    import api.main as api_main
+    df = pd.DataFrame({
+        "tile_id": ["tile-00000"], "image_url": ["img-0"], "thumb_url": ["thumb-0"],
+        "lat": [-0.5], "lon": [-90.5], "score": [0.9],
+    })
+    monkeypatch.setattr(api_main, "get_cached_results", lambda run_id, columns=None: df)
+    first = client.get("/positives", params={"run_id": "run"})
+    assert first.status_code == 200
+    assert first.json()["total"] == 1
+    again = client.get("/positives", params={"run_id": "run"}, headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
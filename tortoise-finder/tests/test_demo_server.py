@@ -0,0 +1,28 @@
+"""
+Tests for the demo server's mock data fallback.
+"""
+
+import demo_server
+
+def test_mock_data_is_built_once():
+    """Test the mock results and their columnar view are cached per process."""
+    assert demo_server.generate_results() is demo_server.generate_results()
+    assert demo_server.mock_columns() is demo_server.mock_columns()
+    columns = demo_server.mock_columns()
+    assert list(columns["tile_id"]) == [r["tile_id"] for r in demo_server.generate_results()]
+
+def test_positives_page_items_are_fresh(monkeypatch, tmp_path):
+    """Test /positives pages built from the mock data don't hand out the cached records."""
+    # An empty positive folder makes the page fall back to the mock data
+    monkeypatch.setattr(demo_server, "POSITIVE_PATH", str(tmp_path))
+    demo_server._positives_page.cache_clear()
+    try:
+        page = demo_server.positives_page(threshold=0.0, page=1, page_size=10)
+    finally:
+        demo_server._positives_page.cache_clear()
+    records = demo_server.generate_results()
+    assert len(page["items"]) == 10
+    assert not any(item is r for item in page["items"] for r in records)
+    # Page building annotates its items; the shared records stay untouched
+    assert all("lqip" in item for item in page["items"])
+    assert not any("lqip" in r or "image_url" in r for r in records)
@@ -28,3 +28,83 @@ def test_read_results_table():
     except Exception:
         # Expected behavior for non-existent run
         pass
+
+def test_get_cached_results(monkeypatch):
+    """Test the results cache round-trips through the Redis Arrow buffer."""
+    import pipeline.utils as utils
+
+    class FakeRedis:
+        def __init__(self):
+            self.store = {}
+        def get(self, key):
+            return self.store.get(key)
+        def setex(self, key, ttl, value):
+            self.store[key] = value
+
+    fake = FakeRedis()
+    df = pd.DataFrame({"tile_id": ["tile-00000", "tile-00001"], "score": [0.9, 0.1]})
+    calls = []
+    monkeypatch.setattr(utils, "_redis", lambda: fake)
+    monkeypatch.setattr(utils, "read_results_table", lambda run_id, columns=None: calls.append(run_id) or df)
+    utils.get_cached_results.cache_clear()
+
+    assert utils.get_cached_results("run-a").equals(df)
+    utils.get_cached_results.cache_clear()  # simulate another worker process
+    assert utils.get_cached_results("run-a").equals(df)
+    assert calls == ["run-a"]
+    assert utils._results_cache_key("run-a") in fake.store
+
+def test_iter_geojson(monkeypatch, tmp_path):
+    """Test the streamed GeoJSON is one valid FeatureCollection across batches."""
+    import json
+    import pyarrow.fs as pafs
+    import pipeline.export as export
+
+    src = tmp_path / export.BUCKET / "runs" / "run" / "results.parquet"
+    src.parent.mkdir(parents=True)
+    pd.DataFrame({
+        "tile_id": [f"tile-{i:05d}" for i in range(5)],
+        "lat": [-0.5] * 5,
+        "lon": [-90.5] * 5,
+        "score": [0.9] * 5,
+    }).to_parquet(src)
+
+    # A local directory stands in for the bucket
+    fs = pafs.SubTreeFileSystem(str(tmp_path), pafs.LocalFileSystem())
+    monkeypatch.setattr(export, "s3_filesystem", lambda: fs)
+    doc = json.loads(b"".join(export.iter_geojson("run", batch_size=2)))
+    assert [f["properties"]["tile_id"] for f in doc["features"]] == [f"tile-{i:05d}" for i in range(5)]
+    assert doc["features"][0]["geometry"]["coordinates"] == [-90.5, -0.5]
+
+def test_postprocess_results():
+    """Test thresholding and NMS on array-backed detections."""
+    import numpy as np
+    from pipeline.postproc import Detections, postprocess_results
+
+    dets = Detections(
+        boxes=np.array([[0, 0, 10, 10], [1, 1, 11, 11], [20, 20, 30, 30], [0, 0, 10, 10]], dtype=float),
+        scores=np.array([0.9, 0.85, 0.95, 0.1]),
+        tile_ids=np.array(["a", "b", "c", "d"], dtype=object),
+    )
+    out = postprocess_results(dets, threshold=0.5)
+    # "b" overlaps "a" with IoU ~0.68 and is suppressed; "d" is under the threshold
+    assert out.tile_ids.tolist() == ["c", "a"]
+    assert out.boxes.shape == (2, 4)
+
+def test_export_results_reuses_fresh_export(monkeypatch):
+    """Test an export newer than the results is returned without a rebuild."""
+    import datetime
+    import pipeline.export as export
+
+    written = {"runs/run/results.parquet": datetime.datetime(2024, 1, 1),
+               "runs/run/positives.csv": datetime.datetime(2024, 1, 2)}
+
+    class FakeClient:
+        def stat_object(self, bucket, key):
+            if key not in written:
+                raise export.S3Error("NoSuchKey", key, "", "", "", None)
+            return type("Stat", (), {"last_modified": written[key]})()
+
+    monkeypatch.setattr(export, "client", lambda: FakeClient())
+    monkeypatch.setattr(export, "_df", lambda run_id: pytest.fail("results should not be re-read"))
+    assert export.export_results("run", "csv") == "runs/run/positives.csv"
@@ -0,0 +1,18 @@
+"""
+Basic tests for the storage module.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from storage.io import client, get_urls
+
+def test_get_urls_match_presigned_get_object():
+    """Test batch-signed URLs are the same as Minio's own presigned GETs."""
+    keys = ["runs/run/thumbs/tile-00000.webp", "raw/positive/a b+ü~.jpg"]
+    urls = get_urls("artifacts", keys)
+    signed_at = re.search(r"X-Amz-Date=(\w+)", urls[0]).group(1)
+    date = datetime.strptime(signed_at, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    assert urls == [
+        client().presigned_get_object("artifacts", key, timedelta(hours=1), request_date=date)
+        for key in keys
+    ]
@@ -0,0 +1,62 @@
+"""
+Numba kernels for write_random_gps_exif.py's rejection sampling.
+
+Geometry is flattened CSR-style into contiguous arrays: all ring vertices in
+`xs`/`ys`, ring r spanning `ring_offsets[r]:ring_offsets[r + 1]` with bounding
+box `ring_bboxes[r]` (minx, miny, maxx, maxy), and polygon p
+owning rings `poly_offsets[p]:poly_offsets[p + 1]` (its outer ring first, then
+holes). Requires numba; the tool falls back to its NumPy path without it.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def _point_in_ring(px, py, xs, ys):
+    # Same ray casting as write_random_gps_exif.point_in_ring
+    inside = False
+    n = xs.shape[0]
+    j = n - 1
+    for i in range(n):
+        xi, yi, xj, yj = xs[i], ys[i], xs[j], ys[j]
+        if (yi > py) != (yj > py) and px < (xj - xi) * (py - yi) / (yj - yi + 1e-18) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+@njit(cache=True, fastmath=True)
+def _point_in_polygon(px, py, xs, ys, ring_offsets, ring_bboxes, first_ring, last_ring):
+    # Inside the outer ring and outside every hole; a ring whose bbox misses
+    # the point is decided by four comparisons, without walking its edges
+    for r in range(first_ring, last_ring):
+        lo, hi = ring_offsets[r], ring_offsets[r + 1]
+        in_bbox = (ring_bboxes[r, 0] <= px <= ring_bboxes[r, 2]) and (ring_bboxes[r, 1] <= py <= ring_bboxes[r, 3])
+        inside = in_bbox and _point_in_ring(px, py, xs[lo:hi], ys[lo:hi])
+        if inside != (r == first_ring):
+            return False
+    return last_ring > first_ring
+
+
+@njit(cache=True, fastmath=True)
+def _sample_batch(minx, miny, maxx, maxy, xs, ys, ring_offsets, ring_bboxes, poly_offsets, n_needed, seed,
+                  max_attempts=10000):
+    """(n_needed, 2) array of (lon, lat) points, each uniform inside the multipolygon."""
+    np.random.seed(seed)
+    out = np.empty((n_needed, 2))
+    for k in range(n_needed):
+        hit = False
+        for _ in range(max_attempts):
+            x = np.random.uniform(minx, maxx)
+            y = np.random.uniform(miny, maxy)
+            for p in range(poly_offsets.shape[0] - 1):
+                if _point_in_polygon(x, y, xs, ys, ring_offsets, ring_bboxes, poly_offsets[p], poly_offsets[p + 1]):
+                    hit = True
+                    break
+            if hit:
+                out[k, 0] = x
+                out[k, 1] = y
+                break
+        if not hit:
+            raise RuntimeError("Failed to sample point inside polygon after many attempts")
+    return out
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the demo server's DMS -> decimal degrees converter.
+
+Produces a `_dms_aot` extension module that demo_server.py imports when present,
+so there is no JIT warm-up at request time. Requires numba with `numba.pycc`.
+"""
+import argparse
+from pathlib import Path
+
+from numba.pycc import CC
+
+
+def build(output_dir: Path) -> None:
+    cc = CC("_dms_aot")
+    cc.output_dir = str(output_dir)
+
+    @cc.export("dms_to_decimal", "f8(f8, f8, f8, b1)")
+    def dms_to_decimal(d, m, s, neg):
+        x = d + m / 60.0 + s / 3600.0
+        return -x if neg else x
+
+    cc.compile()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Build the _dms_aot extension used by demo_server.py")
+    ap.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent,
+        help="Where to write the extension (default: next to demo_server.py)",
+    )
+    args = ap.parse_args()
+    build(args.output_dir)
+    print(f"Built _dms_aot in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
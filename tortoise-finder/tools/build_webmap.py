@@ -3,34 +3,87 @@ import argparse
 import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
 
-def run_exiftool_json(folder: Path) -> List[Dict]:
-    cmd = [
-        "exiftool",
-        "-n",
-        "-r",
-        "-json",
-        "-GPSLatitude",
-        "-GPSLongitude",
-        "-FileName",
-        "-FileModifyDate",
-        "-FileSize",
-        str(folder),
-    ]
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    if proc.returncode != 0:
+EXIF_TAGS = ["-GPSLatitude", "-GPSLongitude", "-FileName", "-FileModifyDate", "-FileSize"]
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".heic"}
+# Below this many files per process, another exiftool startup costs more than it saves
+MIN_FILES_PER_PROC = 64
+
+
+def find_images(folder: Path) -> List[str]:
+    files: List[str] = []
+    for root, _dirs, filenames in os.walk(folder):
+        for name in filenames:
+            if os.path.splitext(name)[1].lower() in IMAGE_EXTS:
+                files.append(os.path.join(root, name))
+    files.sort()
+    return files
+
+
+def _exiftool_batch(paths: List[str]) -> List[Dict]:
+    # File list on stdin (-@ -): no argv length limit and one startup per batch
+    cmd = ["exiftool", "-n", "-json", *EXIF_TAGS, "-@", "-"]
+    proc = subprocess.run(cmd, input="\n".join(paths), capture_output=True, text=True)
+    if proc.returncode != 0 and not proc.stdout:
         raise RuntimeError(f"exiftool failed: {proc.stderr}")
     try:
-        data = json.loads(proc.stdout or "[]")
+        return json.loads(proc.stdout or "[]")
     except json.JSONDecodeError as e:
         raise RuntimeError(f"Failed to parse exiftool JSON: {e}\n{proc.stdout[:500]}...")
-    return data
+
+
+def _stat_key(path: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def run_exiftool_json(folder: Path, cache_path: Optional[Path] = None) -> List[Dict]:
+    """EXIF for every image under `folder`.
+
+    Files unchanged since the last run (same mtime and size) come from the JSON
+    cache at `cache_path`; the rest are split across one exiftool process per CPU.
+    """
+    files = find_images(folder)
+    cache: Dict[str, Dict] = {}
+    if cache_path is not None and cache_path.exists():
+        try:
+            cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            cache = {}
+
+    stats = {path: _stat_key(path) for path in files}
+    stale = [path for path in files if cache.get(path, {}).get("stat") != stats[path]]
+    for path in stale:
+        cache.pop(path, None)
+    if stale:
+        nproc = max(1, min(os.cpu_count() or 1, len(stale) // MIN_FILES_PER_PROC))
+        batches = [stale[i::nproc] for i in range(nproc)]
+        # exiftool runs as its own process, so threads waiting on it run fully in parallel
+        with ThreadPoolExecutor(max_workers=nproc) as pool:
+            for items in pool.map(_exiftool_batch, batches):
+                for it in items:
+                    src = it.get("SourceFile")
+                    if src in stats:
+                        cache[src] = {"stat": stats[src], "exif": it}
+
+    if cache_path is not None and stale:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Only files that still exist are kept
+        cache_path.write_text(json.dumps({p: cache[p] for p in files if p in cache}), encoding="utf-8")
+    return [cache[path]["exif"] for path in files if path in cache]
 
 
 def to_features(items: List[Dict], image_root: Path, webmap_dir: Path) -> List[Dict]:
+    # relpath is most of the per-item cost, and images sit in a handful of
+    # folders: resolve each folder once and join the file name onto it
+    rel_dirs: Dict[str, Optional[str]] = {}
     features: List[Dict] = []
     for it in items:
         lat = it.get("GPSLatitude")
@@ -38,17 +91,23 @@ def to_features(items: List[Dict], image_root: Path, webmap_dir: Path) -> List[D
         src = it.get("SourceFile") or it.get("FileName")
         if lat is None or lon is None or not src:
             continue
-        src_path = Path(src)
-        # Compute relative path from webmap_dir to the image file
-        try:
-            rel = os.path.relpath(src_path, start=webmap_dir)
-        except ValueError:
-            # Different drive or other OS-specific issues; fall back to absolute
-            rel = str(src_path)
+        folder, name = os.path.split(src)
+        if folder not in rel_dirs:
+            # Compute relative path from webmap_dir to the image's folder
+            try:
+                rel_dirs[folder] = os.path.relpath(folder or os.curdir, start=webmap_dir)
+            except ValueError:
+                # Different drive or other OS-specific issues; fall back to absolute
+                rel_dirs[folder] = None
+        rel_dir = rel_dirs[folder]
+        if rel_dir is None:
+            rel = str(Path(src))
+        else:
+            rel = name if rel_dir == os.curdir else os.path.join(rel_dir, name)
         features.append({
             "type": "Feature",
             "properties": {
-                "name": os.path.basename(src_path),
+                "name": name,
                 "image": rel,
                 "lat": lat,
                 "lon": lon,
@@ -58,12 +117,26 @@ def to_features(items: List[Dict], image_root: Path, webmap_dir: Path) -> List[D
     return features
 
 
-def build_html(features: List[Dict], out_dir: Path, title: str) -> Path:
+# Up to this many features are inlined into index.html (which then also works
+# opened straight from disk); larger maps stream them from features.ndjson
+INLINE_MAX = 5000
+
+
+def build_html(features: List[Dict], out_dir: Path, title: str, inline_max: int = INLINE_MAX) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "index.html"
+    ndjson_path = out_dir / "features.ndjson"
 
     # Minimal Leaflet HTML with OSM + Esri World Imagery baselayers
-    features_json = json.dumps({"type": "FeatureCollection", "features": features})
+    if len(features) <= inline_max:
+        features_json = json.dumps({"type": "FeatureCollection", "features": features})
+        ndjson_path.unlink(missing_ok=True)
+    else:
+        # One feature per line: the page adds them to the map as they arrive
+        # instead of parsing one huge literal before anything is drawn
+        features_json = "null"
+        with ndjson_path.open("w", encoding="utf-8") as f:
+            f.writelines(json.dumps(feat) + "\n" for feat in features)
     template = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -88,7 +161,6 @@ const osm = L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
 const esri = L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}', { maxZoom: 19, attribution: 'Tiles &copy; Esri' });
 const baseLayers = { 'OSM': osm, 'Satellite': esri };
 // Markers
-const markers = [];
 const geo = L.geoJSON(fc, {
         pointToLayer: function(feature, latlng) {
             return L.marker(latlng);
@@ -109,25 +181,49 @@ const geo = L.geoJSON(fc, {
             `;
             layer.bindPopup(popupHtml);
             layer.bindTooltip(name, {direction: 'top'});
-            markers.push(layer);
         }
     });
 geo.addTo(map);
+osm.addTo(map);
+L.control.layers(baseLayers).addTo(map);
 // Fit map to markers or set default view
-if (markers.length > 0) {
-    const group = L.featureGroup(markers);
-    map.fitBounds(group.getBounds().pad(0.2));
+function fitToMarkers() {
+    if (geo.getLayers().length > 0) {
+        map.fitBounds(geo.getBounds().pad(0.2));
+    } else {
+        map.setView([0, -91.6], 10);
+    }
+}
+async function streamFeatures(url) {
+    // Parse features.ndjson line by line as it downloads, adding each chunk's
+    // features in one call (needs the page served over http, not file://)
+    const reader = (await fetch(url)).body.pipeThrough(new TextDecoderStream()).getReader();
+    let rest = '';
+    for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        const lines = (rest + value).split('\\n');
+        rest = lines.pop();
+        const batch = lines.filter(Boolean).map(line => JSON.parse(line));
+        if (batch.length) geo.addData(batch);
+    }
+    if (rest.trim()) geo.addData(JSON.parse(rest));
+}
+if (fc) {
+    fitToMarkers();
 } else {
     map.setView([0, -91.6], 10);
+    streamFeatures('features.ndjson').then(fitToMarkers, err => console.error('Failed to load features.ndjson', err));
 }
-osm.addTo(map);
-L.control.layers(baseLayers).addTo(map);
 </script>
 </body>
 </html>"""
     html = template.replace("%%TITLE%%", title).replace("%%FEATURES%%", features_json)
 
     out_path.write_text(html, encoding="utf-8")
+    if features_json == "null":
+        print(f"{len(features)} features written to {ndjson_path}; serve {out_dir} over http "
+              f"(e.g. python -m http.server) to view the map")
     return out_path
 
 
@@ -145,7 +241,7 @@ def main() -> int:
     repo_root = Path(__file__).resolve().parents[1]
     out_dir = Path(args.out).expanduser().resolve() if args.out else (repo_root / "webmap")
 
-    data = run_exiftool_json(image_root)
+    data = run_exiftool_json(image_root, cache_path=out_dir / ".exif_cache.json")
     features = to_features(data, image_root=image_root, webmap_dir=out_dir)
     if not features:
         print("No images with GPS EXIF found.")
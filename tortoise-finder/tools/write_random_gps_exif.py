@@ -3,15 +3,51 @@ import argparse
 import json
 import os
 import random
+import shutil
 import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Iterable, List, Tuple, Union
+from typing import Iterable, List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+# Optional compiled sampler (needs numba); the NumPy path below is used without it
+try:
+    from _geom_numba import _sample_batch
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional ear-clipping triangulator: with it, points are drawn straight from
+# the polygon's triangles and no sample is ever rejected
+try:
+    import mapbox_earcut
+    EARCUT_AVAILABLE = True
+except ImportError:
+    EARCUT_AVAILABLE = False
+
+# Optional GEOS bindings (shapely 2): tests a whole batch of candidates in one
+# vectorised call when neither of the above is installed
+try:
+    import shapely
+    SHAPELY_AVAILABLE = hasattr(shapely, "contains_xy")
+except ImportError:
+    SHAPELY_AVAILABLE = False
 
 
 GeoJSON = dict
 Coordinate = Tuple[float, float]
+BBox = Tuple[float, float, float, float]
+
+
+class Ring(NamedTuple):
+    """One ring's vertices as float64 arrays, ready for vectorized ray casting."""
+    x: np.ndarray       # vertex lon, shape (n,)
+    y: np.ndarray       # vertex lat, shape (n,)
+    x_prev: np.ndarray  # previous vertex of each edge (x rolled by one)
+    y_prev: np.ndarray
+    bbox: BBox          # (minx, miny, maxx, maxy); points outside it skip the edge test
 
 
 def read_text_file(path: Path) -> str:
@@ -88,86 +124,78 @@ def fetch_fernandina_geojson(cache_path: Path, verbose: bool = True) -> GeoJSON:
     return feature_collection
 
 
-def iter_all_rings(geometry: GeoJSON) -> Iterable[List[Coordinate]]:
-    """Yield all polygon rings (outer and holes) as lists of (lon, lat).
+def _ring_array(ring) -> Ring:
+    # Struct of arrays: one contiguous column each for lon and lat
+    x, y = np.asarray(ring, dtype=np.float64).reshape(-1, 2).T.copy()
+    return _make_ring(x, y)
 
-    Handles Polygon and MultiPolygon GeoJSON geometries.
-    """
-    gtype = geometry.get("type")
-    coords = geometry.get("coordinates")
-    if gtype == "Polygon":
-        for ring in coords:  # type: ignore[assignment]
-            yield [(float(x), float(y)) for x, y in ring]
-    elif gtype == "MultiPolygon":
-        for poly in coords:  # type: ignore[assignment]
-            for ring in poly:
-                yield [(float(x), float(y)) for x, y in ring]
+
+def _make_ring(x: np.ndarray, y: np.ndarray) -> Ring:
+    if len(x) == 0:
+        bbox = (np.inf, np.inf, -np.inf, -np.inf)
     else:
-        raise ValueError(f"Unsupported geometry type: {gtype}")
+        bbox = (float(x.min()), float(y.min()), float(x.max()), float(y.max()))
+    return Ring(x, y, np.roll(x, 1), np.roll(y, 1), bbox)
 
 
-def get_polygons(geometry: GeoJSON) -> List[List[List[Coordinate]]]:
-    """Return list of polygons, each as [outer_ring, hole1, hole2, ...]."""
+def get_polygons(geometry: GeoJSON) -> List[List[Ring]]:
+    """Return list of polygons, each as [outer_ring, hole1, hole2, ...] ring arrays."""
     gtype = geometry.get("type")
     coords = geometry.get("coordinates")
-    polygons: List[List[List[Coordinate]]] = []
+    polygons: List[List[Ring]] = []
     if gtype == "Polygon":
-        poly: List[List[Coordinate]] = []
-        for ring in coords:  # type: ignore[assignment]
-            poly.append([(float(x), float(y)) for x, y in ring])
-        polygons.append(poly)
+        polygons.append([_ring_array(ring) for ring in coords])  # type: ignore[union-attr]
     elif gtype == "MultiPolygon":
         for poly in coords:  # type: ignore[assignment]
-            rings: List[List[Coordinate]] = []
-            for ring in poly:
-                rings.append([(float(x), float(y)) for x, y in ring])
-            polygons.append(rings)
+            polygons.append([_ring_array(ring) for ring in poly])
     else:
         raise ValueError(f"Unsupported geometry type: {gtype}")
     return polygons
 
 
-def compute_bbox(geometry: GeoJSON) -> Tuple[float, float, float, float]:
-    minx = float("inf")
-    miny = float("inf")
-    maxx = float("-inf")
-    maxy = float("-inf")
-    for ring in iter_all_rings(geometry):
-        for x, y in ring:
-            if x < minx:
-                minx = x
-            if y < miny:
-                miny = y
-            if x > maxx:
-                maxx = x
-            if y > maxy:
-                maxy = y
-    return minx, miny, maxx, maxy
-
-
-def point_in_ring(point: Coordinate, ring: List[Coordinate]) -> bool:
-    """Ray casting algorithm for a single ring. Assumes ring may be closed or open."""
+def iter_all_rings(geometry: GeoJSON) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+    """Yield all polygon rings (outer and holes) as contiguous (lon, lat) arrays.
+
+    Handles Polygon and MultiPolygon GeoJSON geometries.
+    """
+    for poly in get_polygons(geometry):
+        for ring in poly:
+            yield ring.x, ring.y
+
+
+def polygons_bbox(polygons: List[List[Ring]]) -> BBox:
+    """Bounding box of already-built rings, from their cached per-ring boxes."""
+    boxes = np.array([ring.bbox for poly in polygons for ring in poly], dtype=np.float64).reshape(-1, 4)
+    if not len(boxes):
+        return (float("inf"), float("inf"), float("-inf"), float("-inf"))
+    minx, miny = boxes[:, :2].min(axis=0)
+    maxx, maxy = boxes[:, 2:].max(axis=0)
+    return float(minx), float(miny), float(maxx), float(maxy)
+
+
+def compute_bbox(geometry: GeoJSON) -> BBox:
+    return polygons_bbox(get_polygons(geometry))
+
+
+def point_in_ring(point: Coordinate, ring: Ring) -> bool:
+    """Ray casting algorithm for a single ring. Assumes ring may be closed or open.
+
+    All edges (xi, yi) -> (xj, yj) are tested at once; the point is inside
+    when the ray from it crosses an odd number of them.
+    """
     x, y = point
-    inside = False
-    n = len(ring)
-    if n == 0:
+    minx, miny, maxx, maxy = ring.bbox
+    # Four comparisons rule out most misses (and empty rings) before any edge math
+    if x < minx or x > maxx or y < miny or y > maxy:
         return False
-    # Ensure we iterate over edges (xi, yi) -> (xj, yj)
-    j = n - 1
-    for i in range(n):
-        xi, yi = ring[i]
-        xj, yj = ring[j]
-        # Check if point is between yi and yj with respect to y
-        intersects = ((yi > y) != (yj > y)) and (
-            x < (xj - xi) * (y - yi) / (yj - yi + 1e-18) + xi
-        )
-        if intersects:
-            inside = not inside
-        j = i
-    return inside
+    xi, yi, xj, yj = ring.x, ring.y, ring.x_prev, ring.y_prev
+    # Edges straddling the point's y, crossed to the right of the point
+    with np.errstate(invalid="ignore"):
+        crosses = ((yi > y) != (yj > y)) & (x < (xj - xi) * (y - yi) / (yj - yi + 1e-18) + xi)
+    return bool(np.count_nonzero(crosses) & 1)
 
 
-def point_in_polygon(point: Coordinate, polygon: List[List[Coordinate]]) -> bool:
+def point_in_polygon(point: Coordinate, polygon: List[Ring]) -> bool:
     """Return True if point is inside polygon (outer ring minus holes)."""
     if not polygon:
         return False
@@ -181,51 +209,212 @@ def point_in_polygon(point: Coordinate, polygon: List[List[Coordinate]]) -> bool
     return True
 
 
-def point_in_multipolygon(point: Coordinate, polygons: List[List[List[Coordinate]]]) -> bool:
+def point_in_multipolygon(point: Coordinate, polygons: List[List[Ring]]) -> bool:
     for poly in polygons:
         if point_in_polygon(point, poly):
             return True
     return False
 
 
-def random_point_in_geometry(geometry: GeoJSON, max_attempts: int = 10000) -> Coordinate:
-    polygons = get_polygons(geometry)
-    minx, miny, maxx, maxy = compute_bbox(geometry)
+def random_point_in_polygons(polygons: List[List[Ring]], bbox: BBox, max_attempts: int = 10000) -> Coordinate:
+    """Rejection-sample one point over `bbox` until it lands inside `polygons`."""
+    minx, miny, maxx, maxy = bbox
+    # random.uniform's own arithmetic, with the lookups and spans hoisted out
+    rand = random.random
+    xr, yr = maxx - minx, maxy - miny
     for _ in range(max_attempts):
-        x = random.uniform(minx, maxx)
-        y = random.uniform(miny, maxy)
+        x = minx + xr * rand()
+        y = miny + yr * rand()
         if point_in_multipolygon((x, y), polygons):
             return (x, y)
     raise RuntimeError("Failed to sample point inside polygon after many attempts")
 
 
+def random_point_in_geometry(geometry: GeoJSON, max_attempts: int = 10000) -> Coordinate:
+    polygons = get_polygons(geometry)
+    return random_point_in_polygons(polygons, polygons_bbox(polygons), max_attempts)
+
+
+def flatten_polygons(polygons: List[List[Ring]]) -> Tuple[np.ndarray, ...]:
+    """CSR layout for the compiled sampler: (xs, ys, ring_offsets, ring_bboxes, poly_offsets)."""
+    rings = [ring for poly in polygons for ring in poly]
+    xs = np.concatenate([ring.x for ring in rings]) if rings else np.empty(0)
+    ys = np.concatenate([ring.y for ring in rings]) if rings else np.empty(0)
+    ring_offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+    np.cumsum([len(ring.x) for ring in rings], out=ring_offsets[1:])
+    ring_bboxes = np.array([ring.bbox for ring in rings], dtype=np.float64).reshape(-1, 4)
+    poly_offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    np.cumsum([len(poly) for poly in polygons], out=poly_offsets[1:])
+    return xs, ys, ring_offsets, ring_bboxes, poly_offsets
+
+
+def unflatten_polygons(xs: np.ndarray, ys: np.ndarray, ring_offsets: np.ndarray,
+                       poly_offsets: np.ndarray) -> List[List[Ring]]:
+    """Inverse of flatten_polygons: rebuild the per-polygon Ring lists."""
+    rings = [_make_ring(xs[lo:hi].copy(), ys[lo:hi].copy()) for lo, hi in zip(ring_offsets[:-1], ring_offsets[1:])]
+    return [rings[lo:hi] for lo, hi in zip(poly_offsets[:-1], poly_offsets[1:])]
+
+
+PREPROC_VERSION = 1
+
+
+def preproc_path(cache_path: Path) -> Path:
+    return cache_path.with_suffix(".preproc.pkl")
+
+
+def load_preprocessed(cache_path: Path) -> Union[dict, None]:
+    """Preprocessed geometry saved by a previous run, if still current.
+
+    It is keyed on the GeoJSON cache's mtime, so a refetched polygon is
+    re-processed rather than served stale.
+    """
+    import pickle
+
+    try:
+        mtime_ns = cache_path.stat().st_mtime_ns
+        with preproc_path(cache_path).open("rb") as f:
+            pre = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if not isinstance(pre, dict) or pre.get("version") != PREPROC_VERSION or pre.get("mtime_ns") != mtime_ns:
+        return None
+    return pre
+
+
+def save_preprocessed(cache_path: Path, polygons: List[List[Ring]], bbox: BBox,
+                      triangles: Union[np.ndarray, None]) -> None:
+    import pickle
+
+    xs, ys, ring_offsets, ring_bboxes, poly_offsets = flatten_polygons(polygons)
+    pre = {
+        "version": PREPROC_VERSION,
+        "mtime_ns": cache_path.stat().st_mtime_ns,
+        "rings_xs": xs,
+        "rings_ys": ys,
+        "ring_offsets": ring_offsets,
+        "poly_offsets": poly_offsets,
+        "bbox": bbox,
+        "triangles": triangles,
+    }
+    # Write then rename, so a concurrent run never reads a half-written file
+    tmp = preproc_path(cache_path).with_suffix(".tmp")
+    with tmp.open("wb") as f:
+        pickle.dump(pre, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, preproc_path(cache_path))
+
+
+def sample_points(polygons: List[List[Ring]], bbox: BBox, n: int) -> np.ndarray:
+    """All n (lon, lat) points in one compiled call, seeded from `random`."""
+    xs, ys, ring_offsets, ring_bboxes, poly_offsets = flatten_polygons(polygons)
+    minx, miny, maxx, maxy = bbox
+    return _sample_batch(minx, miny, maxx, maxy, xs, ys, ring_offsets, ring_bboxes, poly_offsets, n,
+                         random.getrandbits(32))
+
+
+def to_shapely(polygons: List[List[Ring]]):
+    """The rings as one prepared shapely MultiPolygon."""
+    parts = []
+    for outer, *holes in (poly for poly in polygons if poly and len(poly[0].x)):
+        parts.append(shapely.Polygon(np.column_stack((outer.x, outer.y)),
+                                     [np.column_stack((h.x, h.y)) for h in holes if len(h.x)]))
+    geom = shapely.MultiPolygon(parts)
+    shapely.prepare(geom)
+    return geom
+
+
+def sample_points_shapely(polygons: List[List[Ring]], bbox: BBox, n: int, seed: int,
+                          batch: int = 4096, max_batches: int = 10000) -> np.ndarray:
+    """n (lon, lat) points by rejection sampling, a batch of candidates per GEOS call."""
+    geom = to_shapely(polygons)
+    rng = np.random.default_rng(seed)
+    minx, miny, maxx, maxy = bbox
+    kept: List[np.ndarray] = []
+    have = 0
+    for _ in range(max_batches):
+        if have >= n:
+            break
+        xs = rng.uniform(minx, maxx, batch)
+        ys = rng.uniform(miny, maxy, batch)
+        mask = shapely.contains_xy(geom, xs, ys)
+        kept.append(np.column_stack((xs[mask], ys[mask])))
+        have += int(mask.sum())
+    if have < n:
+        raise RuntimeError("Failed to sample point inside polygon after many attempts")
+    return np.concatenate(kept)[:n] if kept else np.empty((0, 2))
+
+
+def triangulate(polygons: List[List[Ring]]) -> np.ndarray:
+    """Triangles covering the polygons (holes excluded), shape (T, 3, 2) of (lon, lat)."""
+    triangles = []
+    for poly in polygons:
+        rings = [ring for ring in poly if len(ring.x)]
+        if not rings:
+            continue
+        verts = np.column_stack((np.concatenate([r.x for r in rings]), np.concatenate([r.y for r in rings])))
+        ring_ends = np.cumsum([len(r.x) for r in rings]).astype(np.uint32)
+        idx = mapbox_earcut.triangulate_float64(verts, ring_ends)
+        triangles.append(verts[idx.reshape(-1, 3)])
+    return np.concatenate(triangles) if triangles else np.empty((0, 3, 2))
+
+
+def sample_points_in_triangles(triangles: np.ndarray, n: int, seed: int) -> np.ndarray:
+    """n uniform (lon, lat) points over the triangles, all drawn at once.
+
+    A triangle is picked with probability proportional to its area, then a
+    point inside it from two uniforms folded back into the lower half of the
+    unit square (the barycentric trick).
+    """
+    if len(triangles) == 0:
+        raise RuntimeError("Polygon triangulated to nothing; cannot sample points")
+    rng = np.random.default_rng(seed)
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    ab, ac = b - a, c - a
+    cum_area = np.cumsum(0.5 * np.abs(ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]))
+    i = np.minimum(np.searchsorted(cum_area, rng.random(n) * cum_area[-1], side="right"), len(triangles) - 1)
+    u, v = rng.random(n), rng.random(n)
+    flip = u + v > 1
+    u[flip], v[flip] = 1 - u[flip], 1 - v[flip]
+    return a[i] + u[:, None] * ab[i] + v[:, None] * ac[i]
+
+
+IMAGE_EXTS = frozenset({"jpg", "jpeg", "png", "tif", "tiff", "heic"})
+
+
+def _walk_images(folder: str) -> Iterable[str]:
+    # scandir hands back each entry's type with the listing, so only matching
+    # file names are ever turned into paths
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_images(entry.path)
+            elif entry.is_file():
+                name = entry.name
+                dot = name.rfind(".")
+                if dot > 0 and name[dot + 1:].lower() in IMAGE_EXTS:
+                    yield entry.path
+
+
 def find_images(folder: Path) -> List[Path]:
-    exts = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".heic", ".JPG", ".JPEG", ".PNG", ".TIF", ".TIFF", ".HEIC"}
-    files: List[Path] = []
-    for root, _dirs, filenames in os.walk(folder):
-        for name in filenames:
-            if Path(name).suffix in exts:
-                files.append(Path(root) / name)
-    files.sort()
-    return files
+    return sorted(Path(p) for p in _walk_images(str(folder)))
 
 
-def write_gps_with_exiftool(image_path: Path, lat: float, lon: float, quiet: bool = True) -> None:
+def gps_args(lat: float, lon: float) -> List[str]:
     lat_ref = "N" if lat >= 0 else "S"
     lon_ref = "E" if lon >= 0 else "W"
     lat_abs = abs(lat)
     lon_abs = abs(lon)
-
-    cmd = [
-        "exiftool",
-        "-overwrite_original_in_place",
+    return [
         "-GPSLatitude={:.8f}".format(lat_abs),
         f"-GPSLatitudeRef={lat_ref}",
         "-GPSLongitude={:.8f}".format(lon_abs),
         f"-GPSLongitudeRef={lon_ref}",
         "-EXIF:GPSMapDatum=WGS-84",
-        str(image_path),
     ]
+
+
+def write_gps_with_exiftool(image_path: Path, lat: float, lon: float, quiet: bool = True,
+                            exiftool: str = "exiftool") -> None:
+    cmd = [exiftool, "-overwrite_original_in_place", *gps_args(lat, lon), str(image_path)]
     stdout_opt = subprocess.DEVNULL if quiet else None
     stderr_opt = subprocess.DEVNULL if quiet else None
     result = subprocess.run(cmd, stdout=stdout_opt, stderr=stderr_opt)
@@ -233,6 +422,82 @@ def write_gps_with_exiftool(image_path: Path, lat: float, lon: float, quiet: boo
         raise RuntimeError(f"exiftool failed for {image_path}")
 
 
+def write_gps_with_argfile(writes: List[Tuple[Path, float, float]], exiftool: str = "exiftool") -> None:
+    """Apply every (image_path, lat, lon) write in one exiftool run.
+
+    Each image gets its own argument block ended by `-execute` in a temporary
+    argfile, so exiftool starts once without a long-lived child to manage.
+    """
+    import tempfile
+
+    fd, argfile = tempfile.mkstemp(suffix=".args", text=True)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for image_path, lat, lon in writes:
+                f.write("\n".join(["-overwrite_original_in_place", *gps_args(lat, lon), str(image_path), "-execute"]))
+                f.write("\n")
+        result = subprocess.run([exiftool, "-@", argfile], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"exiftool failed: {result.stderr.strip()}")
+    finally:
+        os.unlink(argfile)
+
+
+class ExiftoolDaemon:
+    """One long-lived `exiftool -stay_open` process for many writes.
+
+    Each write is sent as an argument block on stdin and finished by
+    `-execute`; exiftool answers with its output followed by `{ready}`, so
+    the Perl startup is paid once rather than per image.
+    """
+
+    def __init__(self, exiftool: str = "exiftool") -> None:
+        self.exiftool = exiftool
+        self.proc: Union[subprocess.Popen, None] = None
+
+    def __enter__(self) -> "ExiftoolDaemon":
+        self.proc = subprocess.Popen(
+            [self.exiftool, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # errors arrive in the same reply as the result
+            text=True,
+            encoding="utf-8",
+        )
+        return self
+
+    def execute(self, *args: str) -> str:
+        assert self.proc is not None and self.proc.stdin is not None and self.proc.stdout is not None
+        self.proc.stdin.write("\n".join(args) + "\n-execute\n")
+        self.proc.stdin.flush()
+        lines: List[str] = []
+        for line in self.proc.stdout:
+            if line.rstrip("\r\n") == "{ready}":
+                return "".join(lines)
+            lines.append(line)
+        raise RuntimeError("exiftool exited unexpectedly")
+
+    def write_gps(self, image_path: Path, lat: float, lon: float) -> None:
+        out = self.execute("-overwrite_original_in_place", *gps_args(lat, lon), str(image_path))
+        if "Error:" in out or "1 image files" not in out:
+            raise RuntimeError(f"exiftool failed for {image_path}: {out.strip()}")
+
+    def __exit__(self, *exc) -> None:
+        if self.proc is None:
+            return
+        try:
+            assert self.proc.stdin is not None
+            self.proc.stdin.write("-stay_open\nFalse\n")
+            self.proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        try:
+            self.proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+        self.proc = None
+
+
 def main(argv: Union[List[str], None] = None) -> int:
     parser = argparse.ArgumentParser(description="Write random Fernandina Island GPS EXIF to images")
     parser.add_argument(
@@ -255,7 +520,17 @@ def main(argv: Union[List[str], None] = None) -> int:
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Only print planned updates without writing EXIF",
+        help="Only print planned updates without writing EXIF or the preprocessed polygon cache",
+    )
+    parser.add_argument(
+        "--argfile",
+        action="store_true",
+        help="Write all images in one exiftool run from a generated argfile instead of a stay_open process",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run one exiftool per image, one per CPU at a time, instead of a stay_open process",
     )
     args = parser.parse_args(argv)
 
@@ -269,19 +544,47 @@ def main(argv: Union[List[str], None] = None) -> int:
         print(f"Folder not found: {folder}", file=sys.stderr)
         return 1
 
+    # Resolve the binary once: every run below gets an absolute path, and a
+    # missing exiftool fails here rather than after the geometry is loaded
+    exiftool = None
+    if not args.dry_run:
+        exiftool = shutil.which("exiftool")
+        if exiftool is None:
+            print("exiftool not found on PATH", file=sys.stderr)
+            return 1
+
     repo_root = Path(__file__).resolve().parents[1]
     cache_path = repo_root / "tools" / "data" / "fernandina.geojson"
 
-    feature_collection = fetch_fernandina_geojson(cache_path, verbose=True)
-    # Expect one feature with Polygon or MultiPolygon
-    features = feature_collection.get("features", [])
-    if not features:
-        print("No features in Fernandina GeoJSON", file=sys.stderr)
-        return 1
-    geometry = features[0].get("geometry")
-    if not geometry:
-        print("Feature has no geometry", file=sys.stderr)
-        return 1
+    # Rings, bbox and triangles from an earlier run skip the JSON parse and
+    # all polygon preprocessing
+    pre = load_preprocessed(cache_path)
+    if pre is not None:
+        print(f"Using preprocessed polygon: {preproc_path(cache_path)}")
+        polygons = unflatten_polygons(pre["rings_xs"], pre["rings_ys"], pre["ring_offsets"], pre["poly_offsets"])
+        bbox = pre["bbox"]
+        triangles = pre["triangles"]
+        if EARCUT_AVAILABLE and triangles is None:
+            triangles = triangulate(polygons)
+            if not args.dry_run:
+                save_preprocessed(cache_path, polygons, bbox, triangles)
+    else:
+        feature_collection = fetch_fernandina_geojson(cache_path, verbose=True)
+        # Expect one feature with Polygon or MultiPolygon
+        features = feature_collection.get("features", [])
+        if not features:
+            print("No features in Fernandina GeoJSON", file=sys.stderr)
+            return 1
+        geometry = features[0].get("geometry")
+        if not geometry:
+            print("Feature has no geometry", file=sys.stderr)
+            return 1
+        polygons = get_polygons(geometry)
+        bbox = polygons_bbox(polygons)
+        triangles = triangulate(polygons) if EARCUT_AVAILABLE else None
+        # A dry run reads the cache but never writes it
+        if not args.dry_run:
+            save_preprocessed(cache_path, polygons, bbox, triangles)
 
     images = find_images(folder)
     if args.limit is not None:
@@ -291,13 +594,50 @@ def main(argv: Union[List[str], None] = None) -> int:
         return 0
 
     print(f"Found {len(images)} images. Sampling points inside Fernandina Island polygon...")
+    # All points up front when possible: directly from triangles with earcut,
+    # else in one compiled rejection-sampling call with numba, else in GEOS
+    # batches with shapely
+    if triangles is not None:
+        points = sample_points_in_triangles(triangles, len(images), random.getrandbits(32))
+    elif NUMBA_AVAILABLE:
+        points = sample_points(polygons, bbox, len(images))
+    elif SHAPELY_AVAILABLE:
+        points = sample_points_shapely(polygons, bbox, len(images), random.getrandbits(32))
+    else:
+        points = None
+
+    def planned() -> Iterable[Tuple[Path, float, float]]:
+        for k, img in enumerate(images):
+            if points is not None:
+                lon, lat = float(points[k, 0]), float(points[k, 1])
+            else:
+                lon, lat = random_point_in_polygons(polygons, bbox)
+            print(f"{img}: lat={lat:.6f}, lon={lon:.6f}")
+            yield img, lat, lon
+
     processed = 0
-    for img in images:
-        lon, lat = random_point_in_geometry(geometry)
-        print(f"{img}: lat={lat:.6f}, lon={lon:.6f}")
-        if not args.dry_run:
-            write_gps_with_exiftool(img, lat=lat, lon=lon, quiet=True)
-        processed += 1
+    if args.dry_run:
+        processed = sum(1 for _ in planned())
+    elif args.argfile:
+        writes = list(planned())
+        write_gps_with_argfile(writes, exiftool=exiftool)
+        processed = len(writes)
+    elif args.parallel:
+        # One exiftool per image, several at once; each is its own process, so
+        # threads that just wait on them run the writes fully in parallel
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            futures = [pool.submit(write_gps_with_exiftool, img, lat, lon, exiftool=exiftool) for img, lat, lon in planned()]
+            for fut in futures:
+                fut.result()
+                processed += 1
+    else:
+        # A single exiftool process serves every write
+        with ExiftoolDaemon(exiftool) as daemon:
+            for img, lat, lon in planned():
+                daemon.write_gps(img, lat=lat, lon=lon)
+                processed += 1
 
     print(f"Done. Updated {processed} images.")
     return 0
@@ -3,10 +3,11 @@ Training dataset management utilities.
 """
 
 import os
+import io
 import pandas as pd
-import tempfile
+import pyarrow.parquet as pq
 from typing import List, Dict, Any
-from storage.io import client, get_url
+from storage.io import client, get_urls, put_bytes, s3_filesystem
 from storage.paths import training_dataset_key, training_image_key
 
 class TrainingDataset:
@@ -30,21 +31,20 @@ class TrainingDataset:
         """
         df = pd.DataFrame(image_list)
         
-        # Add S3 URLs for images
-        df['image_url'] = df.apply(
-            lambda row: get_url(self.bucket, training_image_key(row['filename'], 'raw', row['label'])), 
-            axis=1
-        )
+        # Add S3 URLs for images: keys from plain column iteration (no per-row
+        # Series), then every URL signed in one batch
+        keys = [training_image_key(f, 'raw', l) for f, l in zip(df['filename'].tolist(), df['label'].tolist())]
+        df['image_url'] = get_urls(self.bucket, keys)
+        # Stored as a parquet dictionary column, so it reads back as a category
+        df['label'] = df['label'].astype('category')
         
         # Save to parquet
         dataset_key = training_dataset_key(self.version, split)
         
-        with tempfile.NamedTemporaryFile(suffix='.parquet', delete=False) as tmp:
-            df.to_parquet(tmp.name, index=False)
-            
-            from storage.io import put_file
-            put_file(self.bucket, dataset_key, tmp.name, "application/octet-stream")
-            os.unlink(tmp.name)
+        # Serialise in memory and upload that, rather than a temp file round trip
+        with io.BytesIO() as buf:
+            df.to_parquet(buf, index=False, compression='zstd')
+            put_bytes(self.bucket, dataset_key, buf.getvalue(), "application/octet-stream")
         
         print(f"Created dataset: {dataset_key}")
         return dataset_key
@@ -63,10 +63,32 @@ class TrainingDataset:
         
         try:
             obj = self.s3_client.get_object(self.bucket, dataset_key)
-            with tempfile.NamedTemporaryFile(suffix='.parquet') as tmp:
-                with open(tmp.name, 'wb') as f:
-                    f.write(obj.read())
-                return pd.read_parquet(tmp.name)
+            try:
+                data = obj.read()
+            finally:
+                obj.close()
+                obj.release_conn()
+            return pd.read_parquet(io.BytesIO(data))
+        except Exception as e:
+            print(f"Failed to load dataset {split}: {e}")
+            return pd.DataFrame()
+    
+    def load_dataset_columns(self, split: str, columns: List[str]) -> pd.DataFrame:
+        """
+        Load only some columns of a training dataset, read straight from S3.
+        
+        Args:
+            split: Dataset split (train, val, test)
+            columns: Columns to read; the others are never fetched
+            
+        Returns:
+            DataFrame containing those columns
+        """
+        dataset_key = training_dataset_key(self.version, split)
+        
+        try:
+            return pq.read_table(f"{self.bucket}/{dataset_key}", filesystem=s3_filesystem(),
+                                 columns=list(columns)).to_pandas()
         except Exception as e:
             print(f"Failed to load dataset {split}: {e}")
             return pd.DataFrame()
@@ -74,34 +96,44 @@ class TrainingDataset:
     def list_datasets(self) -> List[str]:
         """List all available dataset versions."""
         try:
-            datasets = []
+            datasets = set()
             prefix = f"training/datasets/"
             for obj in self.s3_client.list_objects(self.bucket, prefix=prefix, recursive=True):
                 if obj.object_name.endswith('.parquet'):
                     # Extract version from path
-                    parts = obj.object_name.split('/')
+                    parts = obj.object_name.split('/', 3)
                     if len(parts) >= 3:
-                        version = parts[2]
-                        if version not in datasets:
-                            datasets.append(version)
-            return datasets
+                        datasets.add(parts[2])
+            return sorted(datasets)
         except Exception as e:
             print(f"Failed to list datasets: {e}")
             return []
     
     def get_dataset_info(self, split: str) -> Dict[str, Any]:
         """Get information about a dataset split."""
-        df = self.load_dataset(split)
-        if df.empty:
+        dataset_key = training_dataset_key(self.version, split)
+        
+        # The footer has the row count and column names; of the data itself
+        # only the label column is fetched
+        try:
+            with s3_filesystem().open_input_file(f"{self.bucket}/{dataset_key}") as src:
+                pf = pq.ParquetFile(src)
+                columns = pf.schema_arrow.names
+                labels = pf.read(columns=['label']).to_pandas()['label'] if 'label' in columns else None
+        except Exception as e:
+            print(f"Failed to load dataset {split}: {e}")
+            return {"error": f"Dataset {split} not found"}
+        if pf.metadata.num_rows == 0:
             return {"error": f"Dataset {split} not found"}
         
+        counts = labels.value_counts() if labels is not None else {}
         return {
             "version": self.version,
             "split": split,
-            "total_images": len(df),
-            "positive_count": len(df[df['label'] == 'positive']) if 'label' in df.columns else 0,
-            "negative_count": len(df[df['label'] == 'negative']) if 'label' in df.columns else 0,
-            "columns": list(df.columns)
+            "total_images": pf.metadata.num_rows,
+            "positive_count": int(counts.get('positive', 0)),
+            "negative_count": int(counts.get('negative', 0)),
+            "columns": columns
         }
 
 def get_training_dataset(version: str = "v1.0") -> TrainingDataset:
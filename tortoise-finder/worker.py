@@ -1,9 +1,16 @@
 import os
 import time
 from redis import Redis
-from rq import Connection, Worker
+from rq import Worker
+from rq.worker_pool import WorkerPool
 
 if __name__ == "__main__":
     redis = Redis.from_url(os.environ["REDIS_URL"])
-    with Connection(redis):
-        Worker([os.environ.get("RQ_QUEUE", "tortoise")]).work()
+    queues = [os.environ.get("RQ_QUEUE", "tortoise")]
+    # One work horse at a time per worker, so run several when there are cores
+    # to spare; the pool forks them and restarts any that die
+    n = int(os.environ.get("RQ_WORKERS", os.cpu_count() or 2))
+    if n > 1:
+        WorkerPool(queues, connection=redis, num_workers=n).start(burst=False)
+    else:
+        Worker(queues, connection=redis).work(with_scheduler=True)